@@ -0,0 +1,115 @@
+"""Micro-benchmark: untyped vs. typed pagination of data source query results.
+
+Compares three ways of turning one API page into ``PageDto`` rows:
+
+* ``legacy``: the previous path, ``json`` -> ``PaginatedResponse`` -> rebuilt
+  page -> ``model_validate`` per row against the undiscriminated property union.
+* ``untyped``: the same two-step path with the discriminated property union.
+* ``typed``: ``PaginatedResponse[PageDto].model_validate_json`` in one pass.
+
+Run with ``python benchmarks/typed_pagination.py``.
+"""
+
+import functools
+import json
+import timeit
+from functools import reduce
+from operator import or_
+from typing import Any, get_args
+from uuid import uuid4
+
+from pydantic import create_model
+
+from notionary.http.schemas import PaginatedResponse
+from notionary.page.properties.schemas import AnyPageProperty
+from notionary.page.schemas import PageDto
+
+ROWS_PER_PAGE = 100
+REPEATS = 200
+
+_tagged_union = get_args(AnyPageProperty.__value__)[0]
+_LegacyPageDto = create_model(
+    "_LegacyPageDto",
+    __base__=PageDto,
+    properties=(
+        dict[str, reduce(or_, (get_args(m)[0] for m in get_args(_tagged_union)))],
+        ...,
+    ),
+)
+
+
+def _row(index: int) -> dict[str, Any]:
+    user = {"object": "user", "id": str(uuid4())}
+    title = f"Row {index}"
+    return {
+        "object": "page",
+        "id": str(uuid4()),
+        "url": "https://notion.so/row",
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "created_by": user,
+        "last_edited_time": "2025-06-01T00:00:00.000Z",
+        "last_edited_by": user,
+        "icon": None,
+        "cover": None,
+        "parent": {
+            "type": "data_source_id",
+            "data_source_id": str(uuid4()),
+            "database_id": str(uuid4()),
+        },
+        "in_trash": False,
+        "properties": {
+            "Name": {
+                "id": "title",
+                "type": "title",
+                "title": [
+                    {"type": "text", "text": {"content": title}, "plain_text": title}
+                ],
+            },
+            "Done": {"id": "done", "type": "checkbox", "checkbox": index % 2 == 0},
+            "Estimate": {"id": "est", "type": "number", "number": index},
+        },
+    }
+
+
+def _two_pass(body: bytes, model: type[PageDto]) -> list[PageDto]:
+    page = PaginatedResponse.model_validate(json.loads(body))
+    rebuilt = PaginatedResponse(
+        results=list(page.results),
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
+    )
+    return [model.model_validate(raw) for raw in rebuilt.results]
+
+
+def _legacy(body: bytes) -> list[PageDto]:
+    return _two_pass(body, _LegacyPageDto)
+
+
+def _untyped(body: bytes) -> list[PageDto]:
+    return _two_pass(body, PageDto)
+
+
+def _typed(body: bytes) -> list[PageDto]:
+    return PaginatedResponse[PageDto].model_validate_json(body).results
+
+
+def main() -> None:
+    body = json.dumps(
+        {
+            "results": [_row(i) for i in range(ROWS_PER_PAGE)],
+            "has_more": False,
+            "next_cursor": None,
+        }
+    ).encode()
+    assert _untyped(body) == _typed(body)
+
+    rows = ROWS_PER_PAGE * REPEATS
+    for name, fn in (("legacy", _legacy), ("untyped", _untyped), ("typed", _typed)):
+        seconds = min(
+            timeit.repeat(functools.partial(fn, body), number=REPEATS, repeat=5)
+        )
+        print(f"{name:>8}: {seconds / rows * 1e6:6.2f} µs/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,45 @@
+from .batch import Batch, BatchItemResult
 from .data_source import DataSource, DataSourceNamespace
 from .database import Database, DatabaseNamespace
 from .file_upload import FileUploads
+from .http import (
+    CachePolicy,
+    HttpHook,
+    MemoryCache,
+    RateLimitConfig,
+    ResponseCache,
+    SQLiteCache,
+    StatsCollector,
+    TransportConfig,
+)
+from .mirror import Mirror
 from .notionary import Notionary
 from .page import Page, PageNamespace
 from .user import Bot, Person, UsersNamespace
 from .workspace import WorkspaceNamespace
 
 __all__ = [
+    "Batch",
+    "BatchItemResult",
     "Bot",
+    "CachePolicy",
     "DataSource",
     "DataSourceNamespace",
     "Database",
     "DatabaseNamespace",
     "FileUploads",
+    "HttpHook",
+    "MemoryCache",
+    "Mirror",
     "Notionary",
     "Page",
     "PageNamespace",
     "Person",
+    "RateLimitConfig",
+    "ResponseCache",
+    "SQLiteCache",
+    "StatsCollector",
+    "TransportConfig",
     "UsersNamespace",
     "WorkspaceNamespace",
 ]
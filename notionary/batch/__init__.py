@@ -0,0 +1,7 @@
+from .batch import Batch
+from .schemas import BatchItemResult
+
+__all__ = [
+    "Batch",
+    "BatchItemResult",
+]
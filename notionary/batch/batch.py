@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from collections.abc import Callable, Coroutine
+from types import TracebackType
+from typing import Any, Self
+
+from notionary.batch.schemas import BatchItemResult
+
+logger = logging.getLogger(__name__)
+
+type ProgressCallback = Callable[[int, int], None]
+
+
+class Batch:
+    """Runs many independent Notion calls with bounded concurrency.
+
+    Queued operations run when the ``async with`` block exits (or on
+    :meth:`gather`), at most ``max_concurrency`` at a time. Every request
+    still passes through the client's shared rate limiter, so a large batch
+    is paced instead of tripping HTTP 429s.
+    A failing operation never aborts the others — its exception is recorded
+    in the matching :class:`~notionary.batch.schemas.BatchItemResult`.
+
+    Example::
+
+        async with notion.batch(max_concurrency=10) as batch:
+            for page in pages:
+                batch.add(page.set_property("Status", "Done"))
+
+        failed = [r for r in batch.results if not r.ok]
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        """
+        Args:
+            max_concurrency: Maximum number of operations awaited at once.
+            on_progress: Called with ``(completed, total)`` after each operation.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._on_progress = on_progress
+        self._operations: list[Coroutine[Any, Any, Any]] = []
+        self._total = 0
+        self._completed = 0
+        self.results: list[BatchItemResult] = []
+
+    def add(self, operation: Coroutine[Any, Any, Any]) -> None:
+        """Queue a coroutine, e.g. ``page.set_property("Status", "Done")``."""
+        self._operations.append(operation)
+        self._total += 1
+
+    async def gather(self) -> list[BatchItemResult]:
+        """Run all queued operations and return every result in queue order."""
+        operations, self._operations = self._operations, []
+        start = len(self.results)
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self._run(start + offset, operation))
+                for offset, operation in enumerate(operations)
+            ]
+        self.results.extend(task.result() for task in tasks)
+        return self.results
+
+    async def _run(
+        self, index: int, operation: Coroutine[Any, Any, Any]
+    ) -> BatchItemResult:
+        try:
+            async with self._semaphore:
+                try:
+                    result = BatchItemResult(index=index, value=await operation)
+                except Exception as e:
+                    logger.debug("Batch operation %d failed: %s", index, e)
+                    result = BatchItemResult(index=index, error=e)
+        finally:
+            # Cancelled before its turn, the operation never ran. Closing it
+            # avoids a "coroutine was never awaited" warning.
+            operation.close()
+
+        self._completed += 1
+        if self._on_progress is not None:
+            self._on_progress(self._completed, self._total)
+        return result
+
+    def _discard_pending(self) -> None:
+        for operation in self._operations:
+            operation.close()
+        self._operations.clear()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self._discard_pending()
+            return
+        await self.gather()
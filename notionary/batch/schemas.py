@@ -0,0 +1,17 @@
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of a single operation queued on a :class:`~notionary.batch.Batch`."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    value: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
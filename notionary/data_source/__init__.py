@@ -1,5 +1,6 @@
 from .data_source import DataSource
 from .exceptions import DataSourceNotFound
+from .export import ExportFormat
 from .namespace import DataSourceNamespace
 from .query import (
     CheckboxFilter,
@@ -27,14 +28,20 @@ from .query import (
     VerificationFilter,
     VerificationStatus,
 )
+from .row import Row
+from .schemas import ChangeSet, SyncCheckpoint
+from .snapshot import DataSourceSnapshot
 
 __all__ = [
+    "ChangeSet",
     "CheckboxFilter",
     "CompoundFilter",
     "DataSource",
     "DataSourceNamespace",
     "DataSourceNotFound",
+    "DataSourceSnapshot",
     "DateFilter",
+    "ExportFormat",
     "FilesFilter",
     "Filter",
     "FormulaFilter",
@@ -47,9 +54,11 @@ __all__ = [
     "QueryResultType",
     "RelationFilter",
     "RichTextFilter",
+    "Row",
     "SelectFilter",
     "SortDirection",
     "StatusFilter",
+    "SyncCheckpoint",
     "TimestampFilter",
     "TimestampSort",
     "TimestampType",
@@ -1,19 +1,43 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, Sequence
+from datetime import datetime
+from typing import Literal, overload
 from uuid import UUID
 
-from notionary.data_source.query.filters import QueryFilter
-from notionary.data_source.query.sorts import QuerySort
+from notionary.data_source.export import Columns, to_columns
+from notionary.data_source.query.filters import (
+    CompoundFilter,
+    DateCondition,
+    QueryFilter,
+    TimestampFilter,
+    TimestampType,
+)
+from notionary.data_source.query.partitions import (
+    timestamp_windows,
+    unique_id_windows,
+)
+from notionary.data_source.query.sorts import (
+    PropertySort,
+    QuerySort,
+    SortDirection,
+    TimestampSort,
+)
+from notionary.data_source.row import Row
 from notionary.data_source.schemas import (
+    ChangeSet,
     DataSourceDto,
     DataSourceTemplate,
     ListTemplatesResponse,
     QueryDataSourceRequest,
     QueryResultType,
+    SyncCheckpoint,
     UpdateDataSourceDto,
 )
 from notionary.http.client import HttpClient
 from notionary.page import Page
 from notionary.page import mapper as page_mapper
+from notionary.page.properties.schemas import PageUniqueIdProperty
 from notionary.page.schemas import PageDto
 from notionary.rich_text import markdown_to_rich_text
 
@@ -26,10 +50,11 @@ class DataSourceClient:
     async def patch_metadata(
         self, update_data_source_dto: UpdateDataSourceDto
     ) -> DataSourceDto:
-        response = await self._http.patch(
-            f"data_sources/{self._data_source_id}", data=update_data_source_dto
+        return await self._http.patch(
+            f"data_sources/{self._data_source_id}",
+            data=update_data_source_dto,
+            response_model=DataSourceDto,
         )
-        return DataSourceDto.model_validate(response)
 
     async def set_title(self, title: str) -> DataSourceDto:
         rich_text_title = markdown_to_rich_text(title)
@@ -64,8 +89,7 @@ class DataSourceClient:
         if template:
             data["template"] = template
 
-        response = await self._http.post("pages", data=data)
-        dto = PageDto.model_validate(response)
+        dto = await self._http.post("pages", data=data, response_model=PageDto)
         return page_mapper.to_page(dto, self._http)
 
     async def list_templates(
@@ -83,11 +107,11 @@ class DataSourceClient:
             if start_cursor is not None:
                 params["start_cursor"] = start_cursor
 
-            response = await self._http.get(
+            page = await self._http.get(
                 f"data_sources/{self._data_source_id}/templates",
                 params=params,
+                response_model=ListTemplatesResponse,
             )
-            page = ListTemplatesResponse.model_validate(response)
             templates.extend(page.templates)
 
             if not page.has_more or page.next_cursor is None:
@@ -96,6 +120,31 @@ class DataSourceClient:
 
         return templates
 
+    @overload
+    async def query(
+        self,
+        *,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        page_size: int | None = None,
+        filter_properties: list[str] | None = None,
+        in_trash: bool | None = None,
+        limit: int | None = None,
+        as_rows: Literal[False] = False,
+    ) -> list[Page]: ...
+    @overload
+    async def query(
+        self,
+        *,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        page_size: int | None = None,
+        filter_properties: list[str] | None = None,
+        in_trash: bool | None = None,
+        limit: int | None = None,
+        as_rows: Literal[True],
+    ) -> list[Row]: ...
+
     async def query(
         self,
         *,
@@ -105,7 +154,8 @@ class DataSourceClient:
         filter_properties: list[str] | None = None,
         in_trash: bool | None = None,
         limit: int | None = None,
-    ) -> list[Page]:
+        as_rows: bool = False,
+    ) -> list[Page] | list[Row]:
         request = QueryDataSourceRequest(
             filter=filter,
             sorts=sorts,
@@ -117,13 +167,16 @@ class DataSourceClient:
         payload = request.to_api_payload()
         endpoint = f"data_sources/{self._data_source_id}/query"
 
-        raw_results = await self._http.paginate(
-            endpoint, total_results_limit=limit, **payload
+        dtos = await self._http.paginate(
+            endpoint,
+            total_results_limit=limit,
+            item_model=PageDto,
+            query_params=request.to_query_params(),
+            **payload,
         )
-        return [
-            page_mapper.to_page(PageDto.model_validate(r), self._http)
-            for r in raw_results
-        ]
+        if as_rows:
+            return [Row(dto, self._http) for dto in dtos]
+        return [page_mapper.to_page(dto, self._http) for dto in dtos]
 
     async def iter_query(
         self,
@@ -134,7 +187,52 @@ class DataSourceClient:
         filter_properties: list[str] | None = None,
         in_trash: bool | None = None,
         limit: int | None = None,
+        prefetch: int = 0,
     ) -> AsyncGenerator[Page]:
+        async for dto in self._iter_dtos(
+            filter=filter,
+            sorts=sorts,
+            page_size=page_size,
+            filter_properties=filter_properties,
+            in_trash=in_trash,
+            limit=limit,
+            prefetch=prefetch,
+        ):
+            yield page_mapper.to_page(dto, self._http)
+
+    async def iter_rows(
+        self,
+        *,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        page_size: int | None = None,
+        filter_properties: list[str] | None = None,
+        in_trash: bool | None = None,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncGenerator[Row]:
+        async for dto in self._iter_dtos(
+            filter=filter,
+            sorts=sorts,
+            page_size=page_size,
+            filter_properties=filter_properties,
+            in_trash=in_trash,
+            limit=limit,
+            prefetch=prefetch,
+        ):
+            yield Row(dto, self._http)
+
+    async def _iter_dtos(
+        self,
+        *,
+        filter: QueryFilter | None,
+        sorts: list[QuerySort] | None,
+        page_size: int | None,
+        filter_properties: list[str] | None,
+        in_trash: bool | None,
+        limit: int | None,
+        prefetch: int,
+    ) -> AsyncGenerator[PageDto]:
         request = QueryDataSourceRequest(
             filter=filter,
             sorts=sorts,
@@ -146,7 +244,274 @@ class DataSourceClient:
         payload = request.to_api_payload()
         endpoint = f"data_sources/{self._data_source_id}/query"
 
-        async for raw in self._http.paginate_stream(
-            endpoint, total_results_limit=limit, **payload
+        async for dto in self._http.paginate_stream(
+            endpoint,
+            total_results_limit=limit,
+            item_model=PageDto,
+            prefetch=prefetch,
+            query_params=request.to_query_params(),
+            **payload,
         ):
-            yield page_mapper.to_page(PageDto.model_validate(raw), self._http)
+            yield dto
+
+    async def iter_column_batches(
+        self,
+        property_names: Sequence[str],
+        *,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        in_trash: bool | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[Columns]:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        request = QueryDataSourceRequest(
+            filter=filter, sorts=sorts, page_size=100, in_trash=in_trash
+        )
+        pending: list[PageDto] = []
+        async for dto in self._http.paginate_stream(
+            f"data_sources/{self._data_source_id}/query",
+            item_model=PageDto,
+            prefetch=1,
+            **request.to_api_payload(),
+        ):
+            pending.append(dto)
+            if len(pending) >= batch_size:
+                yield to_columns(pending, property_names)
+                pending = []
+        if pending:
+            yield to_columns(pending, property_names)
+
+    async def changes_since(
+        self,
+        checkpoint: SyncCheckpoint | str | None = None,
+        *,
+        filter: QueryFilter | None = None,
+        page_size: int | None = None,
+    ) -> ChangeSet:
+        dtos, new_checkpoint = await self.changed_dtos(
+            checkpoint, filter=filter, page_size=page_size
+        )
+        return ChangeSet(
+            pages=[page_mapper.to_page(dto, self._http) for dto in dtos],
+            checkpoint=new_checkpoint,
+        )
+
+    async def changed_dtos(
+        self,
+        checkpoint: SyncCheckpoint | str | None = None,
+        *,
+        filter: QueryFilter | None = None,
+        page_size: int | None = None,
+        in_trash: bool | None = None,
+    ) -> tuple[list[PageDto], SyncCheckpoint | None]:
+        if isinstance(checkpoint, str):
+            checkpoint = SyncCheckpoint.from_token(checkpoint)
+
+        watermark = None
+        if checkpoint is not None:
+            watermark = TimestampFilter(
+                timestamp=TimestampType.LAST_EDITED_TIME,
+                condition=DateCondition(
+                    on_or_after=checkpoint.last_edited_time.isoformat()
+                ),
+            )
+        newest_first = TimestampSort(
+            timestamp=TimestampType.LAST_EDITED_TIME,
+            direction=SortDirection.DESCENDING,
+        )
+        request = QueryDataSourceRequest(
+            filter=_all_of(filter, watermark),
+            sorts=[newest_first],
+            page_size=page_size,
+            in_trash=in_trash,
+        )
+
+        dtos: list[PageDto] = []
+        async for dto in self._http.paginate_stream(
+            f"data_sources/{self._data_source_id}/query",
+            item_model=PageDto,
+            **request.to_api_payload(),
+        ):
+            if checkpoint is not None:
+                edited = datetime.fromisoformat(dto.last_edited_time)
+                if edited < checkpoint.last_edited_time:
+                    break
+            dtos.append(dto)
+
+        return dtos, _advance_checkpoint(checkpoint, dtos)
+
+    async def parallel_scan(
+        self,
+        *,
+        partitions: int = 4,
+        partition_by: str = "created_time",
+        ordered: bool = False,
+        filter: QueryFilter | None = None,
+        page_size: int | None = None,
+        in_trash: bool | None = None,
+    ) -> AsyncGenerator[Page]:
+        if partitions < 1:
+            raise ValueError("partitions must be at least 1")
+
+        windows = await self._partition_windows(
+            partition_by, partitions, filter, in_trash
+        )
+        sorts = [self._partition_sort(partition_by)] if ordered else None
+        streams = [
+            self.iter_query(
+                filter=_all_of(filter, window),
+                sorts=sorts,
+                page_size=page_size,
+                in_trash=in_trash,
+            )
+            for window in windows
+        ]
+        async for page in _merge_streams(streams, ordered=ordered):
+            yield page
+
+    async def _partition_windows(
+        self,
+        partition_by: str,
+        partitions: int,
+        filter: QueryFilter | None,
+        in_trash: bool | None,
+    ) -> list[QueryFilter | None]:
+        if partitions == 1:
+            return [None]
+        first = await self._probe_edge(
+            partition_by, SortDirection.ASCENDING, filter, in_trash
+        )
+        if first is None:
+            return [None]
+        last = await self._probe_edge(
+            partition_by, SortDirection.DESCENDING, filter, in_trash
+        )
+        if last is None:
+            return [None]
+
+        if partition_by == TimestampType.CREATED_TIME:
+            return timestamp_windows(
+                TimestampType.CREATED_TIME,
+                datetime.fromisoformat(first.created_time),
+                datetime.fromisoformat(last.created_time),
+                partitions,
+            )
+        return unique_id_windows(
+            partition_by,
+            self._unique_id(first, partition_by),
+            self._unique_id(last, partition_by),
+            partitions,
+        )
+
+    async def _probe_edge(
+        self,
+        partition_by: str,
+        direction: SortDirection,
+        filter: QueryFilter | None,
+        in_trash: bool | None,
+    ) -> PageDto | None:
+        request = QueryDataSourceRequest(
+            filter=filter,
+            sorts=[self._partition_sort(partition_by, direction)],
+            page_size=1,
+            in_trash=in_trash,
+        )
+        dtos = await self._http.paginate(
+            f"data_sources/{self._data_source_id}/query",
+            total_results_limit=1,
+            item_model=PageDto,
+            **request.to_api_payload(),
+        )
+        return dtos[0] if dtos else None
+
+    @staticmethod
+    def _partition_sort(
+        partition_by: str, direction: SortDirection = SortDirection.ASCENDING
+    ) -> QuerySort:
+        if partition_by == TimestampType.CREATED_TIME:
+            return TimestampSort(timestamp=partition_by, direction=direction)
+        return PropertySort(property=partition_by, direction=direction)
+
+    @staticmethod
+    def _unique_id(dto: PageDto, property_name: str) -> int:
+        prop = dto.properties.get(property_name)
+        if not isinstance(prop, PageUniqueIdProperty):
+            raise ValueError(
+                f"Cannot partition by {property_name!r}: use 'created_time' "
+                "or the name of a unique ID property."
+            )
+        return prop.unique_id.number
+
+
+def _all_of(*filters: QueryFilter | None) -> QueryFilter | None:
+    present = [f for f in filters if f is not None]
+    if len(present) <= 1:
+        return present[0] if present else None
+    return CompoundFilter(and_=present)
+
+
+def _advance_checkpoint(
+    checkpoint: SyncCheckpoint | None, dtos: list[PageDto]
+) -> SyncCheckpoint | None:
+    if not dtos:
+        return checkpoint
+    newest = max(datetime.fromisoformat(dto.last_edited_time) for dto in dtos)
+    return SyncCheckpoint(last_edited_time=newest)
+
+
+_DONE = object()
+# Pages each partition may read ahead of the consumer, i.e. one full API page.
+_WINDOW_BUFFER = 100
+
+
+async def _merge_streams(
+    streams: list[AsyncGenerator[Page]], *, ordered: bool
+) -> AsyncGenerator[Page]:
+    """Drain *streams* concurrently and yield their items.
+
+    Unordered mode yields items as they arrive. Ordered mode yields the
+    streams one after another while the later ones keep buffering. Either way
+    a stream pauses once ``_WINDOW_BUFFER`` of its items are waiting, so a
+    slow consumer does not pull whole partitions into memory.
+    """
+    shared: asyncio.Queue = asyncio.Queue(maxsize=_WINDOW_BUFFER)
+    queues = [
+        asyncio.Queue(maxsize=_WINDOW_BUFFER) if ordered else shared for _ in streams
+    ]
+
+    async def drain(stream: AsyncGenerator[Page], queue: asyncio.Queue) -> None:
+        # Cancellation must not wait on a full queue, so _DONE is only queued
+        # when the stream ends by itself.
+        async with contextlib.aclosing(stream):
+            try:
+                async for item in stream:
+                    await queue.put(item)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(_DONE)
+
+    tasks = [
+        asyncio.create_task(drain(stream, queue))
+        for stream, queue in zip(streams, queues, strict=True)
+    ]
+    try:
+        pending = len(streams)
+        index = 0
+        while pending:
+            item = await queues[index].get()
+            if item is _DONE:
+                pending -= 1
+                index += 1 if ordered else 0
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
@@ -1,12 +1,14 @@
 import logging
 from collections.abc import AsyncGenerator
 from pathlib import Path
-from typing import overload
+from typing import TYPE_CHECKING, Literal, overload
+from urllib.parse import unquote
 from uuid import UUID
 
 from notionary.data_source.client import (
     DataSourceClient,
 )
+from notionary.data_source.export import ExportFormat, write_export
 from notionary.data_source.properties import (
     AnyDataSourceProperty,
     DataSourceProperties,
@@ -14,7 +16,13 @@ from notionary.data_source.properties import (
 )
 from notionary.data_source.query.filters import QueryFilter
 from notionary.data_source.query.sorts import QuerySort
-from notionary.data_source.schemas import DataSourceTemplate
+from notionary.data_source.row import Row
+from notionary.data_source.schemas import (
+    ChangeSet,
+    DataSourceTemplate,
+    SyncCheckpoint,
+)
+from notionary.data_source.snapshot import DataSourceSnapshot
 from notionary.file_upload import FileUploads
 from notionary.http import HttpClient
 from notionary.page import Page
@@ -22,8 +30,12 @@ from notionary.rich_text import rich_text_to_markdown
 from notionary.shared.object import NotionObject
 from notionary.shared.object.icon.schemas import Icon
 from notionary.shared.object.schemas import File
+from notionary.shared.properties.type import PropertyType
 from notionary.user.schemas import PartialUserDto
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -209,6 +221,20 @@ class DataSource:
         """
         return await self._client.list_templates(name=name, page_size=page_size)
 
+    @overload
+    async def query(
+        self,
+        *,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        page_size: int | None = None,
+        filter_properties: list[str] | None = None,
+        select: list[str] | None = None,
+        in_trash: bool | None = None,
+        limit: int | None = None,
+        as_rows: Literal[False] = False,
+    ) -> list[Page]: ...
+    @overload
     async def query(
         self,
         *,
@@ -216,29 +242,52 @@ class DataSource:
         sorts: list[QuerySort] | None = None,
         page_size: int | None = None,
         filter_properties: list[str] | None = None,
+        select: list[str] | None = None,
         in_trash: bool | None = None,
         limit: int | None = None,
-    ) -> list[Page]:
+        as_rows: Literal[True],
+    ) -> list[Row]: ...
+
+    async def query(
+        self,
+        *,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        page_size: int | None = None,
+        filter_properties: list[str] | None = None,
+        select: list[str] | None = None,
+        in_trash: bool | None = None,
+        limit: int | None = None,
+        as_rows: bool = False,
+    ) -> list[Page] | list[Row]:
         """Query pages in this data source with optional filters and sorts.
 
         Args:
             filter: A property, timestamp, or compound filter.
             sorts: Ordering criteria (property or timestamp sorts).
             page_size: Number of results per API request (max 100).
-            filter_properties: Property names/IDs to include in results.
+            filter_properties: Property IDs to include in results.
+            select: Property names to include in results. They are resolved to
+                IDs through the data source schema and sent as
+                ``filter_properties``. The title property is always included.
             in_trash: If ``True``, return only trashed pages.
             limit: Maximum total number of pages to return.
+            as_rows: Return lightweight :class:`~notionary.data_source.row.Row`
+                views instead of full pages. Use this for large scans that
+                only read property values.
 
         Returns:
-            A list of :class:`~notionary.page.page.Page` objects.
+            A list of :class:`~notionary.page.page.Page` objects, or of
+            :class:`~notionary.data_source.row.Row` objects with ``as_rows``.
         """
         return await self._client.query(
             filter=filter,
             sorts=sorts,
             page_size=page_size,
-            filter_properties=filter_properties,
+            filter_properties=self._projection(select, filter_properties),
             in_trash=in_trash,
             limit=limit,
+            as_rows=as_rows,
         )
 
     async def iter_query(
@@ -248,8 +297,10 @@ class DataSource:
         sorts: list[QuerySort] | None = None,
         page_size: int | None = None,
         filter_properties: list[str] | None = None,
+        select: list[str] | None = None,
         in_trash: bool | None = None,
         limit: int | None = None,
+        prefetch: int = 0,
     ) -> AsyncGenerator[Page]:
         """Stream pages from this data source with optional filters and sorts.
 
@@ -259,9 +310,14 @@ class DataSource:
             filter: A property, timestamp, or compound filter.
             sorts: Ordering criteria (property or timestamp sorts).
             page_size: Number of results per API request (max 100).
-            filter_properties: Property names/IDs to include in results.
+            filter_properties: Property IDs to include in results.
+            select: Property names to include in results. They are resolved to
+                IDs through the data source schema and sent as
+                ``filter_properties``. The title property is always included.
             in_trash: If ``True``, return only trashed pages.
             limit: Maximum total number of pages to return.
+            prefetch: Number of result pages to fetch in the background while
+                the caller processes the current one. ``0`` disables prefetching.
 
         Yields:
             :class:`~notionary.page.page.Page` objects one at a time.
@@ -270,12 +326,251 @@ class DataSource:
             filter=filter,
             sorts=sorts,
             page_size=page_size,
-            filter_properties=filter_properties,
+            filter_properties=self._projection(select, filter_properties),
+            in_trash=in_trash,
+            limit=limit,
+            prefetch=prefetch,
+        ):
+            yield page
+
+    async def iter_rows(
+        self,
+        *,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        page_size: int | None = None,
+        filter_properties: list[str] | None = None,
+        select: list[str] | None = None,
+        in_trash: bool | None = None,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncGenerator[Row]:
+        """Stream lightweight rows from this data source.
+
+        Works like :meth:`iter_query`, but yields
+        :class:`~notionary.data_source.row.Row` views that only decode the
+        properties you read. Call :meth:`Row.to_page` for a full page.
+
+        Args:
+            filter: A property, timestamp, or compound filter.
+            sorts: Ordering criteria (property or timestamp sorts).
+            page_size: Number of results per API request (max 100).
+            filter_properties: Property IDs to include in results.
+            select: Property names to include in results. They are resolved to
+                IDs through the data source schema and sent as
+                ``filter_properties``. The title property is always included.
+            in_trash: If ``True``, return only trashed rows.
+            limit: Maximum total number of rows to return.
+            prefetch: Number of result pages to fetch in the background while
+                the caller processes the current one. ``0`` disables prefetching.
+
+        Yields:
+            :class:`~notionary.data_source.row.Row` objects one at a time.
+        """
+        async for row in self._client.iter_rows(
+            filter=filter,
+            sorts=sorts,
+            page_size=page_size,
+            filter_properties=self._projection(select, filter_properties),
             in_trash=in_trash,
             limit=limit,
+            prefetch=prefetch,
+        ):
+            yield row
+
+    async def export(
+        self,
+        path: str | Path | None = None,
+        *,
+        format: ExportFormat | str = ExportFormat.ARROW,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        in_trash: bool | None = None,
+        batch_size: int = 1000,
+    ) -> "pa.Table | Path":
+        """Export the rows of this data source as a typed, columnar snapshot.
+
+        Query results are turned into column batches as they stream in,
+        without building a :class:`~notionary.page.page.Page` per row. Each
+        property becomes one column whose type follows the data source schema:
+        numbers are floats, checkboxes booleans, dates and timestamps UTC
+        timestamps, and multi-selects, people, relations and files lists of
+        strings. Array rollups become a JSON list of their values, and
+        everything else is exported as text. Every export starts with the
+        ``id``, ``url``, ``created_time``, ``last_edited_time`` and
+        ``in_trash`` columns; a property with one of those names is exported
+        as ``properties.<name>``.
+
+        Arrow and Parquet need ``pyarrow`` (``pip install notionary[arrow]``).
+
+        Args:
+            path: File to write. Without a path, an arrow export is returned
+                as an in-memory ``pyarrow.Table``.
+            format: ``"arrow"`` (Arrow IPC file), ``"parquet"`` or ``"csv"``.
+            filter: A property, timestamp, or compound filter.
+            sorts: Ordering criteria (property or timestamp sorts).
+            in_trash: If ``True``, export only trashed pages.
+            batch_size: Number of rows per record batch.
+
+        Returns:
+            The ``pyarrow.Table`` when no *path* is given, otherwise the path
+            that was written.
+
+        Raises:
+            ValueError: If *format* is unknown, or is ``"parquet"`` or
+                ``"csv"`` without a *path*.
+            ImportError: If an arrow or parquet export is requested without
+                ``pyarrow`` installed.
+        """
+        property_types = {name: prop.type for name, prop in self.properties.items()}
+        batches = self._client.iter_column_batches(
+            list(property_types),
+            filter=filter,
+            sorts=sorts,
+            in_trash=in_trash,
+            batch_size=batch_size,
+        )
+        return await write_export(
+            batches,
+            property_types,
+            ExportFormat(format),
+            Path(path).expanduser() if path is not None else None,
+        )
+
+    async def changes_since(
+        self,
+        checkpoint: SyncCheckpoint | str | None = None,
+        *,
+        filter: QueryFilter | None = None,
+        page_size: int | None = None,
+    ) -> ChangeSet:
+        """Fetch the pages edited since an earlier sync.
+
+        Results are requested newest first with a ``last_edited_time`` filter,
+        and pagination stops as soon as the watermark is passed, so a sync
+        costs requests in proportion to the number of changes, not the size
+        of the data source. Rows edited in the same minute as the previous
+        watermark are returned again, because ``last_edited_time`` has minute
+        precision; apply the changes as upserts.
+
+        Args:
+            checkpoint: The checkpoint (or its token) returned by the previous
+                sync. ``None`` returns every page and starts a new checkpoint.
+            filter: Additional filter applied to the changed pages.
+            page_size: Number of results per API request (max 100).
+
+        Returns:
+            A :class:`~notionary.data_source.schemas.ChangeSet` with the changed
+            pages, newest first, and the checkpoint to pass to the next call.
+            Store ``change_set.token`` to persist it between runs.
+        """
+        return await self._client.changes_since(
+            checkpoint, filter=filter, page_size=page_size
+        )
+
+    async def snapshot(self, indexes: list[str] | None = None) -> DataSourceSnapshot:
+        """Load all rows into memory so they can be queried without requests.
+
+        The snapshot evaluates the same filters and sorts as :meth:`query`
+        locally, which suits dashboards that run many queries over the same
+        rows. :meth:`DataSourceSnapshot.refresh` pulls in later edits through
+        :meth:`changes_since`.
+
+        Args:
+            indexes: Property names to index right away, see
+                :meth:`DataSourceSnapshot.create_index`.
+
+        Returns:
+            A loaded :class:`~notionary.data_source.snapshot.DataSourceSnapshot`.
+        """
+        property_types = {name: prop.type for name, prop in self.properties.items()}
+        snapshot = DataSourceSnapshot(self._client, self._http, property_types)
+        await snapshot.refresh()
+        for name in indexes or []:
+            snapshot.create_index(name)
+        return snapshot
+
+    async def parallel_scan(
+        self,
+        *,
+        partitions: int = 4,
+        partition_by: str = "created_time",
+        ordered: bool = False,
+        filter: QueryFilter | None = None,
+        page_size: int | None = None,
+        in_trash: bool | None = None,
+    ) -> AsyncGenerator[Page]:
+        """Stream all matching pages using several cursor chains at once.
+
+        Two probe queries find the oldest and newest row. The range between
+        them is split into *partitions* disjoint windows, which are queried
+        concurrently. Every request still goes through the shared rate limiter.
+
+        Args:
+            partitions: Number of windows queried concurrently.
+            partition_by: ``"created_time"`` or the name of a unique ID property.
+            ordered: Yield pages sorted ascending by the partition key. Later
+                windows keep fetching in the background and buffer their rows.
+                When ``False``, pages are yielded as soon as they arrive.
+            filter: Additional filter applied to every window.
+            page_size: Number of results per API request (max 100).
+            in_trash: If ``True``, return only trashed pages.
+
+        Yields:
+            :class:`~notionary.page.page.Page` objects one at a time.
+
+        Raises:
+            ValueError: If *partitions* is below 1 or *partition_by* names a
+                property that is not a unique ID.
+        """
+        self._check_partition_key(partition_by)
+        async for page in self._client.parallel_scan(
+            partitions=partitions,
+            partition_by=partition_by,
+            ordered=ordered,
+            filter=filter,
+            page_size=page_size,
+            in_trash=in_trash,
         ):
             yield page
 
+    def _check_partition_key(self, partition_by: str) -> None:
+        accepted = [
+            "created_time",
+            *(
+                n
+                for n, p in self.properties.items()
+                if p.type == PropertyType.UNIQUE_ID
+            ),
+        ]
+        if partition_by not in accepted:
+            raise ValueError(
+                f"Cannot partition by {partition_by!r}: use one of {accepted}"
+            )
+
+    def _projection(
+        self, select: list[str] | None, filter_properties: list[str] | None
+    ) -> list[str] | None:
+        if select is None:
+            return filter_properties
+
+        title = next(
+            (n for n, p in self.properties.items() if p.type == PropertyType.TITLE),
+            None,
+        )
+        property_ids = list(filter_properties or [])
+        for name in [title, *select] if title else select:
+            prop = self.properties.get(name)
+            if prop is None:
+                raise ValueError(
+                    f"Unknown property: {name!r}. Available: {list(self.properties)}"
+                )
+            # Schema IDs arrive URL-encoded; httpx encodes query params itself.
+            property_id = unquote(str(prop.id))
+            if property_id not in property_ids:
+                property_ids.append(property_id)
+        return property_ids
+
     async def update(
         self,
         *,
@@ -0,0 +1,191 @@
+import asyncio
+import csv
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
+from datetime import datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from notionary.data_source.values import cell_value, parse_timestamp
+from notionary.page.schemas import PageDto
+from notionary.shared.properties.type import PropertyType
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+type Columns = dict[str, list[Any]]
+
+BASE_COLUMNS = ("id", "url", "created_time", "last_edited_time", "in_trash")
+# Prefix for properties whose name is already taken by a base column.
+PROPERTY_COLUMN_PREFIX = "properties."
+
+_TIMESTAMP_TYPES = frozenset(
+    {
+        PropertyType.DATE,
+        PropertyType.CREATED_TIME,
+        PropertyType.LAST_EDITED_TIME,
+        PropertyType.LAST_VISITED_TIME,
+    }
+)
+_LIST_TYPES = frozenset(
+    {
+        PropertyType.MULTI_SELECT,
+        PropertyType.PEOPLE,
+        PropertyType.RELATION,
+        PropertyType.FILES,
+    }
+)
+
+
+class ExportFormat(StrEnum):
+    ARROW = "arrow"
+    PARQUET = "parquet"
+    CSV = "csv"
+
+
+def column_names(property_names: Iterable[str]) -> dict[str, str]:
+    """Map each property name to the name of its export column.
+
+    A property called like a base column (``id``, ``url``, ...) is exported as
+    ``properties.<name>`` so that it cannot overwrite page metadata.
+    """
+    taken = set(BASE_COLUMNS)
+    names = list(property_names)
+    taken.update(names)
+    columns: dict[str, str] = {}
+    for name in names:
+        column = name
+        if name in BASE_COLUMNS:
+            column = f"{PROPERTY_COLUMN_PREFIX}{name}"
+            while column in taken:
+                column = f"{PROPERTY_COLUMN_PREFIX}{column}"
+            taken.add(column)
+        columns[name] = column
+    return columns
+
+
+def to_columns(dtos: Sequence[PageDto], property_names: Sequence[str]) -> Columns:
+    """Turn a batch of pages into one list of plain values per column."""
+    property_columns = column_names(property_names)
+    columns: Columns = {
+        name: [] for name in (*BASE_COLUMNS, *property_columns.values())
+    }
+    for dto in dtos:
+        columns["id"].append(str(dto.id))
+        columns["url"].append(dto.url)
+        columns["created_time"].append(parse_timestamp(dto.created_time))
+        columns["last_edited_time"].append(parse_timestamp(dto.last_edited_time))
+        columns["in_trash"].append(dto.in_trash)
+        for name, column in property_columns.items():
+            prop = dto.properties.get(name)
+            columns[column].append(cell_value(prop) if prop is not None else None)
+    return columns
+
+
+def arrow_schema(property_types: Mapping[str, PropertyType | str]) -> "pa.Schema":
+    pa = _import_pyarrow()
+    timestamp = pa.timestamp("us", tz="UTC")
+    fields = [
+        pa.field("id", pa.string()),
+        pa.field("url", pa.string()),
+        pa.field("created_time", timestamp),
+        pa.field("last_edited_time", timestamp),
+        pa.field("in_trash", pa.bool_()),
+    ]
+    columns = column_names(property_types)
+    for name, property_type in property_types.items():
+        fields.append(pa.field(columns[name], _arrow_type(pa, property_type)))
+    return pa.schema(fields)
+
+
+async def write_export(
+    batches: AsyncIterable[Columns],
+    property_types: Mapping[str, PropertyType | str],
+    format: ExportFormat,
+    path: Path | None,
+) -> "pa.Table | Path":
+    """Consume *batches* and write them to *path* in the requested format.
+
+    Without a *path*, arrow exports are returned as an in-memory table.
+    Only one batch is held in memory at a time when writing to a file.
+    """
+    if path is None and format != ExportFormat.ARROW:
+        raise ValueError(f"Exporting as {format.value} requires a path")
+    if format == ExportFormat.CSV:
+        header = [*BASE_COLUMNS, *column_names(property_types).values()]
+        await _write_csv(batches, header, path)
+        return path
+
+    pa = _import_pyarrow()
+    schema = arrow_schema(property_types)
+    if path is None:
+        record_batches = [
+            pa.RecordBatch.from_pydict(columns, schema=schema)
+            async for columns in batches
+        ]
+        return pa.Table.from_batches(record_batches, schema=schema)
+
+    with _arrow_writer(format, path, schema) as writer:
+        async for columns in batches:
+            writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=schema))
+    return path
+
+
+async def _write_csv(
+    batches: AsyncIterable[Columns], header: list[str], path: Path
+) -> None:
+    # File writes block, so each batch is written from a worker thread.
+    file = await asyncio.to_thread(path.open, "w", newline="", encoding="utf-8")
+    try:
+        writer = csv.writer(file)
+        await asyncio.to_thread(writer.writerow, header)
+        async for columns in batches:
+            rows = [
+                [_csv_cell(value) for value in row]
+                for row in zip(*columns.values(), strict=True)
+            ]
+            await asyncio.to_thread(writer.writerows, rows)
+    finally:
+        await asyncio.to_thread(file.close)
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, list):
+        return ", ".join(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _arrow_writer(format: ExportFormat, path: Path, schema: "pa.Schema") -> Any:
+    if format == ExportFormat.PARQUET:
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(path, schema)
+    pa = _import_pyarrow()
+    return pa.ipc.new_file(path, schema)
+
+
+def _arrow_type(pa: Any, property_type: PropertyType | str) -> "pa.DataType":
+    if property_type in _TIMESTAMP_TYPES:
+        return pa.timestamp("us", tz="UTC")
+    if property_type in _LIST_TYPES:
+        return pa.list_(pa.string())
+    if property_type == PropertyType.NUMBER:
+        return pa.float64()
+    if property_type == PropertyType.CHECKBOX:
+        return pa.bool_()
+    if property_type == PropertyType.UNIQUE_ID:
+        return pa.int64()
+    return pa.string()
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Arrow and Parquet exports require pyarrow. "
+            "Install it with `pip install notionary[arrow]`."
+        ) from e
+    return pa
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from notionary.data_source.data_source import DataSource
@@ -15,16 +16,21 @@ from notionary.data_source.search import (
 from notionary.http import HttpClient
 from notionary.shared.search import fuzzy_suggestions
 
+if TYPE_CHECKING:
+    from notionary.mirror import Mirror
+
 
 class DataSourceNamespace:
     """Scoped access to Notion data sources.
 
     Provides listing, searching, and retrieval of
-    :class:`~notionary.data_source.data_source.DataSource` objects.
+    :class:`~notionary.data_source.data_source.DataSource` objects. With a
+    :class:`~notionary.mirror.Mirror`, reads are served from the local copy.
     """
 
-    def __init__(self, http: HttpClient) -> None:
+    def __init__(self, http: HttpClient, mirror: Mirror | None = None) -> None:
         self._http = http
+        self._mirror = mirror
         self._search_client = DataSourceSearchClient(http)
 
     async def list(
@@ -70,6 +76,13 @@ class DataSourceNamespace:
 
         Accepts the same arguments as :meth:`list`.
         """
+        if self._mirror is not None:
+            for dto in await self._mirror.list_data_sources(
+                query, sort_direction, sort_timestamp, limit=total_results_limit
+            ):
+                yield self._data_source_from_dto(dto)
+            return
+
         async for dto in self._search_client.stream(
             query=query,
             sort_direction=sort_direction,
@@ -102,7 +115,7 @@ class DataSourceNamespace:
             DataSourceNotFound: If no exact match is found. The exception
                 includes fuzzy suggestions when available.
         """
-        candidates = await self.list(query=title, page_size=10, total_results_limit=10)
+        candidates = await self.list(query=title, total_results_limit=10)
 
         exact = next(
             (ds for ds in candidates if ds.title.lower() == title.lower()), None
@@ -121,9 +134,15 @@ class DataSourceNamespace:
 
         Returns:
             The :class:`~notionary.data_source.data_source.DataSource` for the given ID.
+            Data sources missing from the mirror are fetched from Notion.
         """
-        response = await self._http.get(f"databases/{data_source_id}")
-        dto = DataSourceDto.model_validate(response)
+        if self._mirror is not None and (
+            dto := await self._mirror.get_data_source(data_source_id)
+        ):
+            return self._data_source_from_dto(dto)
+        dto = await self._http.get(
+            f"databases/{data_source_id}", response_model=DataSourceDto
+        )
         return self._data_source_from_dto(dto)
 
     def _data_source_from_dto(self, dto: DataSourceDto) -> DataSource:
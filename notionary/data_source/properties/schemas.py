@@ -12,7 +12,8 @@ from notionary.shared.properties.type import PropertyType
 
 
 class DataSourceProperty(BaseModel):
-    id: UUID
+    # Notion property IDs are short, URL-encoded strings such as ``%3AUPp``.
+    id: str | UUID
     name: str
     description: str | None = None
     type: PropertyType
@@ -0,0 +1,351 @@
+import calendar
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from notionary.data_source.query.filters import (
+    CheckboxCondition,
+    CheckboxFilter,
+    CompoundFilter,
+    DateCondition,
+    DateFilter,
+    FilesCondition,
+    FilesFilter,
+    FormulaFilter,
+    MultiSelectCondition,
+    MultiSelectFilter,
+    NumberCondition,
+    NumberFilter,
+    PeopleCondition,
+    PeopleFilter,
+    PhoneNumberFilter,
+    QueryFilter,
+    RelationCondition,
+    RelationFilter,
+    RichTextFilter,
+    SelectCondition,
+    SelectFilter,
+    StatusCondition,
+    StatusFilter,
+    TextCondition,
+    TimestampFilter,
+    UniqueIdFilter,
+    VerificationFilter,
+)
+from notionary.data_source.query.sorts import PropertySort, QuerySort, SortDirection
+from notionary.data_source.values import cell_value, parse_timestamp
+from notionary.page.properties.schemas import (
+    DateValue,
+    FormulaValueType,
+    PageFormulaProperty,
+)
+from notionary.page.schemas import PageDto
+
+
+def matches(filter: QueryFilter, page: PageDto) -> bool:
+    """Evaluate an API query filter against a page without calling the API.
+
+    Text comparisons other than ``equals`` ignore case, like Notion does.
+    Relative date conditions such as ``past_week`` are resolved against the
+    current UTC date.
+
+    Raises:
+        ValueError: If the filter references a property the page does not have.
+    """
+    match filter:
+        case CompoundFilter():
+            if filter.and_ is not None and not all(
+                matches(f, page) for f in filter.and_
+            ):
+                return False
+            return filter.or_ is None or any(matches(f, page) for f in filter.or_)
+        case TimestampFilter():
+            return _match_date(
+                filter.condition, parse_timestamp(getattr(page, filter.timestamp.value))
+            )
+        case FormulaFilter():
+            return _match_formula(filter, _property(page, filter.property))
+
+    value = _value(page, filter.property)
+    match filter:
+        case RichTextFilter() | PhoneNumberFilter():
+            condition = (
+                filter.rich_text
+                if isinstance(filter, RichTextFilter)
+                else filter.phone_number
+            )
+            return _match_text(condition, value)
+        case NumberFilter():
+            return _match_number(filter.number, value)
+        case UniqueIdFilter():
+            return _match_number(filter.unique_id, value)
+        case CheckboxFilter():
+            return _match_checkbox(filter.checkbox, value)
+        case SelectFilter():
+            return _match_option(filter.select, value)
+        case StatusFilter():
+            return _match_option(filter.status, value)
+        case MultiSelectFilter():
+            return _match_multi_select(filter.multi_select, value)
+        case DateFilter():
+            return _match_date(filter.date, value)
+        case PeopleFilter():
+            return _match_ids(filter.people, _as_list(value))
+        case RelationFilter():
+            return _match_ids(filter.relation, value)
+        case FilesFilter():
+            return _match_files(filter.files, value)
+        case VerificationFilter():
+            return value == filter.verification.status
+    raise ValueError(f"Unsupported filter type: {type(filter).__name__}")
+
+
+def sort_pages(pages: Iterable[PageDto], sorts: list[QuerySort]) -> list[PageDto]:
+    """Order pages by *sorts*, the first sort taking precedence.
+
+    Empty values come last in both directions, like in the Notion UI.
+    """
+    ordered = list(pages)
+    for sort in reversed(sorts):
+        descending = sort.direction == SortDirection.DESCENDING
+        ordered.sort(
+            key=lambda page, sort=sort, descending=descending: _sort_key(
+                _sort_value(page, sort), descending
+            ),
+            reverse=descending,
+        )
+    return ordered
+
+
+def _sort_value(page: PageDto, sort: QuerySort) -> Any:
+    if isinstance(sort, PropertySort):
+        value = _value(page, sort.property)
+    else:
+        value = parse_timestamp(getattr(page, sort.timestamp))
+    if isinstance(value, str):
+        return value.casefold()
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value).casefold() or None
+    return value
+
+
+def _sort_key(value: Any, descending: bool) -> tuple[bool, Any]:
+    present = value is not None
+    return (present, value) if descending else (not present, value)
+
+
+def _property(page: PageDto, name: str) -> Any:
+    if name not in page.properties:
+        raise ValueError(
+            f"Unknown property: {name!r}. Available: {list(page.properties)}"
+        )
+    return page.properties[name]
+
+
+def _value(page: PageDto, name: str) -> Any:
+    return cell_value(_property(page, name))
+
+
+# ---------------------------------------------------------------------------
+# Conditions
+# ---------------------------------------------------------------------------
+
+
+def _match_text(condition: TextCondition, value: str | None) -> bool:
+    text = value or ""
+    folded = text.casefold()
+    checks = [
+        (condition.equals, lambda v: text == v),
+        (condition.does_not_equal, lambda v: text != v),
+        (condition.contains, lambda v: v.casefold() in folded),
+        (condition.does_not_contain, lambda v: v.casefold() not in folded),
+        (condition.starts_with, lambda v: folded.startswith(v.casefold())),
+        (condition.ends_with, lambda v: folded.endswith(v.casefold())),
+    ]
+    return _all_hold(checks) and _match_empty(condition, not text)
+
+
+def _match_number(condition: NumberCondition, value: float | None) -> bool:
+    if value is None:
+        has_comparison = any(
+            v is not None
+            for v in (
+                condition.equals,
+                condition.greater_than,
+                condition.less_than,
+                condition.greater_than_or_equal_to,
+                condition.less_than_or_equal_to,
+            )
+        )
+        return not has_comparison and _match_empty(condition, True)
+    checks = [
+        (condition.equals, lambda v: value == v),
+        (condition.does_not_equal, lambda v: value != v),
+        (condition.greater_than, lambda v: value > v),
+        (condition.less_than, lambda v: value < v),
+        (condition.greater_than_or_equal_to, lambda v: value >= v),
+        (condition.less_than_or_equal_to, lambda v: value <= v),
+    ]
+    return _all_hold(checks) and _match_empty(condition, False)
+
+
+def _match_checkbox(condition: CheckboxCondition, value: bool | None) -> bool:
+    checked = bool(value)
+    return _all_hold(
+        [
+            (condition.equals, lambda v: checked == v),
+            (condition.does_not_equal, lambda v: checked != v),
+        ]
+    )
+
+
+def _match_option(
+    condition: SelectCondition | StatusCondition, value: str | None
+) -> bool:
+    return _all_hold(
+        [
+            (condition.equals, lambda v: value in _as_list(v)),
+            (condition.does_not_equal, lambda v: value not in _as_list(v)),
+        ]
+    ) and _match_empty(condition, value is None)
+
+
+def _match_multi_select(condition: MultiSelectCondition, value: list[str]) -> bool:
+    names = set(value or [])
+    return _all_hold(
+        [
+            (condition.contains, lambda v: set(_as_list(v)) <= names),
+            (condition.does_not_contain, lambda v: not names & set(_as_list(v))),
+        ]
+    ) and _match_empty(condition, not names)
+
+
+def _match_ids(
+    condition: PeopleCondition | RelationCondition, value: list[str]
+) -> bool:
+    ids = {_normalize_id(v) for v in value or []}
+    return _all_hold(
+        [
+            (condition.contains, lambda v: _normalize_id(v) in ids),
+            (condition.does_not_contain, lambda v: _normalize_id(v) not in ids),
+        ]
+    ) and _match_empty(condition, not ids)
+
+
+def _match_files(condition: FilesCondition, value: list[str]) -> bool:
+    return _match_empty(condition, not value)
+
+
+def _match_date(condition: DateCondition, value: datetime | None) -> bool:
+    if value is None:
+        return condition.is_empty is True or condition.is_not_empty is False
+    checks = [
+        (condition.equals, lambda v: _compare_date(value, v) == 0),
+        (condition.before, lambda v: _compare_date(value, v) < 0),
+        (condition.after, lambda v: _compare_date(value, v) > 0),
+        (condition.on_or_before, lambda v: _compare_date(value, v) <= 0),
+        (condition.on_or_after, lambda v: _compare_date(value, v) >= 0),
+    ]
+    day = value.date()
+    for name in (
+        "this_week",
+        "past_week",
+        "past_month",
+        "past_year",
+        "next_week",
+        "next_month",
+        "next_year",
+    ):
+        if getattr(condition, name) is not None:
+            start, end = _relative_range(name, datetime.now(UTC).date())
+            checks.append((True, lambda _, start=start, end=end: start <= day <= end))
+    return _all_hold(checks) and _match_empty(condition, False)
+
+
+def _match_formula(filter: FormulaFilter, prop: Any) -> bool:
+    if not isinstance(prop, PageFormulaProperty):
+        raise ValueError(f"Property {filter.property!r} is not a formula")
+    formula = prop.formula
+    condition = filter.formula
+    if condition.string is not None:
+        return formula.type == FormulaValueType.STRING and _match_text(
+            condition.string, formula.string
+        )
+    if condition.checkbox is not None:
+        return formula.type == FormulaValueType.BOOLEAN and _match_checkbox(
+            condition.checkbox, formula.boolean
+        )
+    if condition.number is not None:
+        return formula.type == FormulaValueType.NUMBER and _match_number(
+            condition.number, formula.number
+        )
+    if condition.date is not None:
+        return formula.type == FormulaValueType.DATE and _match_date(
+            condition.date, _date_start(formula.date)
+        )
+    return True
+
+
+def _match_empty(condition: Any, empty: bool) -> bool:
+    if condition.is_empty is not None and condition.is_empty != empty:
+        return False
+    return condition.is_not_empty is None or condition.is_not_empty != empty
+
+
+def _all_hold(checks: list[tuple[Any, Any]]) -> bool:
+    return all(check(expected) for expected, check in checks if expected is not None)
+
+
+# ---------------------------------------------------------------------------
+# Value helpers
+# ---------------------------------------------------------------------------
+
+
+def _compare_date(value: datetime, expected: str) -> int:
+    if len(expected) == 10:
+        left: date | datetime = value.date()
+        right: date | datetime = date.fromisoformat(expected)
+    else:
+        left, right = value, parse_timestamp(expected)
+    return (left > right) - (left < right)
+
+
+def _relative_range(name: str, today: date) -> tuple[date, date]:
+    match name:
+        case "this_week":
+            start = today - timedelta(days=today.weekday())
+            return start, start + timedelta(days=6)
+        case "past_week":
+            return today - timedelta(days=7), today
+        case "past_month":
+            return _shift_months(today, -1), today
+        case "past_year":
+            return _shift_months(today, -12), today
+        case "next_week":
+            return today, today + timedelta(days=7)
+        case "next_month":
+            return today, _shift_months(today, 1)
+        case _:
+            return today, _shift_months(today, 12)
+
+
+def _shift_months(day: date, months: int) -> date:
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return day.replace(
+        year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1])
+    )
+
+
+def _date_start(value: DateValue | None) -> datetime | None:
+    return parse_timestamp(value.start) if value else None
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _normalize_id(value: str) -> str:
+    return value.replace("-", "").lower()
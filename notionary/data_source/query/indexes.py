@@ -0,0 +1,265 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Mapping
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from typing import Any
+from uuid import UUID
+
+from notionary.data_source.query.filters import (
+    CompoundFilter,
+    DateCondition,
+    DateFilter,
+    MultiSelectFilter,
+    NumberCondition,
+    NumberFilter,
+    QueryFilter,
+    RelationFilter,
+    SelectCondition,
+    SelectFilter,
+    StatusCondition,
+    StatusFilter,
+    UniqueIdFilter,
+)
+from notionary.data_source.values import cell_value, parse_timestamp
+from notionary.page.schemas import PageDto
+from notionary.shared.properties.type import PropertyType
+
+HASH_INDEX_TYPES = frozenset(
+    {
+        PropertyType.SELECT,
+        PropertyType.STATUS,
+        PropertyType.MULTI_SELECT,
+        PropertyType.RELATION,
+    }
+)
+SORTED_INDEX_TYPES = frozenset(
+    {PropertyType.NUMBER, PropertyType.DATE, PropertyType.UNIQUE_ID}
+)
+
+_EMPTY = None
+_NO_IDS: frozenset[UUID] = frozenset()
+
+
+class HashIndex:
+    """Maps every option or related page of a property to the rows that have it.
+
+    Multi-select and relation values are indexed once per element, so a row
+    shows up under each of its tags or related pages.
+    """
+
+    def __init__(self, property: str, key: Callable[[Any], Any] | None = None) -> None:
+        self.property = property
+        self._key = key
+        self._ids: dict[Any, set[UUID]] = {}
+        self._keys: dict[UUID, list[Any]] = {}
+
+    def add(self, page: PageDto) -> None:
+        self.remove(page.id)
+        keys = self._hash_keys(_raw_value(page, self.property))
+        self._keys[page.id] = keys
+        for key in keys:
+            self._ids.setdefault(key, set()).add(page.id)
+
+    def remove(self, page_id: UUID) -> None:
+        for key in self._keys.pop(page_id, ()):
+            ids = self._ids[key]
+            ids.discard(page_id)
+            if not ids:
+                del self._ids[key]
+
+    def lookup(self, value: Any) -> set[UUID] | frozenset[UUID]:
+        key = self._key(value) if self._key else value
+        return self._ids.get(key, _NO_IDS)
+
+    def empty(self) -> set[UUID] | frozenset[UUID]:
+        return self._ids.get(_EMPTY, _NO_IDS)
+
+    def _hash_keys(self, value: Any) -> list[Any]:
+        if value is None or value == []:
+            return [_EMPTY]
+        values = value if isinstance(value, list) else [value]
+        return [self._key(v) for v in values] if self._key else values
+
+
+class SortedIndex:
+    """Keeps the rows ordered by a number, date or unique ID property."""
+
+    def __init__(self, property: str) -> None:
+        self.property = property
+        self._entries: list[tuple[Any, UUID]] = []
+        self._keys: dict[UUID, Any] = {}
+        self._empty: set[UUID] = set()
+
+    def add(self, page: PageDto) -> None:
+        self.remove(page.id)
+        key = _raw_value(page, self.property)
+        if key is None:
+            self._empty.add(page.id)
+            return
+        self._keys[page.id] = key
+        insort(self._entries, (key, page.id))
+
+    def remove(self, page_id: UUID) -> None:
+        self._empty.discard(page_id)
+        if page_id not in self._keys:
+            return
+        entry = (self._keys.pop(page_id), page_id)
+        del self._entries[bisect_left(self._entries, entry)]
+
+    def between(self, low: Any = None, high: Any = None) -> set[UUID]:
+        """Return the rows whose value lies in ``[low, high]``; ``None`` is unbounded."""
+        key = itemgetter(0)
+        start = 0 if low is None else bisect_left(self._entries, low, key=key)
+        end = (
+            len(self._entries)
+            if high is None
+            else bisect_right(self._entries, high, key=key)
+        )
+        return {page_id for _, page_id in self._entries[start:end]}
+
+    def empty(self) -> set[UUID]:
+        return self._empty
+
+
+type Index = HashIndex | SortedIndex
+
+
+def build_index(property: str, property_type: PropertyType | str) -> Index:
+    """Create the index kind that suits *property_type*.
+
+    Raises:
+        ValueError: If the property type cannot be indexed.
+    """
+    if property_type == PropertyType.RELATION:
+        return HashIndex(property, key=_normalize_id)
+    if property_type in HASH_INDEX_TYPES:
+        return HashIndex(property)
+    if property_type in SORTED_INDEX_TYPES:
+        return SortedIndex(property)
+    raise ValueError(
+        f"Property {property!r} of type {property_type!r} cannot be indexed. "
+        f"Supported types: {sorted(HASH_INDEX_TYPES | SORTED_INDEX_TYPES)}"
+    )
+
+
+def candidates(filter: QueryFilter, indexes: Mapping[str, Index]) -> set[UUID] | None:
+    """Narrow *filter* down to a superset of the matching row IDs.
+
+    Returns ``None`` when no index applies and every row has to be scanned.
+    The result may contain rows that do not match, so callers still evaluate
+    the filter on each candidate.
+    """
+    if isinstance(filter, CompoundFilter):
+        return _compound_candidates(filter, indexes)
+
+    index = indexes.get(getattr(filter, "property", ""))
+    match filter:
+        case SelectFilter() if isinstance(index, HashIndex):
+            return _option_candidates(index, filter.select)
+        case StatusFilter() if isinstance(index, HashIndex):
+            return _option_candidates(index, filter.status)
+        case MultiSelectFilter() if isinstance(index, HashIndex):
+            condition = filter.multi_select
+            if condition.contains is not None:
+                keys = _as_list(condition.contains)
+                return set.intersection(*(set(index.lookup(key)) for key in keys))
+            return _empty_candidates(index, condition.is_empty)
+        case RelationFilter() if isinstance(index, HashIndex):
+            condition = filter.relation
+            if condition.contains is not None:
+                return set(index.lookup(condition.contains))
+            return _empty_candidates(index, condition.is_empty)
+        case NumberFilter() if isinstance(index, SortedIndex):
+            return _number_candidates(index, filter.number)
+        case UniqueIdFilter() if isinstance(index, SortedIndex):
+            return _number_candidates(index, filter.unique_id)
+        case DateFilter() if isinstance(index, SortedIndex):
+            return _date_candidates(index, filter.date)
+    return None
+
+
+def _compound_candidates(
+    filter: CompoundFilter, indexes: Mapping[str, Index]
+) -> set[UUID] | None:
+    narrowed: set[UUID] | None = None
+    for child in filter.and_ or []:
+        ids = candidates(child, indexes)
+        if ids is not None:
+            narrowed = ids if narrowed is None else narrowed & ids
+
+    if filter.or_ is not None:
+        branches = [candidates(child, indexes) for child in filter.or_]
+        if all(ids is not None for ids in branches):
+            union = set().union(*branches)
+            narrowed = union if narrowed is None else narrowed & union
+    return narrowed
+
+
+def _option_candidates(
+    index: HashIndex, condition: SelectCondition | StatusCondition
+) -> set[UUID] | None:
+    if condition.equals is not None:
+        return set().union(*(index.lookup(key) for key in _as_list(condition.equals)))
+    return _empty_candidates(index, condition.is_empty)
+
+
+def _number_candidates(
+    index: SortedIndex, condition: NumberCondition
+) -> set[UUID] | None:
+    if condition.is_empty:
+        return set(index.empty())
+    low = _max(condition.greater_than, condition.greater_than_or_equal_to)
+    high = _min(condition.less_than, condition.less_than_or_equal_to)
+    if condition.equals is not None:
+        low = high = condition.equals
+    if low is None and high is None:
+        return None
+    return index.between(low, high)
+
+
+def _date_candidates(index: SortedIndex, condition: DateCondition) -> set[UUID] | None:
+    if condition.is_empty:
+        return set(index.empty())
+    lows = [condition.equals, condition.after, condition.on_or_after]
+    highs = [condition.equals, condition.before, condition.on_or_before]
+    low = _max(*(_date_bound(value, -1) for value in lows if value is not None))
+    high = _min(*(_date_bound(value, 2) for value in highs if value is not None))
+    if low is None and high is None:
+        return None
+    return index.between(low, high)
+
+
+def _date_bound(value: str, days: int) -> datetime | None:
+    # Date-only conditions compare calendar days in each value's own offset,
+    # so the bound is widened by a day to stay a superset across time zones.
+    if len(value) == 10:
+        day = datetime.combine(date.fromisoformat(value), datetime.min.time())
+        return parse_timestamp(day.isoformat()) + timedelta(days=days)
+    return parse_timestamp(value)
+
+
+def _empty_candidates(index: Index, is_empty: bool | None) -> set[UUID] | None:
+    return set(index.empty()) if is_empty else None
+
+
+def _raw_value(page: PageDto, name: str) -> Any:
+    prop = page.properties.get(name)
+    return cell_value(prop) if prop is not None else None
+
+
+def _normalize_id(value: str) -> str:
+    return value.replace("-", "").lower()
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _max(*values: Any) -> Any:
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def _min(*values: Any) -> Any:
+    present = [value for value in values if value is not None]
+    return min(present) if present else None
@@ -0,0 +1,83 @@
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from itertools import pairwise
+from typing import Any
+
+from notionary.data_source.query.filters import (
+    CompoundFilter,
+    DateCondition,
+    NumberCondition,
+    QueryFilter,
+    TimestampFilter,
+    TimestampType,
+    UniqueIdFilter,
+)
+
+
+def timestamp_windows(
+    timestamp: TimestampType, first: datetime, last: datetime, partitions: int
+) -> list[QueryFilter | None]:
+    """Split ``[first, last]`` into up to *partitions* disjoint timestamp filters.
+
+    Boundaries fall on whole minutes, the precision Notion stores timestamps
+    with. The outer windows are open-ended, so rows outside the probed range
+    are still covered. ``None`` stands for a window without any bound.
+    """
+    step = (last - first) / partitions
+    boundaries = sorted(
+        {_floor_to_minute(first + step * i) for i in range(1, partitions)}
+        - {_floor_to_minute(first)}
+    )
+    return _windows(
+        boundaries,
+        lambda lower: TimestampFilter(
+            timestamp=timestamp,
+            condition=DateCondition(on_or_after=lower.isoformat()),
+        ),
+        lambda upper: TimestampFilter(
+            timestamp=timestamp,
+            condition=DateCondition(before=upper.isoformat()),
+        ),
+    )
+
+
+def unique_id_windows(
+    property: str, first: int, last: int, partitions: int
+) -> list[QueryFilter | None]:
+    """Split the ID range ``[first, last]`` into up to *partitions* filters."""
+    step = max(1, -(-(last - first + 1) // partitions))
+    return _windows(
+        list(range(first + step, last + 1, step)),
+        lambda lower: UniqueIdFilter(
+            property=property,
+            unique_id=NumberCondition(greater_than_or_equal_to=lower),
+        ),
+        lambda upper: UniqueIdFilter(
+            property=property,
+            unique_id=NumberCondition(less_than=upper),
+        ),
+    )
+
+
+def _windows(
+    boundaries: Sequence[Any],
+    at_least: Callable[[Any], QueryFilter],
+    below: Callable[[Any], QueryFilter],
+) -> list[QueryFilter | None]:
+    windows: list[QueryFilter | None] = []
+    for lower, upper in pairwise([None, *boundaries, None]):
+        parts = [
+            *([at_least(lower)] if lower is not None else []),
+            *([below(upper)] if upper is not None else []),
+        ]
+        if not parts:
+            windows.append(None)
+        elif len(parts) == 1:
+            windows.append(parts[0])
+        else:
+            windows.append(CompoundFilter(and_=parts))
+    return windows
+
+
+def _floor_to_minute(value: datetime) -> datetime:
+    return value - timedelta(seconds=value.second, microseconds=value.microsecond)
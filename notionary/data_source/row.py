@@ -0,0 +1,52 @@
+from typing import Any
+from uuid import UUID
+
+from notionary.data_source.values import cell_value
+from notionary.http.client import HttpClient
+from notionary.page import Page
+from notionary.page import mapper as page_mapper
+from notionary.page.schemas import PageDto
+
+_MISSING = object()
+
+
+class Row:
+    """Read-only view of a single query result.
+
+    Unlike :class:`~notionary.page.page.Page`, a row does not set up property,
+    content or comment services. Property values are decoded on first access
+    and cached. Call :meth:`to_page` to get the full page when needed.
+    """
+
+    __slots__ = ("_dto", "_http", "_values", "id", "last_edited_time", "title", "url")
+
+    def __init__(self, dto: PageDto, http: HttpClient) -> None:
+        self.id: UUID = dto.id
+        self.url: str = dto.url
+        self.title: str = page_mapper.to_title(dto)
+        self.last_edited_time: str = dto.last_edited_time
+        self._dto = dto
+        self._http = http
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        value = self._values.get(name, _MISSING)
+        if value is _MISSING:
+            value = self._values[name] = cell_value(self._dto.properties[name])
+        return value
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name not in self._dto.properties:
+            return default
+        return self[name]
+
+    @property
+    def properties(self) -> dict[str, Any]:
+        """All property values keyed by name."""
+        return {name: self[name] for name in self._dto.properties}
+
+    def to_page(self) -> Page:
+        return page_mapper.to_page(self._dto, self._http)
+
+    def __repr__(self) -> str:
+        return f"Row(id={self.id!r}, title={self.title!r})"
@@ -1,11 +1,15 @@
+import base64
+from datetime import datetime
 from enum import StrEnum
-from typing import Any
+from typing import Any, Self
+from urllib.parse import unquote
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from notionary.data_source.properties.schemas import AnyDataSourceProperty
 from notionary.data_source.query.filters import QueryFilter
 from notionary.data_source.query.sorts import QuerySort
+from notionary.page.page import Page
 from notionary.page.schemas import PageDto
 from notionary.rich_text import RichText
 from notionary.shared.object.dtos import NotionObjectResponseDto, NotionObjectUpdateDto
@@ -44,7 +48,11 @@ class QueryDataSourceRequest(BaseModel):
     def to_query_params(self) -> dict[str, list[str]]:
         params: dict[str, list[str]] = {}
         if self.filter_properties:
-            params["filter_properties"] = self.filter_properties
+            # IDs copied from a schema are already URL-encoded and would
+            # otherwise be encoded a second time.
+            params["filter_properties"] = [
+                unquote(property_id) for property_id in self.filter_properties
+            ]
         return params
 
 
@@ -81,3 +89,37 @@ class ListTemplatesResponse(BaseModel):
     templates: list[DataSourceTemplate]
     has_more: bool
     next_cursor: str | None = None
+
+
+class SyncCheckpoint(BaseModel):
+    """Watermark of the newest change returned by an incremental sync.
+
+    Notion stores ``last_edited_time`` with minute precision, so an edit made
+    later in the watermark's minute cannot be told apart from one already
+    synced. The next sync therefore returns every row of that minute again,
+    and callers should apply changes as idempotent upserts.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    last_edited_time: datetime
+
+    def to_token(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def from_token(cls, token: str) -> Self:
+        return cls.model_validate_json(base64.urlsafe_b64decode(token))
+
+
+class ChangeSet(BaseModel):
+    """Rows changed since a :class:`SyncCheckpoint`, newest first."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    pages: list[Page]
+    checkpoint: SyncCheckpoint | None
+
+    @property
+    def token(self) -> str | None:
+        return self.checkpoint.to_token() if self.checkpoint else None
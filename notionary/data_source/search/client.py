@@ -31,6 +31,7 @@ class DataSourceSearchClient:
         async for item in self._http.paginate_stream(
             endpoint="search",
             total_results_limit=config.total_results_limit,
+            item_model=DataSourceDto,
             **config.model_dump(mode="json"),
         ):
-            yield DataSourceDto.model_validate(item)
+            yield item
@@ -0,0 +1,120 @@
+from collections.abc import Iterable, Mapping
+from itertools import islice
+from uuid import UUID
+
+from notionary.data_source.client import DataSourceClient
+from notionary.data_source.query.evaluator import matches, sort_pages
+from notionary.data_source.query.filters import QueryFilter
+from notionary.data_source.query.indexes import Index, build_index, candidates
+from notionary.data_source.query.sorts import QuerySort
+from notionary.data_source.row import Row
+from notionary.data_source.schemas import SyncCheckpoint
+from notionary.http.client import HttpClient
+from notionary.page.schemas import PageDto
+from notionary.shared.properties.type import PropertyType
+
+
+class DataSourceSnapshot:
+    """In-memory copy of a data source's rows that answers queries locally.
+
+    Queries take the same filter and sort objects as
+    :meth:`~notionary.data_source.data_source.DataSource.query`, but are
+    evaluated against the cached rows without any request. Call
+    :meth:`refresh` to pull in rows edited since the last sync.
+
+    Indexes created with :meth:`create_index` let filters on select, status,
+    multi-select, relation, number, date and unique ID properties skip the
+    rows that cannot match instead of scanning all of them.
+    """
+
+    def __init__(
+        self,
+        client: DataSourceClient,
+        http: HttpClient,
+        property_types: Mapping[str, PropertyType] | None = None,
+    ) -> None:
+        self._client = client
+        self._http = http
+        self._property_types = dict(property_types or {})
+        self._pages: dict[UUID, PageDto] = {}
+        self._indexes: dict[str, Index] = {}
+        self.checkpoint: SyncCheckpoint | None = None
+
+    def create_index(self, property: str) -> None:
+        """Index *property* so filters on it become lookups.
+
+        Select, status, multi-select and relation properties get a hash index,
+        number, date and unique ID properties a sorted index. Indexes are kept
+        up to date by :meth:`refresh`.
+
+        Raises:
+            ValueError: If the property is unknown or its type cannot be indexed.
+        """
+        if property not in self._property_types:
+            raise ValueError(
+                f"Unknown property: {property!r}. "
+                f"Available: {list(self._property_types)}"
+            )
+        index = build_index(property, self._property_types[property])
+        for page in self._pages.values():
+            index.add(page)
+        self._indexes[property] = index
+
+    async def refresh(self) -> int:
+        """Fetch rows edited since the last sync and return how many changed.
+
+        Queries leave out trashed pages, so rows moved to the trash since the
+        last sync are fetched by a second query and dropped from the snapshot.
+        """
+        previous = self.checkpoint
+        dtos, checkpoint = await self._client.changed_dtos(previous)
+        if previous is not None:
+            trashed, trashed_checkpoint = await self._client.changed_dtos(
+                previous, in_trash=True
+            )
+            dtos += trashed
+            checkpoint = max(
+                checkpoint, trashed_checkpoint, key=lambda c: c.last_edited_time
+            )
+        self.checkpoint = checkpoint
+        self._apply(dtos)
+        return len(dtos)
+
+    def query(
+        self,
+        *,
+        filter: QueryFilter | None = None,
+        sorts: list[QuerySort] | None = None,
+        limit: int | None = None,
+    ) -> list[Row]:
+        """Return the cached rows matching *filter*, ordered by *sorts*.
+
+        Without *sorts*, rows found through an index come back in no
+        particular order.
+        """
+        pages: Iterable[PageDto] = self._pages.values()
+        if filter is not None:
+            ids = candidates(filter, self._indexes) if self._indexes else None
+            if ids is not None:
+                pages = [self._pages[page_id] for page_id in ids]
+            pages = [page for page in pages if matches(filter, page)]
+        if sorts:
+            pages = sort_pages(pages, sorts)
+        return [Row(page, self._http) for page in islice(pages, limit)]
+
+    def _apply(self, dtos: Iterable[PageDto]) -> None:
+        for dto in dtos:
+            if dto.in_trash:
+                self._pages.pop(dto.id, None)
+                for index in self._indexes.values():
+                    index.remove(dto.id)
+            else:
+                self._pages[dto.id] = dto
+                for index in self._indexes.values():
+                    index.add(dto)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __repr__(self) -> str:
+        return f"DataSourceSnapshot(rows={len(self._pages)})"
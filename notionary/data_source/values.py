@@ -0,0 +1,133 @@
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from notionary.page.properties.schemas import (
+    AnyPageProperty,
+    DateValue,
+    FormulaValue,
+    PageCheckboxProperty,
+    PageCreatedByProperty,
+    PageCreatedTimeProperty,
+    PageDateProperty,
+    PageEmailProperty,
+    PageFilesProperty,
+    PageFormulaProperty,
+    PageLastEditedByProperty,
+    PageLastEditedTimeProperty,
+    PageLastVisitedTimeProperty,
+    PageMultiSelectProperty,
+    PageNumberProperty,
+    PagePeopleProperty,
+    PagePhoneNumberProperty,
+    PageRelationProperty,
+    PageRichTextProperty,
+    PageRollupProperty,
+    PageSelectProperty,
+    PageStatusProperty,
+    PageTitleProperty,
+    PageUniqueIdProperty,
+    PageURLProperty,
+    PageVerificationProperty,
+    RollupValue,
+    RollupValueType,
+)
+
+_rollup_item_adapter: TypeAdapter[AnyPageProperty] = TypeAdapter(AnyPageProperty)
+
+
+def cell_value(prop: AnyPageProperty) -> Any:
+    """Return the value of a page property as a column-friendly scalar or list."""
+    match prop:
+        case PageTitleProperty():
+            return "".join(part.plain_text for part in prop.title)
+        case PageRichTextProperty():
+            return "".join(part.plain_text for part in prop.rich_text)
+        case PageNumberProperty():
+            return prop.number
+        case PageCheckboxProperty():
+            return prop.checkbox
+        case PageSelectProperty():
+            return prop.select.name if prop.select else None
+        case PageStatusProperty():
+            return prop.status.name if prop.status else None
+        case PageMultiSelectProperty():
+            return [option.name for option in prop.multi_select]
+        case PageDateProperty():
+            return parse_timestamp(prop.date.start) if prop.date else None
+        case PageURLProperty():
+            return prop.url
+        case PageEmailProperty():
+            return prop.email
+        case PagePhoneNumberProperty():
+            return prop.phone_number
+        case PagePeopleProperty():
+            return [str(person.id) for person in prop.people]
+        case PageCreatedByProperty():
+            return str(prop.created_by.id)
+        case PageLastEditedByProperty():
+            return str(prop.last_edited_by.id)
+        case PageCreatedTimeProperty():
+            return parse_timestamp(prop.created_time)
+        case PageLastEditedTimeProperty():
+            return parse_timestamp(prop.last_edited_time)
+        case PageLastVisitedTimeProperty():
+            return parse_timestamp(prop.last_visited_time)
+        case PageRelationProperty():
+            return [item.id for item in prop.relation]
+        case PageFilesProperty():
+            return [url for file in prop.files if (url := file.get_url())]
+        case PageUniqueIdProperty():
+            return prop.unique_id.number
+        case PageFormulaProperty():
+            return _computed_text(prop.formula)
+        case PageRollupProperty():
+            return _rollup_value(prop.rollup)
+        case PageVerificationProperty():
+            return prop.verification.state.value
+        case _:
+            return None
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _computed_text(result: FormulaValue | RollupValue) -> str | None:
+    value = getattr(result, result.type, None)
+    if isinstance(value, DateValue):
+        value = value.start
+    return _text(value)
+
+
+def _rollup_value(rollup: RollupValue) -> str | None:
+    if rollup.type != RollupValueType.ARRAY:
+        return _computed_text(rollup)
+    # Array rollups hold one property value per related page. They are
+    # exported as a JSON list of the same plain values their columns would get.
+    items = [
+        cell_value(_rollup_item_adapter.validate_python(item))
+        if isinstance(item, dict)
+        else item
+        for item in rollup.array or []
+    ]
+    return json.dumps(items, default=_json_default, ensure_ascii=False)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
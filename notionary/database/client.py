@@ -19,8 +19,9 @@ class DatabaseHttpClient:
         self._http = http
 
     async def retrieve(self, database_id: UUID) -> DatabaseDto:
-        response = await self._http.get(f"{self._ENDPOINT}/{database_id}")
-        return DatabaseDto.model_validate(response)
+        return await self._http.get(
+            f"{self._ENDPOINT}/{database_id}", response_model=DatabaseDto
+        )
 
     async def create(
         self,
@@ -55,13 +56,13 @@ class DatabaseHttpClient:
         if cover_url:
             request.cover = ExternalFile.from_url(cover_url).model_dump(mode="json")
 
-        response = await self._http.post(self._ENDPOINT, data=request)
-        return DatabaseDto.model_validate(response)
+        return await self._http.post(
+            self._ENDPOINT, data=request, response_model=DatabaseDto
+        )
 
     async def update(
         self, database_id: UUID, update: UpdateDatabaseRequest
     ) -> DatabaseDto:
-        response = await self._http.patch(
-            f"{self._ENDPOINT}/{database_id}", data=update
+        return await self._http.patch(
+            f"{self._ENDPOINT}/{database_id}", data=update, response_model=DatabaseDto
         )
-        return DatabaseDto.model_validate(response)
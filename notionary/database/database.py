@@ -220,8 +220,9 @@ class Database:
         if title:
             request.title = markdown_to_rich_text(title)
 
-        response = await self._http.post("/data_sources", data=request)
-        dto = DataSourceDto.model_validate(response)
+        dto = await self._http.post(
+            "/data_sources", data=request, response_model=DataSourceDto
+        )
         return to_data_source(dto, self._http)
 
     async def update(
@@ -105,7 +105,7 @@ class DatabaseNamespace:
             DatabaseNotFound: If no exact match is found. The exception
                 includes fuzzy suggestions when available.
         """
-        candidates = await self.list(query=title, page_size=25, total_results_limit=25)
+        candidates = await self.list(query=title, total_results_limit=25)
 
         exact = next(
             (db for db in candidates if db.title.lower() == title.lower()), None
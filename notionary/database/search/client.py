@@ -31,6 +31,7 @@ class DatabaseSearchClient:
         async for item in self._http.paginate_stream(
             endpoint="search",
             total_results_limit=config.total_results_limit,
+            item_model=DatabaseDto,
             **config.model_dump(mode="json"),
         ):
-            yield DatabaseDto.model_validate(item)
+            yield item
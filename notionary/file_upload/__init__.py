@@ -7,11 +7,18 @@ from .exceptions import (
     UploadTimeoutError,
 )
 from .namespace import FileUploads
-from .schemas import FileUploadResponse, FileUploadStatus
+from .schemas import (
+    FileUploadConfig,
+    FileUploadResponse,
+    FileUploadResult,
+    FileUploadStatus,
+)
 
 __all__ = [
     "FileNotFoundError",
+    "FileUploadConfig",
     "FileUploadResponse",
+    "FileUploadResult",
     "FileUploadStatus",
     "FileUploads",
     "FilenameTooLongError",
@@ -1,4 +1,5 @@
 from collections.abc import AsyncGenerator
+from typing import BinaryIO
 from uuid import UUID
 
 from notionary.file_upload.schemas import (
@@ -32,40 +33,44 @@ class FileUploadHttpClient:
     async def send_file_content(
         self,
         file_upload_id: UUID,
-        file_content: bytes,
+        file_content: bytes | BinaryIO,
         filename: str,
         part_number: int | None = None,
     ) -> FileUploadResponse:
         data = {"part_number": str(part_number)} if part_number is not None else None
+        # Re-sending a numbered part replaces it, so parts may be retried after
+        # an ambiguous failure. A single-part send may not.
         response = await self._http.post_multipart(
             f"file_uploads/{file_upload_id}/send",
             files={"file": (filename, file_content)},
             data=data,
+            idempotent=part_number is not None,
         )
         return FileUploadResponse.model_validate(response)
 
     async def complete_upload(self, file_upload_id: UUID) -> FileUploadResponse:
-        response = await self._http.post(
+        return await self._http.post(
             f"file_uploads/{file_upload_id}/complete",
             data=FileUploadCompleteRequest(),
+            response_model=FileUploadResponse,
         )
-        return FileUploadResponse.model_validate(response)
 
     async def get_file_upload(self, file_upload_id: UUID) -> FileUploadResponse:
-        response = await self._http.get(f"file_uploads/{file_upload_id}")
-        return FileUploadResponse.model_validate(response)
+        return await self._http.get(
+            f"file_uploads/{file_upload_id}", response_model=FileUploadResponse
+        )
 
     async def list_file_uploads(
         self, query: FileUploadQuery | None = None
     ) -> list[FileUploadResponse]:
         q = query or FileUploadQuery()
-        raw = await self._http.paginate(
+        return await self._http.paginate(
             "file_uploads",
             total_results_limit=q.total_results_limit,
+            item_model=FileUploadResponse,
             method="GET",
             **q.model_dump(exclude_none=True, mode="json"),
         )
-        return [FileUploadResponse.model_validate(r) for r in raw]
 
     async def list_file_uploads_stream(
         self, query: FileUploadQuery | None = None
@@ -74,10 +79,11 @@ class FileUploadHttpClient:
         async for item in self._http.paginate_stream(
             "file_uploads",
             total_results_limit=q.total_results_limit,
+            item_model=FileUploadResponse,
             method="GET",
             **q.model_dump(exclude_none=True, mode="json"),
         ):
-            yield FileUploadResponse.model_validate(item)
+            yield item
 
     async def _create_upload(
         self,
@@ -92,5 +98,6 @@ class FileUploadHttpClient:
             mode=mode,
             number_of_parts=number_of_parts,
         )
-        response = await self._http.post("file_uploads", data=request)
-        return FileUploadResponse.model_validate(response)
+        return await self._http.post(
+            "file_uploads", data=request, response_model=FileUploadResponse
+        )
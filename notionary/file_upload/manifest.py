@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+import logging
+import os
+from collections.abc import Awaitable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Self
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class UploadManifest(BaseModel):
+    """On-disk record of a multi-part upload, used to resume it after a failure.
+
+    The checksum and part size tie the manifest to the exact file contents
+    and chunking it was written for; any mismatch starts a fresh upload.
+    """
+
+    upload_id: UUID
+    filename: str
+    checksum: str
+    part_size: int
+    part_count: int
+    completed_parts: set[int] = Field(default_factory=set)
+    expiry_time: str | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> Self | None:
+        try:
+            return cls.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.warning("Ignoring unreadable upload manifest %s: %s", path, e)
+            return None
+
+    def save(self, path: Path) -> None:
+        # Write to a temporary file first so a crash never leaves half a manifest.
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_text(self.model_dump_json())
+        os.replace(tmp, path)
+
+    def matches(self, filename: str, checksum: str, part_size: int) -> bool:
+        return (
+            self.filename == filename
+            and self.checksum == checksum
+            and self.part_size == part_size
+        )
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        if self.expiry_time is None:
+            return False
+        expiry = datetime.fromisoformat(self.expiry_time)
+        return expiry <= (now or datetime.now(UTC))
+
+
+class ManifestWriter:
+    """Records sent parts in an upload manifest without blocking the event loop.
+
+    Saves run in a worker thread, one at a time. Parts sent while a save is
+    running are written together by the next one. A new upload can pass its
+    checksum as an awaitable, which is only awaited before the first save.
+    """
+
+    def __init__(
+        self,
+        manifest: UploadManifest,
+        path: Path,
+        checksum: Awaitable[str] | None = None,
+    ) -> None:
+        self._manifest = manifest
+        self._path = path
+        self._checksum = checksum
+        self._task: asyncio.Task[None] | None = None
+        self._dirty = False
+
+    def record(self, part_number: int) -> None:
+        self._manifest.completed_parts.add(part_number)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._save())
+        else:
+            self._dirty = True
+
+    async def close(self) -> None:
+        """Wait until every recorded part is on disk."""
+        if self._task is not None:
+            await self._task
+        elif isinstance(self._checksum, asyncio.Future):
+            self._checksum.cancel()
+
+    async def _save(self) -> None:
+        try:
+            if self._checksum is not None:
+                self._manifest.checksum = await self._checksum
+                self._checksum = None
+            while True:
+                self._dirty = False
+                # Parts keep arriving while the thread writes, so it gets a copy.
+                snapshot = self._manifest.model_copy(deep=True)
+                await asyncio.to_thread(snapshot.save, self._path)
+                if not self._dirty:
+                    return
+        except OSError as e:
+            # The manifest only makes the upload resumable; losing it must
+            # not fail the upload itself.
+            logger.warning("Could not write upload manifest %s: %s", self._path, e)
+
+
+def file_checksum(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while block := f.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
@@ -1,12 +1,14 @@
+from __future__ import annotations
+
 import asyncio
 import logging
 import mimetypes
 import os
-from collections.abc import AsyncGenerator, AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable
 from pathlib import Path
 from uuid import UUID
 
-import aiofiles
+import httpx
 
 from notionary.file_upload.client import FileUploadHttpClient
 from notionary.file_upload.exceptions import (
@@ -17,10 +19,18 @@ from notionary.file_upload.exceptions import (
     UploadFailedError,
     UploadTimeoutError,
 )
+from notionary.file_upload.manifest import (
+    ManifestWriter,
+    UploadManifest,
+    file_checksum,
+)
+from notionary.file_upload.parts import UploadPart
+from notionary.file_upload.poller import UploadPoller
 from notionary.file_upload.schemas import (
     FileUploadConfig,
     FileUploadQuery,
     FileUploadResponse,
+    FileUploadResult,
     FileUploadStatus,
 )
 from notionary.http import HttpClient
@@ -95,9 +105,12 @@ class FileUploads:
         }
     )
 
-    def __init__(self, http: HttpClient) -> None:
+    def __init__(
+        self, http: HttpClient, config: FileUploadConfig | None = None
+    ) -> None:
         self._client = FileUploadHttpClient(http)
-        self._config = FileUploadConfig()
+        self._config = config or FileUploadConfig()
+        self._poller: UploadPoller | None = None
 
     async def upload_file(
         self,
@@ -105,6 +118,8 @@ class FileUploads:
         filename: str | None = None,
         *,
         wait: bool = True,
+        max_parallel_parts: int | None = None,
+        resume: bool = False,
     ) -> FileUploadResponse:
         """Upload a file from disk.
 
@@ -116,6 +131,13 @@ class FileUploads:
             wait: If ``True``, poll until the upload reaches ``uploaded`` status
                 before returning. Set to ``False`` to return immediately after
                 sending all bytes.
+            max_parallel_parts: Parts of a multi-part upload sent concurrently.
+                Defaults to ``FileUploadConfig.max_parallel_parts``.
+            resume: Record the sent parts of a multi-part upload in a
+                ``<file>.upload.json`` manifest next to the file. A later call
+                with ``resume=True`` for the same, unchanged file continues
+                with the missing parts while Notion still holds the upload.
+                The manifest is removed once the upload is completed.
 
         Returns:
             The completed (or in-progress) :class:`~notionary.file_upload.schemas.FileUploadResponse`.
@@ -128,11 +150,7 @@ class FileUploads:
             UploadFailedError: If Notion reports the upload as failed.
             UploadTimeoutError: If the upload does not complete within the configured timeout.
         """
-        file_path = Path(file_path).resolve()
-
-        if not file_path.exists():
-            raise FileNotFoundError(str(file_path))
-
+        file_path = self._resolve_path(file_path)
         filename = filename or file_path.name
         self._validate_filename(filename)
 
@@ -140,14 +158,91 @@ class FileUploads:
         file_size = file_path.stat().st_size
 
         if self._is_single_part(file_size):
-            async with aiofiles.open(file_path, "rb") as f:
-                content = await f.read()
-            return await self._upload_single_part(content, filename, content_type, wait)
+            with UploadPart.map_file(file_path, 0, file_size) as part:
+                return await self._upload_single_part(
+                    part, filename, content_type, wait
+                )
+
+        if resume:
+            return await self._upload_resumable(
+                file_path,
+                filename,
+                content_type,
+                file_size,
+                wait,
+                max_parallel_parts=max_parallel_parts,
+            )
 
         return await self._upload_multi_part(
-            filename, content_type, file_size, self._iter_file_chunks(file_path), wait
+            filename,
+            content_type,
+            file_size,
+            self._iter_file_chunks(file_path),
+            wait,
+            max_parallel_parts=max_parallel_parts,
         )
 
+    async def upload_many(
+        self,
+        sources: Path | Iterable[Path],
+        *,
+        max_concurrency: int = 4,
+        wait: bool = True,
+    ) -> AsyncIterator[FileUploadResult]:
+        """Upload many files, yielding each result as soon as it finishes.
+
+        Every file is checked before the first request is made, so a bad
+        filename fails the whole call instead of surfacing halfway through.
+        Single-part files and the parts of multi-part files then share one
+        pool of ``max_concurrency`` slots: a slot covers creating an upload
+        or sending one body, so a large file cannot crowd out the others by
+        more than its share. All requests pass through the client's rate
+        limiter. A failing upload does not stop the others; its exception
+        is recorded on the result.
+
+        Args:
+            sources: A directory, whose non-hidden files are uploaded, or an
+                iterable of file paths.
+            max_concurrency: Upload bodies in flight at once across all files.
+            wait: See :meth:`upload_file`.
+
+        Yields:
+            A :class:`~notionary.file_upload.schemas.FileUploadResult` per file,
+            in completion order.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is less than 1.
+            FileNotFoundError: If a path does not exist.
+            FilenameTooLongError: If a filename exceeds the byte limit.
+            NoFileExtensionException: If a filename has no extension.
+            UnsupportedFileTypeException: If an extension is not supported by Notion.
+
+        Example::
+
+            async for result in notion.file_uploads.upload_many(Path("./assets")):
+                if not result.ok:
+                    print(f"{result.path}: {result.error}")
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        paths = [self._resolve_path(path) for path in self._expand_sources(sources)]
+        for path in paths:
+            self._validate_filename(path.name)
+
+        budget = asyncio.Semaphore(max_concurrency)
+        tasks = [
+            asyncio.create_task(self._upload_scheduled(path, budget, wait))
+            for path in paths
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def upload_from_bytes(
         self,
         content: bytes,
@@ -155,6 +250,7 @@ class FileUploads:
         content_type: str | None = None,
         *,
         wait: bool = True,
+        max_parallel_parts: int | None = None,
     ) -> FileUploadResponse:
         """Upload a file from an in-memory byte string.
 
@@ -163,7 +259,8 @@ class FileUploads:
             filename: Filename including extension, used for validation and
                 MIME type detection.
             content_type: Explicit MIME type. Inferred from ``filename`` if omitted.
-            wait: See :meth:`upload`.
+            wait: See :meth:`upload_file`.
+            max_parallel_parts: See :meth:`upload_file`.
 
         Returns:
             The completed (or in-progress) :class:`~notionary.file_upload.schemas.FileUploadResponse`.
@@ -184,7 +281,12 @@ class FileUploads:
             return await self._upload_single_part(content, filename, content_type, wait)
 
         return await self._upload_multi_part(
-            filename, content_type, file_size, self._iter_byte_chunks(content), wait
+            filename,
+            content_type,
+            file_size,
+            self._iter_byte_chunks(content),
+            wait,
+            max_parallel_parts=max_parallel_parts,
         )
 
     async def get(self, file_upload_id: UUID) -> FileUploadResponse:
@@ -250,56 +352,251 @@ class FileUploads:
         async for upload in self._client.list_file_uploads_stream(query):
             yield upload
 
+    async def _upload_scheduled(
+        self, file_path: Path, budget: asyncio.Semaphore, wait: bool
+    ) -> FileUploadResult:
+        try:
+            upload = await self._upload_within(file_path, budget, wait)
+        except Exception as e:
+            logger.warning("Upload of %s failed: %s", file_path, e)
+            return FileUploadResult(path=file_path, error=e)
+        return FileUploadResult(path=file_path, response=upload)
+
+    async def _upload_within(
+        self, file_path: Path, budget: asyncio.Semaphore, wait: bool
+    ) -> FileUploadResponse:
+        filename = file_path.name
+        content_type = self._guess_content_type(filename)
+        file_size = file_path.stat().st_size
+
+        if not self._is_single_part(file_size):
+            return await self._upload_multi_part(
+                filename,
+                content_type,
+                file_size,
+                self._iter_file_chunks(file_path),
+                wait,
+                window=budget,
+            )
+
+        # The file is only mapped once a slot is free, which keeps the number
+        # of open mappings bounded however many files are queued.
+        async with budget:
+            with UploadPart.map_file(file_path, 0, file_size) as part:
+                upload = await self._send_single_part(part, filename, content_type)
+        return await self._finish_upload(upload, wait)
+
     async def _upload_single_part(
-        self, content: bytes, filename: str, content_type: str | None, wait: bool
+        self,
+        content: bytes | UploadPart,
+        filename: str,
+        content_type: str | None,
+        wait: bool,
+    ) -> FileUploadResponse:
+        upload = await self._send_single_part(content, filename, content_type)
+        return await self._finish_upload(upload, wait)
+
+    async def _send_single_part(
+        self, content: bytes | UploadPart, filename: str, content_type: str | None
     ) -> FileUploadResponse:
         upload = await self._client.create_single_part_upload(filename, content_type)
         await self._client.send_file_content(upload.id, content, filename)
-
-        if not wait:
-            return upload
-
-        logger.info(
-            "Single-part upload sent, waiting for completion... (ID: %s)", upload.id
-        )
-        return await self._wait_for_completion(upload.id)
+        return upload
 
     async def _upload_multi_part(
         self,
         filename: str,
         content_type: str | None,
         file_size: int,
-        chunks: AsyncGenerator[bytes],
+        chunks: AsyncGenerator[tuple[int, UploadPart]],
         wait: bool,
+        *,
+        max_parallel_parts: int | None = None,
+        window: asyncio.Semaphore | None = None,
     ) -> FileUploadResponse:
-        part_count = self._calculate_part_count(file_size)
-        upload = await self._client.create_multi_part_upload(
-            filename, part_count, content_type
+        window = window or asyncio.Semaphore(
+            max_parallel_parts or self._config.max_parallel_parts
         )
+        part_count = self._calculate_part_count(file_size)
+        async with window:
+            upload = await self._client.create_multi_part_upload(
+                filename, part_count, content_type
+            )
 
-        part_number = 1
-        try:
-            async for chunk in chunks:
-                await self._client.send_file_content(
-                    upload.id, chunk, filename, part_number
+        await self._send_parts(upload.id, filename, chunks, part_count, window)
+        await self._client.complete_upload(upload.id)
+        return await self._finish_upload(upload, wait)
+
+    async def _upload_resumable(
+        self,
+        file_path: Path,
+        filename: str,
+        content_type: str | None,
+        file_size: int,
+        wait: bool,
+        *,
+        max_parallel_parts: int | None = None,
+    ) -> FileUploadResponse:
+        manifest_path = self._manifest_path(file_path)
+        part_size = self._config.multi_part_chunk_size
+
+        resumed = await self._load_manifest(
+            manifest_path, file_path, filename, part_size
+        )
+        if resumed is not None:
+            manifest, upload = resumed
+            writer = ManifestWriter(manifest, manifest_path)
+            logger.info(
+                "Resuming upload %s with %d/%d parts already sent",
+                upload.id,
+                len(manifest.completed_parts),
+                manifest.part_count,
+            )
+        else:
+            # Only needed once the manifest is first written, so the file is
+            # hashed in the background while the first parts are sent.
+            checksum = asyncio.create_task(asyncio.to_thread(file_checksum, file_path))
+            part_count = self._calculate_part_count(file_size)
+            try:
+                upload = await self._client.create_multi_part_upload(
+                    filename, part_count, content_type
                 )
-                logger.debug("Uploaded part %d/%d", part_number, part_count)
-                part_number += 1
-        except Exception as e:
-            raise UploadFailedError(
-                upload.id, reason=f"Failed on part {part_number}/{part_count}: {e}"
-            ) from e
+            except BaseException:
+                checksum.cancel()
+                raise
+            manifest = UploadManifest(
+                upload_id=upload.id,
+                filename=filename,
+                checksum="",
+                part_size=part_size,
+                part_count=part_count,
+                expiry_time=upload.expiry_time,
+            )
+            writer = ManifestWriter(manifest, manifest_path, checksum)
 
+        try:
+            await self._send_parts(
+                upload.id,
+                filename,
+                self._iter_file_chunks(
+                    file_path, skip=frozenset(manifest.completed_parts)
+                ),
+                manifest.part_count,
+                asyncio.Semaphore(
+                    max_parallel_parts or self._config.max_parallel_parts
+                ),
+                on_part_sent=writer.record,
+            )
+        finally:
+            await writer.close()
         await self._client.complete_upload(upload.id)
+        manifest_path.unlink(missing_ok=True)
+        return await self._finish_upload(upload, wait)
+
+    async def _load_manifest(
+        self, manifest_path: Path, file_path: Path, filename: str, part_size: int
+    ) -> tuple[UploadManifest, FileUploadResponse] | None:
+        manifest = await asyncio.to_thread(UploadManifest.load, manifest_path)
+        if manifest is None:
+            return None
+        checksum = await asyncio.to_thread(file_checksum, file_path)
+        if not manifest.matches(filename, checksum, part_size):
+            logger.info(
+                "File changed since %s was written, starting over", manifest_path
+            )
+            return None
+        if manifest.is_expired():
+            logger.info("Upload %s has expired, starting over", manifest.upload_id)
+            return None
+
+        try:
+            upload = await self._client.get_file_upload(manifest.upload_id)
+        except httpx.HTTPStatusError as e:
+            logger.info("Upload %s is gone (%s), starting over", manifest.upload_id, e)
+            return None
+        if upload.status != FileUploadStatus.PENDING:
+            logger.info(
+                "Upload %s is %s, starting over", manifest.upload_id, upload.status
+            )
+            return None
+        return manifest, upload
 
+    async def _finish_upload(
+        self, upload: FileUploadResponse, wait: bool
+    ) -> FileUploadResponse:
         if not wait:
             return upload
 
-        logger.info(
-            "Multi-part upload sent, waiting for completion... (ID: %s)", upload.id
-        )
+        logger.info("Upload sent, waiting for completion... (ID: %s)", upload.id)
         return await self._wait_for_completion(upload.id)
 
+    async def _send_parts(
+        self,
+        upload_id: UUID,
+        filename: str,
+        chunks: AsyncGenerator[tuple[int, UploadPart]],
+        part_count: int,
+        window: asyncio.Semaphore,
+        *,
+        on_part_sent: Callable[[int], None] | None = None,
+    ) -> None:
+        # A slot is taken before the next chunk is read, so no more chunks
+        # are in memory than the window has slots.
+
+        async def send(part_number: int, chunk: UploadPart) -> None:
+            try:
+                await self._send_part(
+                    upload_id, chunk, filename, part_number, part_count
+                )
+            finally:
+                chunk.close()
+                window.release()
+            if on_part_sent is not None:
+                on_part_sent(part_number)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                while True:
+                    await window.acquire()
+                    part = await anext(chunks, None)
+                    if part is None:
+                        window.release()
+                        break
+                    group.create_task(send(*part))
+        except ExceptionGroup as group_error:
+            failures = group_error.exceptions
+            if len(failures) == 1:
+                raise failures[0] from failures[0].__cause__
+            # Every failure stays reachable through the chained group.
+            raise UploadFailedError(
+                upload_id,
+                reason=f"{len(failures)} of {part_count} parts failed, "
+                f"first: {failures[0]}",
+            ) from group_error
+        finally:
+            await chunks.aclose()
+
+    async def _send_part(
+        self,
+        upload_id: UUID,
+        chunk: UploadPart,
+        filename: str,
+        part_number: int,
+        part_count: int,
+    ) -> None:
+        # Transient errors were already retried by the HTTP client, since a
+        # numbered part can safely be sent twice. Anything left is final.
+        try:
+            await self._client.send_file_content(
+                upload_id, chunk, filename, part_number
+            )
+        except Exception as e:
+            raise UploadFailedError(
+                upload_id,
+                reason=f"Failed on part {part_number}/{part_count}: {e}",
+            ) from e
+        logger.debug("Uploaded part %d/%d", part_number, part_count)
+
     async def _wait_for_completion(self, file_upload_id: UUID) -> FileUploadResponse:
         try:
             return await asyncio.wait_for(
@@ -312,24 +609,50 @@ class FileUploads:
             ) from e
 
     async def _poll_until_complete(self, file_upload_id: UUID) -> FileUploadResponse:
-        while True:
-            upload = await self._client.get_file_upload(file_upload_id)
-            if upload.status == FileUploadStatus.UPLOADED:
-                logger.info("Upload completed: %s", file_upload_id)
-                return upload
-            if upload.status == FileUploadStatus.FAILED:
-                raise UploadFailedError(file_upload_id)
-            await asyncio.sleep(self._config.poll_interval)
-
-    async def _iter_file_chunks(self, file_path: Path) -> AsyncGenerator[bytes]:
-        async with aiofiles.open(file_path, "rb") as f:
-            while chunk := await f.read(self._config.multi_part_chunk_size):
-                yield chunk
-
-    async def _iter_byte_chunks(self, content: bytes) -> AsyncGenerator[bytes]:
+        # Created on first use, so it sees the client and config in effect then.
+        if self._poller is None:
+            self._poller = UploadPoller(self._client, self._config)
+        upload = await self._poller.wait(file_upload_id)
+        logger.info("Upload completed: %s", file_upload_id)
+        return upload
+
+    async def _iter_file_chunks(
+        self, file_path: Path, skip: frozenset[int] = frozenset()
+    ) -> AsyncGenerator[tuple[int, UploadPart]]:
+        size = self._config.multi_part_chunk_size
+        file_size = file_path.stat().st_size
+        for part_number, offset in enumerate(range(0, file_size, size), start=1):
+            if part_number not in skip:
+                length = min(size, file_size - offset)
+                yield part_number, UploadPart.map_file(file_path, offset, length)
+
+    async def _iter_byte_chunks(
+        self, content: bytes
+    ) -> AsyncGenerator[tuple[int, UploadPart]]:
         size = self._config.multi_part_chunk_size
-        for i in range(0, len(content), size):
-            yield content[i : i + size]
+        for part_number, i in enumerate(range(0, len(content), size), start=1):
+            yield part_number, UploadPart.from_bytes(content, i, i + size)
+
+    def _expand_sources(self, sources: Path | Iterable[Path]) -> list[Path]:
+        if isinstance(sources, str | os.PathLike):
+            directory = Path(sources)
+            if directory.is_dir():
+                return sorted(
+                    path
+                    for path in directory.iterdir()
+                    if path.is_file() and not path.name.startswith(".")
+                )
+            return [directory]
+        return [Path(path) for path in sources]
+
+    def _resolve_path(self, file_path: Path) -> Path:
+        file_path = Path(file_path).resolve()
+        if not file_path.exists():
+            raise FileNotFoundError(str(file_path))
+        return file_path
+
+    def _manifest_path(self, file_path: Path) -> Path:
+        return file_path.with_name(f"{file_path.name}.upload.json")
 
     def _is_single_part(self, file_size: int) -> bool:
         return file_size <= self._config._SINGLE_PART_MAX_SIZE
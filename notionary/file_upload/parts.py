@@ -0,0 +1,95 @@
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import Self
+
+
+class UploadPart(io.RawIOBase):
+    """Read-only, seekable window onto one part of an upload.
+
+    httpx streams file-like objects in 64 KB blocks, so a part is handed to
+    the request without ever being copied as a whole. Parts of files on disk
+    map only their own byte range, and :meth:`close` unmaps it again, which
+    keeps the resident memory of an upload bounded by the parts in flight.
+    """
+
+    def __init__(
+        self, buffer: bytes | mmap.mmap, start: int = 0, stop: int | None = None
+    ) -> None:
+        super().__init__()
+        self._buffer = buffer
+        self._start = start
+        self._stop = len(buffer) if stop is None else min(stop, len(buffer))
+        self._pos = start
+
+    @classmethod
+    def from_bytes(
+        cls, content: bytes, start: int = 0, stop: int | None = None
+    ) -> Self:
+        """Wrap a slice of *content* without copying it."""
+        return cls(content, start, stop)
+
+    @classmethod
+    def map_file(cls, path: Path, offset: int, length: int) -> Self:
+        """Memory-map ``length`` bytes of *path* starting at *offset*."""
+        if length == 0:
+            return cls(b"")
+        # mmap offsets must be aligned, so the mapping may start a little early.
+        lead = offset % mmap.ALLOCATIONGRANULARITY
+        with path.open("rb") as f:
+            mapped = mmap.mmap(
+                f.fileno(), lead + length, access=mmap.ACCESS_READ, offset=offset - lead
+            )
+        return cls(mapped, lead)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._pos - self._start
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._check_open()
+        base = {
+            os.SEEK_SET: self._start,
+            os.SEEK_CUR: self._pos,
+            os.SEEK_END: self._stop,
+        }[whence]
+        self._pos = min(max(base + offset, self._start), self._stop)
+        return self._pos - self._start
+
+    def read(self, size: int | None = -1) -> bytes:
+        self._check_open()
+        end = (
+            self._stop
+            if size is None or size < 0
+            else min(self._pos + size, self._stop)
+        )
+        data = self._buffer[self._pos : end]
+        self._pos = end
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        super().close()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed upload part")
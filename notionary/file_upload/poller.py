@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import math
+from uuid import UUID
+
+from notionary.file_upload.client import FileUploadHttpClient
+from notionary.file_upload.exceptions import UploadFailedError
+from notionary.file_upload.schemas import (
+    FileUploadConfig,
+    FileUploadQuery,
+    FileUploadResponse,
+    FileUploadStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class UploadPoller:
+    """Waits for sent file uploads to be processed, sharing requests between them.
+
+    Every waiter checks right away and then backs off from
+    ``poll_initial_interval`` to ``poll_interval``. Checks are aligned to
+    multiples of the current wait, so uploads that reached the same step
+    check at the same moment, and all checks that fall due together are
+    answered by one sweep. Uploads are fetched one by one, unless more are due
+    than a listing of pending uploads takes pages. Then they are matched
+    against that listing, and only those that left it are fetched again to
+    read their final status.
+    """
+
+    _COALESCE_WINDOW = 0.05
+    _SWEEP_LIMIT = 500
+    # The listing is paginated in pages of 100 uploads.
+    _SWEEP_PAGES = _SWEEP_LIMIT // 100
+
+    def __init__(self, client: FileUploadHttpClient, config: FileUploadConfig) -> None:
+        self._client = client
+        self._config = config
+        self._due: dict[UUID, list[asyncio.Future[FileUploadResponse]]] = {}
+        self._sweep_task: asyncio.Task[None] | None = None
+
+    async def wait(self, upload_id: UUID) -> FileUploadResponse:
+        """Return the upload once Notion reports it as ``uploaded``.
+
+        Raises:
+            UploadFailedError: If Notion reports the upload as failed.
+        """
+        loop = asyncio.get_running_loop()
+        delay = self._config.poll_initial_interval
+        while True:
+            upload = await self.check(upload_id)
+            if upload.status == FileUploadStatus.UPLOADED:
+                return upload
+            if upload.status == FileUploadStatus.FAILED:
+                raise UploadFailedError(upload_id)
+
+            now = loop.time()
+            await asyncio.sleep((math.floor(now / delay) + 1) * delay - now)
+            delay = min(delay * self._config.poll_backoff, self._config.poll_interval)
+
+    async def check(self, upload_id: UUID) -> FileUploadResponse:
+        """Return the current state of an upload from the next sweep."""
+        future = asyncio.get_running_loop().create_future()
+        self._due.setdefault(upload_id, []).append(future)
+        if self._sweep_task is None:
+            self._sweep_task = asyncio.create_task(self._sweep())
+        return await future
+
+    async def _sweep(self) -> None:
+        due: dict[UUID, list[asyncio.Future[FileUploadResponse]]] = {}
+        try:
+            # Give checks that fall due at (almost) the same moment a chance
+            # to join.
+            await asyncio.sleep(self._COALESCE_WINDOW)
+            due, self._due = self._due, {}
+            self._sweep_task = None
+
+            results = await self._fetch(set(due))
+            for upload_id, futures in due.items():
+                result = results[upload_id]
+                for future in futures:
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        except Exception as e:
+            for futures in due.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+        finally:
+            if self._sweep_task is asyncio.current_task():
+                # Cancelled before the due checks were taken over.
+                due, self._due = self._due, {}
+                self._sweep_task = None
+            # Only reached with unresolved futures when the sweep itself was
+            # cancelled; their waiters must not hang.
+            for futures in due.values():
+                for future in futures:
+                    future.cancel()
+
+    async def _fetch(
+        self, upload_ids: set[UUID]
+    ) -> dict[UUID, FileUploadResponse | BaseException]:
+        results: dict[UUID, FileUploadResponse | BaseException] = {}
+        # A listing costs up to _SWEEP_PAGES requests and still misses every
+        # upload that has finished, so it only pays off for larger sweeps.
+        if len(upload_ids) > self._SWEEP_PAGES:
+            try:
+                results.update(await self._list_pending(upload_ids))
+            except Exception:
+                logger.warning(
+                    "Listing pending uploads failed, checking them one by one",
+                    exc_info=True,
+                )
+
+        # Uploads missing from the listing have finished (or lie beyond the
+        # sweep limit), so they are fetched one by one.
+        left = [upload_id for upload_id in upload_ids if upload_id not in results]
+        logger.debug(
+            "Checked %d uploads with a listing, fetching %d",
+            len(results),
+            len(left),
+        )
+        fetched = await asyncio.gather(
+            *(self._client.get_file_upload(upload_id) for upload_id in left),
+            return_exceptions=True,
+        )
+        results.update(zip(left, fetched, strict=True))
+        return results
+
+    async def _list_pending(
+        self, upload_ids: set[UUID]
+    ) -> dict[UUID, FileUploadResponse]:
+        uploads: dict[UUID, FileUploadResponse] = {}
+        query = FileUploadQuery(
+            status=FileUploadStatus.PENDING,
+            total_results_limit=self._SWEEP_LIMIT,
+        )
+        # The stream ends by itself once the listing is exhausted.
+        async for upload in self._client.list_file_uploads_stream(query):
+            if upload.id in upload_ids:
+                uploads[upload.id] = upload
+                if len(uploads) == len(upload_ids):
+                    break
+        return uploads
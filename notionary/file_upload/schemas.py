@@ -29,8 +29,28 @@ class FileUploadConfig(BaseModel):
         le=_CHUNK_SIZE_MAX,
         description="Part size (in bytes) for multi-part uploads. Notion allows 5MB–20MB.",
     )
+    max_parallel_parts: int = Field(
+        default=4,
+        ge=1,
+        description="Parts of a multi-part upload sent at the same time. "
+        "At most this many parts are held in memory.",
+    )
     max_upload_timeout: int = Field(default=300, gt=0)
-    poll_interval: int = Field(default=2, gt=0)
+    poll_initial_interval: float = Field(
+        default=0.25,
+        gt=0,
+        description="Wait before the second status check of a sent upload.",
+    )
+    poll_interval: float = Field(
+        default=2,
+        gt=0,
+        description="Longest wait between two status checks.",
+    )
+    poll_backoff: float = Field(
+        default=2,
+        ge=1,
+        description="Factor the wait grows by after every pending check.",
+    )
     base_upload_path: Path | None = Field(default=None)
 
 
@@ -144,3 +164,17 @@ class FileUploadQuery(BaseModel):
             result["in_trash"] = self.in_trash
 
         return result
+
+
+class FileUploadResult(BaseModel):
+    """Outcome of one file sent by :meth:`~notionary.file_upload.FileUploads.upload_many`."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    path: Path
+    response: FileUploadResponse | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -1,5 +1,32 @@
+from .cache import CacheBackend, CachePolicy, MemoryCache, ResponseCache, SQLiteCache
 from .client import HttpClient
+from .hooks import HttpHook, RequestScope, StatsCollector, endpoint_template
+from .schemas import (
+    EndpointStats,
+    HttpStats,
+    RateLimitConfig,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+    TransportConfig,
+)
 
 __all__ = [
+    "CacheBackend",
+    "CachePolicy",
+    "EndpointStats",
     "HttpClient",
+    "HttpHook",
+    "HttpStats",
+    "MemoryCache",
+    "RateLimitConfig",
+    "RequestEvent",
+    "RequestScope",
+    "ResponseCache",
+    "ResponseEvent",
+    "RetryEvent",
+    "SQLiteCache",
+    "StatsCollector",
+    "TransportConfig",
+    "endpoint_template",
 ]
@@ -0,0 +1,227 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+T = TypeVar("T")
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    def delete_prefix(self, prefix: str) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class MemoryCache:
+    """In-process LRU cache whose entries expire after their TTL."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+    def close(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache:
+    """On-disk cache that survives restarts, e.g. between agent sessions.
+
+    Expired rows are never returned and are deleted in bulk at most once per
+    *purge_interval* seconds. :class:`ResponseCache` runs every call in a
+    worker thread, since each one may wait on disk I/O.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str | Path, purge_interval: float = 300.0) -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._purge_interval = purge_interval
+        self._next_purge = time.time() + purge_interval
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at "
+                "ON responses (expires_at)"
+            )
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, value, now + ttl),
+            )
+            if now >= self._next_purge:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE expires_at <= ?", (now,)
+                )
+                self._next_purge = now + self._purge_interval
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_DEFAULT_TTLS: dict[str, float] = {
+    "data_sources/{id}": 300.0,
+    "databases/{id}": 300.0,
+    "users": 3600.0,
+    "users/{id}": 3600.0,
+}
+
+
+class CachePolicy(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    ttls: dict[str, float] = Field(
+        default_factory=lambda: dict(_DEFAULT_TTLS),
+        description="Seconds to cache each endpoint template. A ``{...}`` "
+        "segment matches any single path segment, e.g. ``users/{id}``.",
+    )
+    default_ttl: float | None = Field(
+        default=None,
+        gt=0,
+        description="TTL for GET endpoints not listed in ``ttls``. "
+        "``None`` leaves them uncached.",
+    )
+    versioned_ttl: float = Field(
+        default=86400.0,
+        gt=0,
+        description="TTL for responses fetched with a ``version`` such as "
+        "``last_edited_time``. A changed version never hits a stale entry, "
+        "so this only bounds how long unused entries are kept.",
+    )
+
+    def ttl_for(self, path: str) -> float | None:
+        segments = path.strip("/").split("/")
+        for template, ttl in self.ttls.items():
+            if _matches(template.strip("/").split("/"), segments):
+                return ttl
+        return self.default_ttl
+
+
+def _matches(template: list[str], segments: list[str]) -> bool:
+    return len(template) == len(segments) and all(
+        t == s or (t.startswith("{") and t.endswith("}"))
+        for t, s in zip(template, segments, strict=True)
+    )
+
+
+class ResponseCache:
+    """Caches raw GET response bodies according to a :class:`CachePolicy`.
+
+    Entries for a resource are dropped as soon as the owning client sends a
+    ``PATCH`` or ``DELETE`` to the same path. Each invalidation also stamps
+    the resource with a new generation, so a GET that was already in flight
+    can tell that its response may predate the write and must not be stored.
+    Backends that declare ``blocking = True`` are called from a worker thread.
+    """
+
+    _MAX_TRACKED_INVALIDATIONS = 4096
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        policy: CachePolicy | None = None,
+    ) -> None:
+        self.backend = backend or MemoryCache()
+        self.policy = policy or CachePolicy()
+        self._blocking = getattr(self.backend, "blocking", False)
+        self._generation = 0
+        self._invalidated: OrderedDict[str, int] = OrderedDict()
+        # Generation of the newest stamp dropped from ``_invalidated``. A
+        # resource that is no longer tracked is assumed to have changed then.
+        self._forgotten = 0
+
+    def ttl_for(self, path: str) -> float | None:
+        return self.policy.ttl_for(path)
+
+    def generation(self) -> int:
+        """Return a token to pass to :meth:`set` for a request about to start."""
+        return self._generation
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._call(self.backend.get, key)
+
+    async def set(
+        self, key: str, value: bytes, ttl: float, generation: int | None = None
+    ) -> None:
+        """Store *value* unless its resource was invalidated since *generation*."""
+        if generation is not None and self._invalidated_since(key, generation):
+            return
+        await self._call(self.backend.set, key, value, ttl)
+
+    async def invalidate(self, url: str) -> None:
+        self._generation += 1
+        self._invalidated[url] = self._generation
+        self._invalidated.move_to_end(url)
+        if len(self._invalidated) > self._MAX_TRACKED_INVALIDATIONS:
+            _, self._forgotten = self._invalidated.popitem(last=False)
+        await self._call(self.backend.delete_prefix, f"{url}?")
+
+    async def close(self) -> None:
+        await self._call(self.backend.close)
+
+    def _invalidated_since(self, key: str, generation: int) -> bool:
+        url = key.split("?", 1)[0]
+        return self._invalidated.get(url, self._forgotten) > generation
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        if self._blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
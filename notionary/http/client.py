@@ -1,141 +1,633 @@
+import asyncio
+import contextlib
+import hashlib
 import logging
-from collections.abc import AsyncGenerator
-from typing import Any
+import random
+import time
+from collections.abc import AsyncGenerator, Sequence
+from typing import Any, TypeVar, overload
+from urllib.parse import urlencode
 
 import httpx
 from pydantic import BaseModel
 
-from notionary.http.schemas import PaginatedResponse
+from notionary.http.cache import ResponseCache
+from notionary.http.codec import JsonCodec, default_codec
+from notionary.http.hooks import HttpHook, endpoint_template
+from notionary.http.rate_limiter import shared_rate_limiter
+from notionary.http.schemas import (
+    HttpStats,
+    PaginatedResponse,
+    RateLimitConfig,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+    TransportConfig,
+)
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+ItemT = TypeVar("ItemT")
+
 
 class HttpClient:
     _BASE_URL = "https://api.notion.com/v1"
     _NOTION_VERSION = "2026-03-11"
+    _RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    _IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+    # Raised before any byte of the request reached Notion, so a retry
+    # cannot apply the same write twice.
+    _UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    _MAX_PAGE_SIZE = 100
 
-    def __init__(self, token: str, timeout: int = 30) -> None:
+    def __init__(
+        self,
+        token: str,
+        timeout: int = 30,
+        *,
+        rate_limit: RateLimitConfig | None = None,
+        transport: TransportConfig | None = None,
+        codec: JsonCodec | None = None,
+        coalesce_gets: bool = True,
+        cache: ResponseCache | None = None,
+        hooks: Sequence[HttpHook] = (),
+    ) -> None:
+        transport = transport or TransportConfig()
         self._client = httpx.AsyncClient(
             headers={
                 "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
                 "Notion-Version": self._NOTION_VERSION,
             },
-            timeout=timeout,
+            timeout=transport.build_timeout(timeout),
+            transport=transport.build_transport(),
         )
+        self._rate_limit = rate_limit or RateLimitConfig()
+        self._rate_limiter = shared_rate_limiter(token, self._rate_limit)
+        self._codec = codec or default_codec()
+        self._coalesce_gets = coalesce_gets
+        self._inflight_gets: dict[str, asyncio.Future[httpx.Response]] = {}
+        self._cache = cache
+        # Keeps entries of different integrations apart in a shared backend.
+        self._cache_scope = hashlib.sha256(token.encode()).hexdigest()[:16]
+        self._hooks = list(hooks)
+        self.stats = HttpStats()
 
     async def close(self) -> None:
         await self._client.aclose()
 
+    @overload
     async def get(
-        self, endpoint: str, params: dict[str, Any] | None = None
-    ) -> dict[str, Any]:
-        return await self._request("GET", endpoint, params=params)
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        version: str | None = None,
+    ) -> dict[str, Any]: ...
+    @overload
+    async def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        response_model: type[ModelT],
+        version: str | None = None,
+    ) -> ModelT: ...
+
+    async def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        response_model: type[ModelT] | None = None,
+        version: str | None = None,
+    ) -> dict[str, Any] | ModelT:
+        """Send a GET request.
 
+        When a cache is configured and *version* is given (typically the
+        resource's ``last_edited_time``), the response is cached under that
+        version regardless of the endpoint's TTL policy. A later call with the
+        same version is answered from the cache; a new version misses and
+        refetches.
+        """
+        return await self._request(
+            "GET", endpoint, response_model, version=version, params=params
+        )
+
+    @overload
     async def post(
         self,
         endpoint: str,
         data: BaseModel | dict[str, Any] | None = None,
         *,
         exclude_unset: bool = False,
-    ) -> dict[str, Any]:
+        params: dict[str, Any] | None = None,
+        idempotent: bool = False,
+    ) -> dict[str, Any]: ...
+    @overload
+    async def post(
+        self,
+        endpoint: str,
+        data: BaseModel | dict[str, Any] | None = None,
+        *,
+        exclude_unset: bool = False,
+        params: dict[str, Any] | None = None,
+        idempotent: bool = False,
+        response_model: type[ModelT],
+    ) -> ModelT: ...
+
+    async def post(
+        self,
+        endpoint: str,
+        data: BaseModel | dict[str, Any] | None = None,
+        *,
+        exclude_unset: bool = False,
+        params: dict[str, Any] | None = None,
+        idempotent: bool = False,
+        response_model: type[ModelT] | None = None,
+    ) -> dict[str, Any] | ModelT:
+        """Send a POST request.
+
+        A POST is only retried after a throttling response or a failure to
+        connect, because a retry after a timeout or server error could apply
+        the write twice. Pass ``idempotent=True`` for reads such as queries,
+        or writes that are safe to repeat, to retry those failures as well.
+        """
         return await self._request(
-            "POST", endpoint, json=self._serialize(data, exclude_unset)
+            "POST",
+            endpoint,
+            response_model,
+            idempotent=idempotent,
+            content=self._serialize(data, exclude_unset),
+            params=params or None,
         )
 
     async def post_multipart(
-        self, endpoint: str, files: dict[str, Any], data: dict[str, Any] | None = None
+        self,
+        endpoint: str,
+        files: dict[str, Any],
+        data: dict[str, Any] | None = None,
+        *,
+        idempotent: bool = False,
     ) -> dict[str, Any]:
         url = f"{self._BASE_URL}/{endpoint.lstrip('/')}"
         logger.debug("POST multipart %s", url)
-        response = await self._client.post(url, files=files, data=data)
-        response.raise_for_status()
-        return response.json()
+        response = await self._send(
+            "POST", url, idempotent=idempotent, files=files, data=data
+        )
+        return self._codec.decode(response.content)
 
+    @overload
     async def patch(
         self,
         endpoint: str,
         data: BaseModel | dict[str, Any] | None = None,
         *,
         exclude_unset: bool = False,
-    ) -> dict[str, Any]:
+        idempotent: bool = False,
+    ) -> dict[str, Any]: ...
+    @overload
+    async def patch(
+        self,
+        endpoint: str,
+        data: BaseModel | dict[str, Any] | None = None,
+        *,
+        exclude_unset: bool = False,
+        idempotent: bool = False,
+        response_model: type[ModelT],
+    ) -> ModelT: ...
+
+    async def patch(
+        self,
+        endpoint: str,
+        data: BaseModel | dict[str, Any] | None = None,
+        *,
+        exclude_unset: bool = False,
+        idempotent: bool = False,
+        response_model: type[ModelT] | None = None,
+    ) -> dict[str, Any] | ModelT:
+        """Send a PATCH request. Retries follow the rules of :meth:`post`."""
         return await self._request(
-            "PATCH", endpoint, json=self._serialize(data, exclude_unset)
+            "PATCH",
+            endpoint,
+            response_model,
+            idempotent=idempotent,
+            content=self._serialize(data, exclude_unset),
         )
 
     async def delete(self, endpoint: str) -> dict[str, Any]:
         return await self._request("DELETE", endpoint)
 
-    @staticmethod
     def _serialize(
-        data: BaseModel | dict[str, Any] | None, exclude_unset: bool
-    ) -> dict[str, Any] | None:
+        self, data: BaseModel | dict[str, Any] | None, exclude_unset: bool
+    ) -> bytes | None:
         if data is None:
             return None
         if isinstance(data, BaseModel):
-            return data.model_dump(
-                exclude_none=True, exclude_unset=exclude_unset, mode="json"
-            )
-        return data
+            return data.model_dump_json(
+                exclude_none=True, exclude_unset=exclude_unset
+            ).encode()
+        return self._codec.encode(data)
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> dict[str, Any]:
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        response_model: type[ModelT] | None = None,
+        version: str | None = None,
+        idempotent: bool = False,
+        **kwargs,
+    ) -> dict[str, Any] | ModelT:
         url = f"{self._BASE_URL}/{endpoint.lstrip('/')}"
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
         logger.debug("%s %s", method, url)
-        response = await self._client.request(method, url, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        if method == "GET":
+            content = await self._get_content(endpoint, url, version, **kwargs)
+        else:
+            response = await self._send(method, url, idempotent=idempotent, **kwargs)
+            content = response.content
+            if method in {"PATCH", "DELETE"}:
+                await self._invalidate(url)
+        if response_model is not None:
+            # pydantic-core parses and validates the raw bytes in a single pass.
+            return response_model.model_validate_json(content)
+        return self._codec.decode(content)
+
+    async def _get_content(
+        self, endpoint: str, url: str, version: str | None, **kwargs
+    ) -> bytes:
+        key = self._request_key(url, kwargs.get("params"))
+        cache_key = f"{key}#{version}" if version else key
+        ttl = self._cache_ttl(endpoint, version)
+        if ttl is not None:
+            generation = self._cache.generation()
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+
+        if self._coalesce_gets:
+            response = await self._send_single_flight(key, url, **kwargs)
+        else:
+            response = await self._send("GET", url, **kwargs)
+
+        if ttl is not None:
+            await self._cache.set(cache_key, response.content, ttl, generation)
+        return response.content
+
+    async def _invalidate(self, url: str) -> None:
+        resource = f"{self._cache_scope}:{url}"
+        # A GET still in flight may have been answered before the write, so
+        # later reads must not join it.
+        for key in [k for k in self._inflight_gets if k.startswith(f"{resource}?")]:
+            del self._inflight_gets[key]
+        if self._cache is not None:
+            await self._cache.invalidate(resource)
+
+    def _cache_ttl(self, endpoint: str, version: str | None) -> float | None:
+        if self._cache is None:
+            return None
+        if version:
+            return self._cache.policy.versioned_ttl
+        return self._cache.ttl_for(endpoint)
+
+    async def _send_single_flight(self, key: str, url: str, **kwargs) -> httpx.Response:
+        """Send a GET, joining an identical request that is already in flight.
 
+        Every caller decodes the shared response itself, so nobody can see
+        another caller's mutations of the returned payload.
+        """
+        inflight = self._inflight_gets.get(key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._send("GET", url, **kwargs))
+        self._inflight_gets[key] = task
+        task.add_done_callback(lambda _: self._forget_inflight(key, task))
+        # Shielded so that one cancelled caller does not fail the others.
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: asyncio.Future[httpx.Response]) -> None:
+        if self._inflight_gets.get(key) is task:
+            del self._inflight_gets[key]
+        # If every waiter was cancelled, nobody reads the error. Mark it as
+        # retrieved so asyncio does not log "exception was never retrieved".
+        if not task.cancelled():
+            task.exception()
+
+    def _request_key(self, url: str, params: dict[str, Any] | None) -> str:
+        query = urlencode(sorted(httpx.QueryParams(params or {}).multi_items()))
+        return f"{self._cache_scope}:{url}?{query}"
+
+    async def _send(
+        self, method: str, url: str, *, idempotent: bool = False, **kwargs
+    ) -> httpx.Response:
+        # Throttled requests were never processed and are always retried.
+        # Timeouts, dropped connections and server errors may have happened
+        # after Notion applied the request, so only safe requests retry them.
+        retry_safe = idempotent or method in self._IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            await self._rate_limiter.acquire()
+            self.stats.requests += 1
+            fields = (
+                self._event_fields(method, url, attempt, kwargs)
+                if self._hooks
+                else None
+            )
+            self._notify_request(fields)
+            started_at, start = time.time(), time.perf_counter()
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                self._notify_response(fields, started_at, start, error=e)
+                unsent = isinstance(e, self._UNSENT_ERRORS)
+                if attempt >= self._rate_limit.max_retries or not (
+                    retry_safe or unsent
+                ):
+                    raise
+                delay = self._backoff_delay(attempt)
+                reason, throttled = type(e).__name__, False
+                logger.warning(
+                    "%s %s failed (%s), retrying in %.2fs", method, url, e, delay
+                )
+            else:
+                self._notify_response(fields, started_at, start, response=response)
+                status = response.status_code
+                throttled = status == 429
+                if throttled:
+                    self.stats.throttled += 1
+                if (
+                    status not in self._RETRYABLE_STATUS_CODES
+                    or attempt >= self._rate_limit.max_retries
+                    or not (throttled or retry_safe)
+                ):
+                    response.raise_for_status()
+                    return response
+
+                delay = self._backoff_delay(attempt)
+                if throttled:
+                    delay = self._retry_after(response) or delay
+                reason = str(status)
+                logger.warning(
+                    "%s %s returned %d, retrying in %.2fs", method, url, status, delay
+                )
+
+            self._notify_retry(fields, delay, reason)
+            if throttled:
+                # Throttling applies to the whole token, so the shared
+                # limiter holds back every caller until Notion is ready.
+                self._rate_limiter.pause(delay)
+                delay = 0.0
+
+            self.stats.retried += 1
+            attempt += 1
+            if delay:
+                await asyncio.sleep(delay)
+
+    def _notify_request(self, fields: dict[str, Any] | None) -> None:
+        if fields is not None:
+            self._dispatch("on_request", RequestEvent(**fields))
+
+    def _notify_retry(
+        self, fields: dict[str, Any] | None, delay: float, reason: str
+    ) -> None:
+        if fields is not None:
+            self._dispatch("on_retry", RetryEvent(**fields, delay=delay, reason=reason))
+
+    def _notify_response(
+        self,
+        fields: dict[str, Any] | None,
+        started_at: float,
+        start: float,
+        *,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        if fields is None:
+            return
+        event = ResponseEvent(
+            **fields,
+            status_code=response.status_code if response is not None else None,
+            started_at=started_at,
+            duration=time.perf_counter() - start,
+            response_bytes=len(response.content) if response is not None else 0,
+            error=type(error).__name__ if error is not None else None,
+        )
+        self._dispatch("on_response", event)
+
+    def _event_fields(
+        self, method: str, url: str, attempt: int, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "method": method,
+            "url": url,
+            "endpoint": endpoint_template(url.removeprefix(self._BASE_URL)),
+            "attempt": attempt,
+            "request_bytes": len(kwargs.get("content") or b""),
+        }
+
+    def _dispatch(self, callback: str, event: RequestEvent) -> None:
+        for hook in self._hooks:
+            try:
+                getattr(hook, callback)(event)
+            except Exception:
+                logger.exception("HTTP hook %r failed in %s", hook, callback)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        ceiling = min(
+            self._rate_limit.backoff_max,
+            self._rate_limit.backoff_base * 2**attempt,
+        )
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float | None:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    @overload
     async def paginate(
         self,
         endpoint: str,
         total_results_limit: int | None = None,
+        *,
+        item_model: None = None,
+        query_params: dict[str, Any] | None = None,
         **kwargs,
-    ) -> list[Any]:
+    ) -> list[Any]: ...
+    @overload
+    async def paginate(
+        self,
+        endpoint: str,
+        total_results_limit: int | None = None,
+        *,
+        item_model: type[ItemT],
+        query_params: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> list[ItemT]: ...
+
+    async def paginate(
+        self,
+        endpoint: str,
+        total_results_limit: int | None = None,
+        *,
+        item_model: type[ItemT] | None = None,
+        query_params: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> list[Any] | list[ItemT]:
         results: list[Any] = []
-        async for page in self._fetch_pages(endpoint, total_results_limit, **kwargs):
-            results.extend(page.results)
+        async for batch in self._fetch_pages(
+            endpoint,
+            total_results_limit,
+            item_model,
+            query_params=query_params,
+            **kwargs,
+        ):
+            results.extend(batch)
         return results
 
+    @overload
+    def paginate_stream(
+        self,
+        endpoint: str,
+        total_results_limit: int | None = None,
+        *,
+        item_model: None = None,
+        prefetch: int = 0,
+        query_params: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> AsyncGenerator[Any]: ...
+    @overload
+    def paginate_stream(
+        self,
+        endpoint: str,
+        total_results_limit: int | None = None,
+        *,
+        item_model: type[ItemT],
+        prefetch: int = 0,
+        query_params: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> AsyncGenerator[ItemT]: ...
+
     async def paginate_stream(
         self,
         endpoint: str,
         total_results_limit: int | None = None,
+        *,
+        item_model: type[ItemT] | None = None,
+        prefetch: int = 0,
+        query_params: dict[str, Any] | None = None,
         **kwargs,
     ) -> AsyncGenerator[Any]:
-        async for page in self._fetch_pages(endpoint, total_results_limit, **kwargs):
-            for item in page.results:
+        batches = self._fetch_pages(
+            endpoint,
+            total_results_limit,
+            item_model,
+            query_params=query_params,
+            **kwargs,
+        )
+        if prefetch > 0:
+            batches = self._prefetch_pages(batches, prefetch)
+        # Closing the pages as soon as the consumer stops also stops the
+        # prefetch task, instead of leaving that to garbage collection.
+        async with contextlib.aclosing(batches) as pages:
+            async for batch in pages:
+                for item in batch:
+                    yield item
+
+    @staticmethod
+    async def _prefetch_pages(
+        batches: AsyncGenerator[list[Any]], buffer_size: int
+    ) -> AsyncGenerator[list[Any]]:
+        """Fetch up to *buffer_size* pages ahead of the consumer in a background task."""
+        queue: asyncio.Queue[list[Any] | Exception | None] = asyncio.Queue(
+            maxsize=buffer_size
+        )
+
+        async def produce() -> None:
+            try:
+                async for batch in batches:
+                    await queue.put(batch)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+            finally:
+                await batches.aclose()
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
                 yield item
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
 
     async def _fetch_pages(
         self,
         endpoint: str,
         total_results_limit: int | None = None,
+        item_model: type[ItemT] | None = None,
         method: str = "POST",
+        query_params: dict[str, Any] | None = None,
         **kwargs,
-    ) -> AsyncGenerator[PaginatedResponse]:
+    ) -> AsyncGenerator[list[Any]]:
+        """Yield the results of each API page, already validated as *item_model*.
+
+        The page envelope is parametrised with *item_model*, so pydantic-core
+        parses the raw response bytes straight into typed items in one pass.
+        *kwargs* form the request body of ``POST`` endpoints, *query_params*
+        are always sent in the URL. With a *total_results_limit*, each request
+        asks for no more items than are still missing.
+        """
+        page_model = PaginatedResponse[item_model] if item_model else PaginatedResponse
         next_cursor: str | None = None
         has_more = True
         total_fetched = 0
-        api_page_size: int = kwargs.get("page_size", 100)
 
         while has_more and self._below_limit(total_results_limit, total_fetched):
             params = {**kwargs}
             if next_cursor:
                 params["start_cursor"] = next_cursor
+            if total_results_limit is not None:
+                params["page_size"] = min(
+                    total_results_limit - total_fetched,
+                    params.get("page_size") or self._MAX_PAGE_SIZE,
+                )
 
             if method.upper() == "GET":
-                raw = await self.get(endpoint, params=params)
+                response = await self.get(
+                    endpoint,
+                    params={**(query_params or {}), **params},
+                    response_model=page_model,
+                )
             else:
-                raw = await self.post(endpoint, data=params)
-            response = PaginatedResponse.model_validate(raw)
+                # Paginated POST endpoints (search, query) only read.
+                response = await self.post(
+                    endpoint,
+                    data=params,
+                    params=query_params,
+                    idempotent=True,
+                    response_model=page_model,
+                )
 
             results = self._slice_to_limit(
                 response.results, total_results_limit, total_fetched
             )
             total_fetched += len(results)
 
-            yield self._build_page_response(response, results, api_page_size)
+            yield results
 
             if not self._below_limit(total_results_limit, total_fetched):
                 break
@@ -154,19 +646,3 @@ class HttpClient:
         if limit is None:
             return results
         return results[: limit - fetched]
-
-    @staticmethod
-    def _build_page_response(
-        original: PaginatedResponse,
-        results: list[Any],
-        api_page_size: int,
-    ) -> PaginatedResponse:
-        client_truncated = len(results) < len(original.results)
-        full_page = len(original.results) == api_page_size
-        has_more = original.has_more and not client_truncated and full_page
-
-        return PaginatedResponse(
-            results=results,
-            has_more=has_more,
-            next_cursor=original.next_cursor if has_more else None,
-        )
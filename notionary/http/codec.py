@@ -0,0 +1,55 @@
+import json
+from typing import Any, Protocol
+
+
+class JsonCodec(Protocol):
+    """Encodes request bodies and decodes response bodies."""
+
+    def encode(self, data: Any) -> bytes: ...
+
+    def decode(self, content: bytes) -> Any: ...
+
+
+class StdlibJsonCodec:
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def decode(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class OrjsonCodec:
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def encode(self, data: Any) -> bytes:
+        return self._orjson.dumps(data)
+
+    def decode(self, content: bytes) -> Any:
+        return self._orjson.loads(content)
+
+
+class MsgspecCodec:
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, data: Any) -> bytes:
+        return self._encoder.encode(data)
+
+    def decode(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+
+def default_codec() -> JsonCodec:
+    """Return the fastest installed codec: orjson, then msgspec, then ``json``."""
+    for codec_cls in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_cls()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()
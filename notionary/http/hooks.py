@@ -0,0 +1,135 @@
+import contextvars
+import math
+import re
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from notionary.http.schemas import (
+    EndpointStats,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+)
+
+_ID_SEGMENT = re.compile(
+    r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+
+def endpoint_template(path: str) -> str:
+    """Replace Notion IDs in *path* with ``{id}``, e.g. ``pages/{id}/markdown``."""
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.strip("/").split("/")
+    )
+
+
+class HttpHook:
+    """Receives an event for every request attempt sent by ``HttpClient``.
+
+    Subclass and override the callbacks you need. Callbacks run inline on the
+    request path, so keep them cheap. Exceptions are logged and swallowed.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        pass
+
+    def on_response(self, event: ResponseEvent) -> None:
+        pass
+
+    def on_retry(self, event: RetryEvent) -> None:
+        pass
+
+
+class _Samples:
+    def __init__(self, max_samples: int) -> None:
+        self.stats = EndpointStats()
+        self.latencies: deque[float] = deque(maxlen=max_samples)
+
+
+class RequestScope:
+    """Requests observed while a :meth:`StatsCollector.scope` block was active."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.duration = 0.0
+
+
+_current_scope: contextvars.ContextVar[RequestScope | None] = contextvars.ContextVar(
+    "notionary_request_scope", default=None
+)
+
+
+class StatsCollector(HttpHook):
+    """Collects counts, payload sizes and latency percentiles per endpoint.
+
+    Percentiles are computed over the last *max_samples* responses of each
+    endpoint template.
+    """
+
+    def __init__(self, max_samples: int = 1000) -> None:
+        self._max_samples = max_samples
+        self._endpoints: defaultdict[str, _Samples] = defaultdict(
+            lambda: _Samples(self._max_samples)
+        )
+
+    def on_response(self, event: ResponseEvent) -> None:
+        samples = self._endpoints[f"{event.method} {event.endpoint}"]
+        samples.stats.count += 1
+        samples.stats.request_bytes += event.request_bytes
+        samples.stats.response_bytes += event.response_bytes
+        if event.error or (event.status_code or 0) >= 400:
+            samples.stats.errors += 1
+        samples.latencies.append(event.duration)
+
+        if (scope := _current_scope.get()) is not None:
+            scope.requests += 1
+            scope.duration += event.duration
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self._endpoints[f"{event.method} {event.endpoint}"].stats.retries += 1
+        if (scope := _current_scope.get()) is not None:
+            scope.retries += 1
+
+    def summary(self) -> dict[str, EndpointStats]:
+        """Return stats keyed by ``"METHOD endpoint/template"``."""
+        return {
+            key: samples.stats.model_copy(
+                update={
+                    "p50": _percentile(samples.latencies, 50),
+                    "p95": _percentile(samples.latencies, 95),
+                    "p99": _percentile(samples.latencies, 99),
+                }
+            )
+            for key, samples in sorted(self._endpoints.items())
+        }
+
+    def reset(self) -> None:
+        self._endpoints.clear()
+
+    @contextmanager
+    def scope(self) -> Iterator[RequestScope]:
+        """Count the requests made inside the block, including child tasks.
+
+        Example:
+            >>> with collector.scope() as scope:
+            ...     await page.describe_properties()
+            >>> scope.requests
+        """
+        scope = RequestScope()
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+
+
+def _percentile(values: deque[float], percent: int) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
@@ -0,0 +1,76 @@
+from notionary.http.hooks import HttpHook
+from notionary.http.schemas import ResponseEvent, RetryEvent
+
+try:
+    from opentelemetry import metrics, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError as e:
+    raise ImportError(
+        "OpenTelemetryHook requires opentelemetry-api. "
+        "Install it with `pip install notionary[otel]`."
+    ) from e
+
+
+class OpenTelemetryHook(HttpHook):
+    """Exports every request attempt as a client span and duration metric.
+
+    Span and metric names follow the OpenTelemetry HTTP semantic conventions.
+    The low-cardinality endpoint template (``pages/{id}``) is used as the
+    span name and ``url.template`` attribute.
+    """
+
+    def __init__(
+        self,
+        tracer_provider: trace.TracerProvider | None = None,
+        meter_provider: metrics.MeterProvider | None = None,
+    ) -> None:
+        self._tracer = trace.get_tracer("notionary", tracer_provider=tracer_provider)
+        meter = metrics.get_meter("notionary", meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "http.client.request.duration",
+            unit="s",
+            description="Duration of Notion API requests.",
+        )
+        self._retries = meter.create_counter(
+            "notionary.http.retries",
+            description="Notion API requests that were retried.",
+        )
+
+    def on_response(self, event: ResponseEvent) -> None:
+        attributes: dict[str, str | int] = {
+            "http.request.method": event.method,
+            "url.template": event.endpoint,
+            "server.address": "api.notion.com",
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None:
+            attributes["error.type"] = event.error
+        self._duration.record(event.duration, attributes)
+
+        start_ns = int(event.started_at * 1e9)
+        span = self._tracer.start_span(
+            f"{event.method} {event.endpoint}",
+            kind=SpanKind.CLIENT,
+            start_time=start_ns,
+            attributes={
+                **attributes,
+                "url.full": event.url,
+                "http.request.resend_count": event.attempt,
+                "http.request.body.size": event.request_bytes,
+                "http.response.body.size": event.response_bytes,
+            },
+        )
+        if event.error is not None or (event.status_code or 0) >= 400:
+            span.set_status(Status(StatusCode.ERROR))
+        span.end(end_time=start_ns + int(event.duration * 1e9))
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self._retries.add(
+            1,
+            {
+                "http.request.method": event.method,
+                "url.template": event.endpoint,
+                "notionary.retry.reason": event.reason,
+            },
+        )
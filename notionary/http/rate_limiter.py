@@ -0,0 +1,57 @@
+import asyncio
+import hashlib
+import time
+import weakref
+
+from notionary.http.schemas import RateLimitConfig
+
+
+class RateLimiter:
+    """Token bucket that spaces out requests sent with one integration token.
+
+    Tokens refill continuously at ``requests_per_second`` up to ``burst``.
+    Callers reserve a token up front and sleep until it becomes available,
+    so the bucket needs no lock and can be shared across event loops.
+    A 429 response pauses the whole bucket for the ``Retry-After`` delay,
+    which makes every caller sharing it back off together.
+    """
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        self._rate = config.requests_per_second
+        self._capacity = float(config.burst)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _reserve(self) -> float:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+        self._tokens -= 1
+
+        wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        return max(wait, self._paused_until - now)
+
+
+_shared_limiters: weakref.WeakValueDictionary[
+    tuple[str, RateLimitConfig], RateLimiter
+] = weakref.WeakValueDictionary()
+
+
+def shared_rate_limiter(token: str, config: RateLimitConfig) -> RateLimiter:
+    """Return the limiter shared by every client using *token* and *config*."""
+    key = (hashlib.sha256(token.encode()).hexdigest(), config)
+    limiter = _shared_limiters.get(key)
+    if limiter is None:
+        limiter = RateLimiter(config)
+        _shared_limiters[key] = limiter
+    return limiter
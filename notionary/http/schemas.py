@@ -1,9 +1,133 @@
-from typing import Any
+from typing import Generic, TypeVar
 
-from pydantic import BaseModel
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
 
+ItemT = TypeVar("ItemT")
 
-class PaginatedResponse(BaseModel):
-    results: list[Any]
+
+class PaginatedResponse(BaseModel, Generic[ItemT]):
+    results: list[ItemT]
     has_more: bool
     next_cursor: str | None
+
+
+class RateLimitConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    requests_per_second: float = Field(
+        default=3.0,
+        gt=0,
+        description="Average request rate per integration token. Notion allows ~3 rps.",
+    )
+    burst: int = Field(
+        default=10,
+        ge=1,
+        description="Requests that may be sent back to back before throttling kicks in.",
+    )
+    max_retries: int = Field(default=3, ge=0)
+    backoff_base: float = Field(
+        default=0.5,
+        gt=0,
+        description="Base delay (in seconds) for jittered exponential backoff.",
+    )
+    backoff_max: float = Field(default=30.0, gt=0)
+
+
+class HttpStats(BaseModel):
+    requests: int = 0
+    throttled: int = 0
+    retried: int = 0
+    coalesced: int = Field(
+        default=0,
+        description="GETs answered by joining an identical request already in flight.",
+    )
+    cache_hits: int = 0
+
+
+class TransportConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    max_connections: int | None = Field(default=100, ge=1)
+    max_keepalive_connections: int | None = Field(default=20, ge=0)
+    keepalive_expiry: float | None = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an idle keep-alive connection stays in the pool.",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Multiplex requests over HTTP/2. Requires ``notionary[http2]``.",
+    )
+    connect_timeout: float | None = Field(default=None, gt=0)
+    read_timeout: float | None = Field(default=None, gt=0)
+    write_timeout: float | None = Field(default=None, gt=0)
+    pool_timeout: float | None = Field(default=None, gt=0)
+    connect_retries: int = Field(
+        default=0,
+        ge=0,
+        description="Transport-level retries for failed connection attempts.",
+    )
+    transport: httpx.AsyncBaseTransport | None = Field(
+        default=None,
+        description="Custom transport, e.g. ``httpx.MockTransport`` in tests. "
+        "Overrides the pool, HTTP/2 and retry settings.",
+    )
+
+    def build_timeout(self, default: float) -> httpx.Timeout:
+        return httpx.Timeout(
+            default,
+            connect=self.connect_timeout or default,
+            read=self.read_timeout or default,
+            write=self.write_timeout or default,
+            pool=self.pool_timeout or default,
+        )
+
+    def build_transport(self) -> httpx.AsyncBaseTransport:
+        if self.transport is not None:
+            return self.transport
+        return httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            http2=self.http2,
+            retries=self.connect_retries,
+        )
+
+
+class RequestEvent(BaseModel):
+    method: str
+    url: str
+    endpoint: str = Field(
+        description="Endpoint template with IDs replaced, e.g. ``pages/{id}/markdown``."
+    )
+    attempt: int = Field(description="0 for the first try, then 1, 2, ... on retries.")
+    request_bytes: int = 0
+
+
+class ResponseEvent(RequestEvent):
+    status_code: int | None = Field(
+        description="``None`` when the request failed before a response arrived."
+    )
+    started_at: float = Field(description="Wall-clock start time (``time.time()``).")
+    duration: float = Field(description="Seconds until the response arrived.")
+    response_bytes: int = 0
+    error: str | None = None
+
+
+class RetryEvent(RequestEvent):
+    delay: float
+    reason: str = Field(description="Status code or transport error that caused it.")
+
+
+class EndpointStats(BaseModel):
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
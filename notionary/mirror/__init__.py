@@ -0,0 +1,9 @@
+from .mirror import Mirror
+from .schemas import MirrorSyncResult
+from .store import MirrorStore
+
+__all__ = [
+    "Mirror",
+    "MirrorStore",
+    "MirrorSyncResult",
+]
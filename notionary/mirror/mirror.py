@@ -0,0 +1,268 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypeVar
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from notionary.batch import Batch
+from notionary.data_source.schemas import DataSourceDto
+from notionary.data_source.search import DataSourceSearchClient
+from notionary.http import HttpClient
+from notionary.mirror.schemas import MirrorSyncResult
+from notionary.mirror.store import MirrorStore
+from notionary.page import mapper as page_mapper
+from notionary.page.content import PageContent
+from notionary.page.schemas import PageDto
+from notionary.page.search import PageSearchClient
+from notionary.rich_text import rich_text_to_markdown
+from notionary.shared.object.schemas import Parent
+from notionary.shared.search.schemas import SortDirection, SortTimestamp
+from notionary.user.client import UserClient
+from notionary.user.schemas import UserResponseDto
+
+logger = logging.getLogger(__name__)
+
+_user_adapter: TypeAdapter[UserResponseDto] = TypeAdapter(UserResponseDto)
+
+T = TypeVar("T")
+
+# Synced objects are handed to the store's worker thread in batches of this
+# size, matching the search API page size.
+_WRITE_BATCH = 100
+
+
+class Mirror:
+    """Local SQLite copy of the pages, data sources and users of a workspace.
+
+    :meth:`sync` pulls everything edited since the previous run through the
+    search API, newest first, and stops at the stored ``last_edited_time``
+    watermark. Pass the mirror as ``Notionary(read_from=mirror)`` to serve
+    page, data source and user lookups from disk. Writes always go to Notion.
+
+    Objects that come back from a sync in the trash are removed. Notion's
+    search API omits deleted objects entirely, so those remain in the mirror.
+
+    SQLite is queried from a worker thread, so reads and syncs never block
+    the event loop.
+
+    Example::
+
+        mirror = Mirror("workspace.db")
+
+        async with Notionary(read_from=mirror) as notion:
+            await notion.sync_mirror()
+            page = await notion.pages.find("Roadmap")
+            markdown = await mirror.get_markdown(page.id)
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._store = MirrorStore(path)
+
+    async def sync(
+        self,
+        http: HttpClient,
+        *,
+        markdown: bool = True,
+        max_concurrency: int = 4,
+    ) -> MirrorSyncResult:
+        """Bring the mirror up to date with the workspace.
+
+        Args:
+            http: Client used to talk to Notion.
+            markdown: Also download the markdown body of every page whose
+                stored copy is older than its ``last_edited_time``.
+            max_concurrency: Markdown downloads in flight at once.
+
+        Returns:
+            How many objects were written.
+        """
+        result = MirrorSyncResult(
+            pages=await self._sync_pages(http),
+            data_sources=await self._sync_data_sources(http),
+            users=await self._sync_users(http),
+        )
+        if markdown:
+            result.markdown, result.markdown_failed = await self._sync_markdown(
+                http, max_concurrency
+            )
+        logger.info("Mirror sync finished: %s", result)
+        return result
+
+    async def get_page(self, page_id: UUID) -> PageDto | None:
+        payload = await self._call(self._store.get, "pages", str(page_id))
+        return PageDto.model_validate_json(payload) if payload else None
+
+    async def list_pages(
+        self,
+        query: str | None = None,
+        sort_direction: SortDirection = SortDirection.DESCENDING,
+        sort_timestamp: SortTimestamp = SortTimestamp.LAST_EDITED_TIME,
+        limit: int | None = None,
+    ) -> list[PageDto]:
+        """Return mirrored pages whose title contains *query* (case-insensitive)."""
+        payloads = await self._call(
+            self._store.search, "pages", query, sort_timestamp, sort_direction, limit
+        )
+        return [PageDto.model_validate_json(payload) for payload in payloads]
+
+    async def get_data_source(self, data_source_id: UUID) -> DataSourceDto | None:
+        payload = await self._call(self._store.get, "data_sources", str(data_source_id))
+        return DataSourceDto.model_validate_json(payload) if payload else None
+
+    async def list_data_sources(
+        self,
+        query: str | None = None,
+        sort_direction: SortDirection = SortDirection.DESCENDING,
+        sort_timestamp: SortTimestamp = SortTimestamp.LAST_EDITED_TIME,
+        limit: int | None = None,
+    ) -> list[DataSourceDto]:
+        """Return mirrored data sources whose title contains *query*."""
+        payloads = await self._call(
+            self._store.search,
+            "data_sources",
+            query,
+            sort_timestamp,
+            sort_direction,
+            limit,
+        )
+        return [DataSourceDto.model_validate_json(payload) for payload in payloads]
+
+    async def list_users(self) -> list[UserResponseDto]:
+        payloads = await self._call(self._store.users)
+        return [_user_adapter.validate_json(payload) for payload in payloads]
+
+    async def get_markdown(self, page_id: UUID) -> str | None:
+        """Return the mirrored markdown body of a page, if it was synced."""
+        return await self._call(self._store.get_markdown, str(page_id))
+
+    def close(self) -> None:
+        with self._store.lock:
+            self._store.close()
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        def locked() -> T:
+            with self._store.lock:
+                return func(*args)
+
+        return await asyncio.to_thread(locked)
+
+    async def _sync_pages(self, http: HttpClient) -> int:
+        watermark = await self._call(self._store.get_state, "pages")
+        newest = watermark
+        batch: list[PageDto] = []
+        count = 0
+        async for dto in PageSearchClient(http).stream():
+            if _is_older(dto.last_edited_time, watermark):
+                break
+            batch.append(dto)
+            newest = _newest(newest, dto.last_edited_time)
+            count += 1
+            if len(batch) == _WRITE_BATCH:
+                await self._call(self._write_pages, batch)
+                batch = []
+        await self._call(self._write_pages, batch)
+        await self._call(self._finish_sync, "pages", newest)
+        return count
+
+    async def _sync_data_sources(self, http: HttpClient) -> int:
+        watermark = await self._call(self._store.get_state, "data_sources")
+        newest = watermark
+        batch: list[DataSourceDto] = []
+        count = 0
+        async for dto in DataSourceSearchClient(http).stream():
+            if _is_older(dto.last_edited_time, watermark):
+                break
+            batch.append(dto)
+            newest = _newest(newest, dto.last_edited_time)
+            count += 1
+            if len(batch) == _WRITE_BATCH:
+                await self._call(self._write_data_sources, batch)
+                batch = []
+        await self._call(self._write_data_sources, batch)
+        await self._call(self._finish_sync, "data_sources", newest)
+        return count
+
+    async def _sync_users(self, http: HttpClient) -> int:
+        # Users carry no last_edited_time, so the list is replaced as a whole.
+        users = await UserClient(http).list()
+        await self._call(
+            self._store.replace_users,
+            [
+                (str(user.id), user.type.value, _user_adapter.dump_json(user))
+                for user in users
+            ],
+        )
+        await self._call(self._store.commit)
+        return len(users)
+
+    async def _sync_markdown(
+        self, http: HttpClient, max_concurrency: int
+    ) -> tuple[int, int]:
+        async def fetch(page_id: str, last_edited_time: str) -> None:
+            content = PageContent(UUID(page_id), http)
+            markdown = await content.get_markdown(last_edited_time)
+            await self._call(
+                self._store.set_markdown, page_id, last_edited_time, markdown
+            )
+
+        stale = await self._call(self._store.stale_markdown)
+        async with Batch(max_concurrency=max_concurrency) as batch:
+            for page_id, last_edited_time in stale:
+                batch.add(fetch(page_id, last_edited_time))
+        await self._call(self._store.commit)
+
+        failed = sum(1 for result in batch.results if not result.ok)
+        return len(batch.results) - failed, failed
+
+    def _write_pages(self, dtos: list[PageDto]) -> None:
+        for dto in dtos:
+            if dto.in_trash:
+                self._store.delete("pages", str(dto.id))
+                continue
+            self._store.upsert_page(
+                id=str(dto.id),
+                title=page_mapper.to_title(dto),
+                parent_id=_parent_id(dto.parent),
+                created_time=dto.created_time,
+                last_edited_time=dto.last_edited_time,
+                payload=dto.model_dump_json().encode(),
+            )
+
+    def _write_data_sources(self, dtos: list[DataSourceDto]) -> None:
+        for dto in dtos:
+            if dto.in_trash:
+                self._store.delete("data_sources", str(dto.id))
+                continue
+            self._store.upsert_data_source(
+                id=str(dto.id),
+                title=rich_text_to_markdown(dto.title),
+                created_time=dto.created_time,
+                last_edited_time=dto.last_edited_time,
+                payload=dto.model_dump_json().encode(),
+            )
+
+    def _finish_sync(self, name: str, newest: str | None) -> None:
+        if newest is not None:
+            self._store.set_state(name, newest)
+        self._store.commit()
+
+
+def _parent_id(parent: Parent) -> str | None:
+    value = getattr(parent, parent.type, None)
+    return str(value) if isinstance(value, UUID) else None
+
+
+def _is_older(timestamp: str, watermark: str | None) -> bool:
+    if watermark is None:
+        return False
+    return datetime.fromisoformat(timestamp) < datetime.fromisoformat(watermark)
+
+
+def _newest(current: str | None, timestamp: str) -> str:
+    if current is None or _is_older(current, timestamp):
+        return timestamp
+    return current
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class MirrorSyncResult(BaseModel):
+    """Number of objects written to the mirror by one sync run."""
+
+    pages: int = 0
+    data_sources: int = 0
+    users: int = 0
+    markdown: int = 0
+    markdown_failed: int = 0
@@ -0,0 +1,173 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+from notionary.shared.search.schemas import SortDirection, SortTimestamp
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    parent_id TEXT,
+    created_time TEXT NOT NULL,
+    last_edited_time TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_parent_id ON pages (parent_id);
+CREATE INDEX IF NOT EXISTS pages_last_edited_time ON pages (last_edited_time);
+CREATE TABLE IF NOT EXISTS data_sources (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    created_time TEXT NOT NULL,
+    last_edited_time TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS markdown (
+    page_id TEXT PRIMARY KEY,
+    last_edited_time TEXT NOT NULL,
+    markdown TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_ENTITY_TABLES = frozenset({"pages", "data_sources"})
+
+
+class MirrorStore:
+    """SQLite tables behind a :class:`~notionary.mirror.Mirror`.
+
+    Objects are stored as their JSON payload next to the columns needed for
+    lookups and ordering, so reads never have to parse rows they skip.
+    Writes are only persisted by :meth:`commit`, which lets a sync store its
+    rows and the new watermark in one transaction.
+
+    The methods block, so :class:`~notionary.mirror.Mirror` calls them from a
+    worker thread. Callers hold :attr:`lock` around every call.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def upsert_page(
+        self,
+        id: str,
+        *,
+        title: str,
+        parent_id: str | None,
+        created_time: str,
+        last_edited_time: str,
+        payload: bytes,
+    ) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+            (id, title, parent_id, created_time, last_edited_time, payload),
+        )
+
+    def upsert_data_source(
+        self,
+        id: str,
+        *,
+        title: str,
+        created_time: str,
+        last_edited_time: str,
+        payload: bytes,
+    ) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO data_sources VALUES (?, ?, ?, ?, ?)",
+            (id, title, created_time, last_edited_time, payload),
+        )
+
+    def delete(self, table: str, id: str) -> None:
+        _check_table(table)
+        self._conn.execute(f"DELETE FROM {table} WHERE id = ?", (id,))
+        if table == "pages":
+            self._conn.execute("DELETE FROM markdown WHERE page_id = ?", (id,))
+
+    def get(self, table: str, id: str) -> bytes | None:
+        _check_table(table)
+        row = self._conn.execute(
+            f"SELECT payload FROM {table} WHERE id = ?", (id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def search(
+        self,
+        table: str,
+        query: str | None,
+        sort_timestamp: SortTimestamp,
+        sort_direction: SortDirection,
+        limit: int | None,
+    ) -> list[bytes]:
+        _check_table(table)
+        order = "ASC" if sort_direction == SortDirection.ASCENDING else "DESC"
+        rows = self._conn.execute(
+            f"SELECT payload FROM {table} "
+            "WHERE ? IS NULL OR instr(lower(title), lower(?)) > 0 "
+            f"ORDER BY {SortTimestamp(sort_timestamp).value} {order} "
+            "LIMIT ?",
+            (query, query, -1 if limit is None else limit),
+        )
+        return [payload for (payload,) in rows]
+
+    def replace_users(self, users: list[tuple[str, str, bytes]]) -> None:
+        self._conn.execute("DELETE FROM users")
+        self._conn.executemany("INSERT INTO users VALUES (?, ?, ?)", users)
+
+    def users(self) -> list[bytes]:
+        rows = self._conn.execute("SELECT payload FROM users ORDER BY rowid")
+        return [payload for (payload,) in rows]
+
+    def set_markdown(self, page_id: str, last_edited_time: str, markdown: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO markdown VALUES (?, ?, ?)",
+            (page_id, last_edited_time, markdown),
+        )
+
+    def get_markdown(self, page_id: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT markdown FROM markdown WHERE page_id = ?", (page_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def stale_markdown(self) -> list[tuple[str, str]]:
+        """Return ``(page_id, last_edited_time)`` of pages whose markdown is outdated."""
+        rows = self._conn.execute(
+            "SELECT p.id, p.last_edited_time FROM pages p "
+            "LEFT JOIN markdown m ON m.page_id = p.id "
+            "WHERE m.last_edited_time IS NULL "
+            "OR m.last_edited_time != p.last_edited_time"
+        )
+        return rows.fetchall()
+
+    def get_state(self, name: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT value FROM sync_state WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, name: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (name, value)
+        )
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _check_table(table: str) -> None:
+    if table not in _ENTITY_TABLES:
+        raise ValueError(f"Unknown mirror table: {table!r}")
@@ -1,11 +1,22 @@
 import os
+from collections.abc import Sequence
 from types import TracebackType
 from typing import Self
 
+from notionary.batch import Batch
+from notionary.batch.batch import ProgressCallback
 from notionary.data_source import DataSourceNamespace
 from notionary.database import DatabaseNamespace
 from notionary.file_upload import FileUploads
-from notionary.http import HttpClient
+from notionary.http import (
+    HttpClient,
+    HttpHook,
+    HttpStats,
+    RateLimitConfig,
+    ResponseCache,
+    TransportConfig,
+)
+from notionary.mirror import Mirror, MirrorSyncResult
 from notionary.page import PageNamespace
 from notionary.user import UsersNamespace
 from notionary.workspace import WorkspaceNamespace
@@ -18,19 +29,47 @@ class Notionary:
     when ``api_key`` is omitted.
     """
 
-    def __init__(self, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        rate_limit: RateLimitConfig | None = None,
+        transport: TransportConfig | None = None,
+        cache: ResponseCache | None = None,
+        hooks: Sequence[HttpHook] = (),
+        read_from: Mirror | None = None,
+    ) -> None:
         """
         Args:
             api_key: Notion integration token. Falls back to ``NOTION_API_KEY``.
+            rate_limit: Request rate and retry settings. All clients using the
+                same token and settings share one rate budget.
+            transport: Connection pool, keep-alive, HTTP/2 and timeout settings
+                for the underlying ``httpx.AsyncClient``.
+            cache: Opt-in cache for schema-like reads such as data source,
+                database and user lookups. Disabled by default.
+            hooks: Observers notified of every request, response and retry,
+                e.g. a :class:`~notionary.http.StatsCollector`.
+            read_from: Serve page, data source and user reads from a local
+                :class:`~notionary.mirror.Mirror` instead of the API.
 
         Raises:
             ValueError: If no API key is provided and ``NOTION_API_KEY`` is not set.
         """
-        self._http = HttpClient(self._resolve_api_key(api_key))
+        self._http = HttpClient(
+            self._resolve_api_key(api_key),
+            rate_limit=rate_limit,
+            transport=transport,
+            cache=cache,
+            hooks=hooks,
+        )
+
+        self._cache = cache
+        self._mirror = read_from
 
-        self.users = UsersNamespace(self._http)
-        self.pages = PageNamespace(self._http)
-        self.data_sources = DataSourceNamespace(self._http)
+        self.users = UsersNamespace(self._http, read_from)
+        self.pages = PageNamespace(self._http, read_from)
+        self.data_sources = DataSourceNamespace(self._http, read_from)
         self.databases = DatabaseNamespace(self._http)
         self.file_uploads = FileUploads(self._http)
         self.workspace = WorkspaceNamespace(self._http)
@@ -43,9 +82,53 @@ class Notionary:
             )
         return resolved
 
+    def batch(
+        self,
+        max_concurrency: int = 10,
+        on_progress: ProgressCallback | None = None,
+    ) -> Batch:
+        """Create an executor that runs many independent calls concurrently.
+
+        Queued operations share this client's rate budget, so large bulk
+        updates are paced rather than rejected with HTTP 429.
+
+        Args:
+            max_concurrency: Maximum number of operations in flight at once.
+            on_progress: Called with ``(completed, total)`` after each operation.
+
+        Returns:
+            A :class:`~notionary.batch.Batch` to use as an async context manager.
+        """
+        return Batch(max_concurrency=max_concurrency, on_progress=on_progress)
+
+    async def sync_mirror(
+        self, mirror: Mirror | None = None, *, markdown: bool = True
+    ) -> MirrorSyncResult:
+        """Pull changes since the last sync into a local mirror.
+
+        Args:
+            mirror: The mirror to update. Defaults to the one passed as
+                ``read_from``.
+            markdown: Also refresh the markdown body of changed pages.
+
+        Raises:
+            ValueError: If no mirror is given and none was configured.
+        """
+        target = mirror or self._mirror
+        if target is None:
+            raise ValueError("No mirror configured. Pass mirror= or read_from=.")
+        return await target.sync(self._http, markdown=markdown)
+
+    @property
+    def http_stats(self) -> HttpStats:
+        """Counters for requests sent, throttled (HTTP 429), retried and served from cache."""
+        return self._http.stats
+
     async def close(self) -> None:
-        """Close the underlying HTTP session and release all resources."""
+        """Close the underlying HTTP session and the response cache, if any."""
         await self._http.close()
+        if self._cache is not None:
+            await self._cache.close()
 
     async def __aenter__(self) -> Self:
         return self
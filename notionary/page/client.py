@@ -14,5 +14,4 @@ class PageHttpClient(HttpClient):
         self._page_id = page_id
 
     async def get_page(self) -> PageDto:
-        response = await self.get(f"pages/{self._page_id}")
-        return PageDto.model_validate(response)
+        return await self.get(f"pages/{self._page_id}", response_model=PageDto)
@@ -23,10 +23,11 @@ class CommentClient:
         async for item in self._http.paginate_stream(
             "comments",
             total_results_limit=total_results_limit,
+            item_model=CommentDto,
             method="GET",
             block_id=block_id,
         ):
-            yield CommentDto.model_validate(item)
+            yield item
 
     async def list(
         self,
@@ -34,13 +35,13 @@ class CommentClient:
         *,
         total_results_limit: int | None = None,
     ) -> list[CommentDto]:
-        items = await self._http.paginate(
+        comments = await self._http.paginate(
             "comments",
             total_results_limit=total_results_limit,
+            item_model=CommentDto,
             method="GET",
             block_id=block_id,
         )
-        comments = [CommentDto.model_validate(item) for item in items]
         logger.debug(
             "Retrieved %d total comments for block %s", len(comments), block_id
         )
@@ -52,8 +53,8 @@ class CommentClient:
         page_id: UUID,
     ) -> CommentDto:
         body = CommentCreateRequest.for_page(page_id=page_id, rich_text=rich_text)
-        return CommentDto.model_validate(
-            await self._http.post("comments", data=body, exclude_unset=True)
+        return await self._http.post(
+            "comments", data=body, exclude_unset=True, response_model=CommentDto
         )
 
     async def create_for_discussion(
@@ -64,6 +65,6 @@ class CommentClient:
         body = CommentCreateRequest.for_discussion(
             discussion_id=discussion_id, rich_text=rich_text
         )
-        return CommentDto.model_validate(
-            await self._http.post("comments", data=body, exclude_unset=True)
+        return await self._http.post(
+            "comments", data=body, exclude_unset=True, response_model=CommentDto
         )
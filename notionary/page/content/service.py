@@ -1,4 +1,5 @@
 import logging
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from notionary.http import HttpClient
@@ -10,6 +11,11 @@ from notionary.page.content.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Notion rounds last_edited_time down to the minute, so edits made shortly
+# after a read can keep the same timestamp. Only older timestamps are trusted
+# as cache versions.
+_VERSION_SETTLE_TIME = timedelta(minutes=2)
+
 
 class PageContent:
     """Read and write page content as markdown."""
@@ -18,10 +24,29 @@ class PageContent:
         self._page_id = page_id
         self._http = http
 
-    async def get_markdown(self) -> str:
-        """Return the full page content as a markdown string."""
-        response = await self._http.get(f"pages/{self._page_id}/markdown")
-        return PageMarkdownResponse.model_validate(response).markdown
+    async def get_markdown(self, last_edited_time: str | None = None) -> str:
+        """Return the full page content as a markdown string.
+
+        Args:
+            last_edited_time: The page's current ``last_edited_time``. When the
+                HTTP client has a cache, the markdown body is cached under this
+                timestamp and only downloaded again once it changes.
+        """
+        response = await self._http.get(
+            f"pages/{self._page_id}/markdown",
+            version=self._settled_version(last_edited_time),
+            response_model=PageMarkdownResponse,
+        )
+        return response.markdown
+
+    @staticmethod
+    def _settled_version(last_edited_time: str | None) -> str | None:
+        if last_edited_time is None:
+            return None
+        edited_at = datetime.fromisoformat(last_edited_time)
+        if datetime.now(UTC) - edited_at < _VERSION_SETTLE_TIME:
+            return None
+        return last_edited_time
 
     async def append(self, content: str) -> None:
         """Append markdown content to the end of the page.
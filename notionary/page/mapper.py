@@ -4,14 +4,11 @@ from notionary.page.properties import PageTitleProperty
 from notionary.page.schemas import PageDto
 from notionary.rich_text import rich_text_to_markdown
 from notionary.shared.object.schemas import DatabaseParent, DataSourceParent
+from notionary.shared.properties.type import PropertyType
 
 
 def to_page(dto: PageDto, http: HttpClient) -> Page:
-    title_property = next(
-        (p for p in dto.properties.values() if isinstance(p, PageTitleProperty)),
-        None,
-    )
-    title = rich_text_to_markdown(title_property.title if title_property else [])
+    title = to_title(dto)
     data_source_id = None
     if isinstance(dto.parent, DataSourceParent):
         data_source_id = dto.parent.data_source_id
@@ -32,3 +29,15 @@ def to_page(dto: PageDto, http: HttpClient) -> Page:
         last_edited_by=dto.last_edited_by,
         data_source_id=data_source_id,
     )
+
+
+def to_title(dto: PageDto) -> str:
+    properties = dto.properties
+    title_name = next(
+        (n for n in properties if properties.type_of(n) == PropertyType.TITLE),
+        None,
+    )
+    title_property = properties[title_name] if title_name is not None else None
+    if not isinstance(title_property, PageTitleProperty):
+        return ""
+    return rich_text_to_markdown(title_property.title)
@@ -1,4 +1,5 @@
 from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from notionary.http.client import HttpClient
@@ -10,16 +11,21 @@ from notionary.page.search import PageSearchClient
 from notionary.page.search.schemas import SortDirection, SortTimestamp
 from notionary.shared.search import fuzzy_suggestions
 
+if TYPE_CHECKING:
+    from notionary.mirror import Mirror
+
 
 class PageNamespace:
     """Scoped access to Notion pages.
 
     Provides listing, searching, and retrieval of
-    :class:`~notionary.page.page.Page` objects.
+    :class:`~notionary.page.page.Page` objects. With a
+    :class:`~notionary.mirror.Mirror`, reads are served from the local copy.
     """
 
-    def __init__(self, http: HttpClient) -> None:
+    def __init__(self, http: HttpClient, mirror: "Mirror | None" = None) -> None:
         self._http = http
+        self._mirror = mirror
         self._search_client = PageSearchClient(http)
 
     async def list(
@@ -65,6 +71,13 @@ class PageNamespace:
 
         Accepts the same arguments as :meth:`list`.
         """
+        if self._mirror is not None:
+            for dto in await self._mirror.list_pages(
+                query, sort_direction, sort_timestamp, limit=total_results_limit
+            ):
+                yield mapper.to_page(dto, self._http)
+            return
+
         async for dto in self._search_client.stream(
             query=query,
             sort_direction=sort_direction,
@@ -87,7 +100,7 @@ class PageNamespace:
             PageNotFound: If no exact match is found. The exception
                 includes fuzzy suggestions when available.
         """
-        candidates = await self.list(query=title, page_size=10, total_results_limit=10)
+        candidates = await self.list(query=title, total_results_limit=10)
 
         exact = next((p for p in candidates if p.title.lower() == title.lower()), None)
         if exact:
@@ -103,8 +116,10 @@ class PageNamespace:
             page_id: The Notion page UUID.
 
         Returns:
-            The :class:`~notionary.page.page.Page` for the given ID.
+            The :class:`~notionary.page.page.Page` for the given ID. Pages
+            missing from the mirror are fetched from Notion.
         """
-        response = await self._http.get(f"pages/{page_id}")
-        dto = PageDto.model_validate(response)
+        if self._mirror is not None and (dto := await self._mirror.get_page(page_id)):
+            return mapper.to_page(dto, self._http)
+        dto = await self._http.get(f"pages/{page_id}", response_model=PageDto)
         return mapper.to_page(dto, self._http)
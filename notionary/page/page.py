@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from pathlib import Path
 from typing import overload
 from uuid import UUID
@@ -12,6 +13,7 @@ from notionary.page.properties.views import PagePropertyDescription
 from notionary.page.schemas import (
     DataSourceParent,
     MovePageRequest,
+    PageDto,
     PageParent,
     PageUpdateRequest,
     _DefaultTemplate,
@@ -38,7 +40,7 @@ class Page:
         icon: Icon | None,
         cover: File | None,
         in_trash: bool,
-        properties: dict[str, AnyPageProperty],
+        properties: Mapping[str, AnyPageProperty],
         http: HttpClient,
         created_time: str,
         created_by: PartialUserDto,
@@ -181,9 +183,22 @@ class Page:
         """Remove all content from the page."""
         await self._content.clear()
 
-    async def get_markdown(self) -> str:
-        """Return the full page content as a markdown string."""
-        return await self._content.get_markdown()
+    async def get_markdown(self, revalidate: bool = False) -> str:
+        """Return the full page content as a markdown string.
+
+        With a response cache configured, the markdown is cached under the
+        page's ``last_edited_time`` and only downloaded again once it changes.
+        Pages from :meth:`~notionary.page.namespace.PageNamespace.from_id`,
+        searches and data source queries carry a fresh timestamp already.
+
+        Args:
+            revalidate: Refresh ``last_edited_time`` from the page metadata
+                first. Use this on long-lived ``Page`` objects.
+        """
+        if revalidate:
+            dto = await self._http.get(self._path, response_model=PageDto)
+            self.last_edited_time = dto.last_edited_time
+        return await self._content.get_markdown(self.last_edited_time)
 
     async def get_comments(self) -> list:
         """Return all comments on this page.
@@ -17,10 +17,12 @@ class PagePropertyHttpClient:
         self._http = http
 
     async def patch_page(self, data: BaseModel) -> PageDto:
-        result_dict = await self._http.patch(
-            f"pages/{self._page_id}", data=data, exclude_unset=True
+        return await self._http.patch(
+            f"pages/{self._page_id}",
+            data=data,
+            exclude_unset=True,
+            response_model=PageDto,
         )
-        return PageDto.model_validate(result_dict)
 
     async def set_property(self, name: str, value: PageProperty) -> PageDto:
         return await self.patch_page(PgePropertiesUpdateDto(properties={name: value}))
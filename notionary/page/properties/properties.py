@@ -55,7 +55,7 @@ class PageProperties:
     def __init__(
         self,
         id: UUID,
-        properties: dict[str, AnyPageProperty],
+        properties: Mapping[str, AnyPageProperty],
         http: HttpClient,
         data_source_id: UUID | None = None,
     ) -> None:
@@ -66,6 +66,7 @@ class PageProperties:
         self._relation_data_source_ids: dict[str, str] | None = None
         self._relation_data_source_clients: dict[str, DataSourceClient] = {}
         self._relation_title_options: dict[str, list[tuple[str, str]]] = {}
+        self._relation_ids_by_title: dict[str, dict[str, list[str]]] = {}
         self._property_http_client = PagePropertyHttpClient(page_id=id, http=http)
 
     async def set(
@@ -468,12 +469,9 @@ class PageProperties:
                 "- no related data source found for this relation."
             )
 
-        normalized = title.lower()
-        matching = [
-            page_id
-            for option_title, page_id in options
-            if option_title.lower() == normalized
-        ]
+        matching = self._relation_ids_by_title.get(property_name, {}).get(
+            title.lower(), []
+        )
 
         if len(matching) == 1:
             return matching[0]
@@ -514,7 +512,12 @@ class PageProperties:
 
         options = [(page.title, str(page.id)) for page in pages if page.title]
 
+        ids_by_title: dict[str, list[str]] = {}
+        for option_title, page_id in options:
+            ids_by_title.setdefault(option_title.lower(), []).append(page_id)
+
         self._relation_title_options[property_name] = options
+        self._relation_ids_by_title[property_name] = ids_by_title
         return options
 
     def _relation_client_for(self, data_source_id: str) -> DataSourceClient:
@@ -535,7 +538,7 @@ class PageProperties:
         self._relation_data_source_clients[data_source_id] = client
         return client
 
-    def _sync_properties(self, properties: dict[str, AnyPageProperty]) -> None:
+    def _sync_properties(self, properties: Mapping[str, AnyPageProperty]) -> None:
         self.properties = properties
 
     @staticmethod
@@ -1,7 +1,20 @@
+from collections.abc import ItemsView, Iterator, Mapping, ValuesView
 from enum import StrEnum
-from typing import Any, Literal
-
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Any, Literal, Self
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    GetCoreSchemaHandler,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+)
+from pydantic_core import core_schema
 
 from notionary.rich_text.schemas import RichText
 from notionary.shared.object.schemas import File
@@ -245,32 +258,134 @@ class PageUnknownProperty(PageProperty):
     model_config = ConfigDict(extra="allow")
 
 
-type AnyPageProperty = (
-    PageTitleProperty
-    | PageRichTextProperty
-    | PageSelectProperty
-    | PageMultiSelectProperty
-    | PageStatusProperty
-    | PageNumberProperty
-    | PageDateProperty
-    | PageCheckboxProperty
-    | PageURLProperty
-    | PageEmailProperty
-    | PagePhoneNumberProperty
-    | PagePeopleProperty
-    | PageCreatedByProperty
-    | PageLastEditedByProperty
-    | PageCreatedTimeProperty
-    | PageLastEditedTimeProperty
-    | PageLastVisitedTimeProperty
-    | PageFormulaProperty
-    | PageRollupProperty
-    | PageFilesProperty
-    | PageRelationProperty
-    | PageButtonProperty
-    | PageLocationProperty
-    | PagePlaceProperty
-    | PageVerificationProperty
-    | PageUniqueIdProperty
-    | PageUnknownProperty
+_KNOWN_PAGE_PROPERTY_TYPES = frozenset(PropertyType)
+
+
+def _page_property_tag(value: Any) -> str:
+    prop_type = value.get("type") if isinstance(value, dict) else value.type
+    return prop_type if prop_type in _KNOWN_PAGE_PROPERTY_TYPES else "unknown"
+
+
+def _fall_back_to_unknown(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    try:
+        return handler(value)
+    except ValidationError:
+        # A known type whose payload no longer matches its model (a new enum
+        # member, a field the API stopped sending) is kept as unknown rather
+        # than failing the whole page.
+        return PageUnknownProperty.model_validate(value)
+
+
+# Dispatching on ``type`` validates each property against exactly one model
+# instead of trying every member of the union in turn.
+type AnyPageProperty = Annotated[
+    Annotated[
+        Annotated[PageTitleProperty, Tag(PropertyType.TITLE)]
+        | Annotated[PageRichTextProperty, Tag(PropertyType.RICH_TEXT)]
+        | Annotated[PageSelectProperty, Tag(PropertyType.SELECT)]
+        | Annotated[PageMultiSelectProperty, Tag(PropertyType.MULTI_SELECT)]
+        | Annotated[PageStatusProperty, Tag(PropertyType.STATUS)]
+        | Annotated[PageNumberProperty, Tag(PropertyType.NUMBER)]
+        | Annotated[PageDateProperty, Tag(PropertyType.DATE)]
+        | Annotated[PageCheckboxProperty, Tag(PropertyType.CHECKBOX)]
+        | Annotated[PageURLProperty, Tag(PropertyType.URL)]
+        | Annotated[PageEmailProperty, Tag(PropertyType.EMAIL)]
+        | Annotated[PagePhoneNumberProperty, Tag(PropertyType.PHONE_NUMBER)]
+        | Annotated[PagePeopleProperty, Tag(PropertyType.PEOPLE)]
+        | Annotated[PageCreatedByProperty, Tag(PropertyType.CREATED_BY)]
+        | Annotated[PageLastEditedByProperty, Tag(PropertyType.LAST_EDITED_BY)]
+        | Annotated[PageCreatedTimeProperty, Tag(PropertyType.CREATED_TIME)]
+        | Annotated[PageLastEditedTimeProperty, Tag(PropertyType.LAST_EDITED_TIME)]
+        | Annotated[PageLastVisitedTimeProperty, Tag(PropertyType.LAST_VISITED_TIME)]
+        | Annotated[PageFormulaProperty, Tag(PropertyType.FORMULA)]
+        | Annotated[PageRollupProperty, Tag(PropertyType.ROLLUP)]
+        | Annotated[PageFilesProperty, Tag(PropertyType.FILES)]
+        | Annotated[PageRelationProperty, Tag(PropertyType.RELATION)]
+        | Annotated[PageButtonProperty, Tag(PropertyType.BUTTON)]
+        | Annotated[PageLocationProperty, Tag(PropertyType.LOCATION)]
+        | Annotated[PagePlaceProperty, Tag(PropertyType.PLACE)]
+        | Annotated[PageVerificationProperty, Tag(PropertyType.VERIFICATION)]
+        | Annotated[PageUniqueIdProperty, Tag(PropertyType.UNIQUE_ID)]
+        | Annotated[PageUnknownProperty, Tag("unknown")],
+        Discriminator(_page_property_tag),
+    ],
+    WrapValidator(_fall_back_to_unknown),
+]
+
+_page_property_adapter: TypeAdapter[AnyPageProperty] = TypeAdapter(AnyPageProperty)
+_page_properties_adapter: TypeAdapter[dict[str, AnyPageProperty]] = TypeAdapter(
+    dict[str, AnyPageProperty]
 )
+
+
+class LazyPageProperties(Mapping[str, AnyPageProperty]):
+    """Page properties that are validated one at a time, on first access.
+
+    Rows of wide data sources carry dozens of properties, most of which a
+    caller never reads. The raw payloads are kept as returned by the API and
+    each one is turned into its ``Page*Property`` model only when it is
+    looked up. A payload that does not match the model for its ``type`` is
+    decoded as :class:`PageUnknownProperty` instead of raising.
+    """
+
+    __slots__ = ("_decoded", "_raw")
+
+    def __init__(self, raw: Mapping[str, Any] | None = None) -> None:
+        self._raw: dict[str, Any] = dict(raw or {})
+        self._decoded: dict[str, AnyPageProperty] = {}
+
+    def __getitem__(self, name: str) -> AnyPageProperty:
+        prop = self._decoded.get(name)
+        if prop is None:
+            prop = _page_property_adapter.validate_python(self._raw[name])
+            self._decoded[name] = prop
+        return prop
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._raw
+
+    def items(self) -> ItemsView[str, AnyPageProperty]:
+        return self._decode_all().items()
+
+    def values(self) -> ValuesView[AnyPageProperty]:
+        return self._decode_all().values()
+
+    def _decode_all(self) -> dict[str, AnyPageProperty]:
+        # Validating the remaining properties in one call is much cheaper than
+        # going through the single-property adapter once per name.
+        pending = {k: v for k, v in self._raw.items() if k not in self._decoded}
+        if pending:
+            self._decoded.update(_page_properties_adapter.validate_python(pending))
+        return {name: self._decoded[name] for name in self._raw}
+
+    def type_of(self, name: str) -> str:
+        """Return the ``type`` of a property without validating it."""
+        return _page_property_tag(self._raw[name])
+
+    def __repr__(self) -> str:
+        return f"LazyPageProperties({list(self._raw)!r})"
+
+    @classmethod
+    def _coerce(cls, value: Any) -> Self:
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, Mapping):
+            return cls(value)
+        raise ValueError("page properties must be a mapping")
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._coerce,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                dict, return_schema=core_schema.dict_schema()
+            ),
+        )
@@ -3,12 +3,12 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from notionary.page.properties.schemas import AnyPageProperty
+from notionary.page.properties.schemas import AnyPageProperty, LazyPageProperties
 from notionary.shared.object.dtos import NotionObjectResponseDto
 
 
 class PageDto(NotionObjectResponseDto):
-    properties: dict[str, AnyPageProperty]
+    properties: LazyPageProperties
 
 
 class PgePropertiesUpdateDto(BaseModel):
@@ -27,6 +27,7 @@ class PageSearchClient:
         async for item in self._http.paginate_stream(
             endpoint="search",
             total_results_limit=config.total_results_limit,
+            item_model=PageDto,
             **config.model_dump(mode="json"),
         ):
-            yield PageDto.model_validate(item)
+            yield item
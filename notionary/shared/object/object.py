@@ -217,8 +217,12 @@ class NotionObject:
     # --- Internal -------------------------------------------------------------
 
     async def _patch(self, dto: NotionObjectUpdateDto) -> NotionObjectResponseDto:
-        response = await self._http.patch(self._path, data=dto, exclude_unset=True)
-        return NotionObjectResponseDto.model_validate(response)
+        return await self._http.patch(
+            self._path,
+            data=dto,
+            exclude_unset=True,
+            response_model=NotionObjectResponseDto,
+        )
 
     @staticmethod
     def _extract_icon_emoji(icon: Icon | None) -> str | None:
@@ -23,5 +23,4 @@ class UserClient:
         return [adapter.validate_python(item) for item in raw]
 
     async def me(self) -> BotResponseDto:
-        response = await self._http.get("users/me")
-        return BotResponseDto.model_validate(response)
+        return await self._http.get("users/me", response_model=BotResponseDto)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal, overload
+from typing import TYPE_CHECKING, Literal, overload
 
 from notionary.http import HttpClient
 from notionary.user import mapper
@@ -8,17 +8,23 @@ from notionary.user.client import UserClient
 from notionary.user.models import Bot, Person, User
 from notionary.user.schemas import UserType
 
+if TYPE_CHECKING:
+    from notionary.mirror import Mirror
+
 
 class UsersNamespace:
     """Scoped access to Notion workspace users.
 
     Wraps the Notion Users API and maps raw responses to typed
     :class:`~notionary.user.models.Person` and
-    :class:`~notionary.user.models.Bot` objects.
+    :class:`~notionary.user.models.Bot` objects. With a
+    :class:`~notionary.mirror.Mirror`, :meth:`list` and :meth:`search` read
+    the mirrored user list.
     """
 
-    def __init__(self, http: HttpClient) -> None:
+    def __init__(self, http: HttpClient, mirror: Mirror | None = None) -> None:
         self._client = UserClient(http)
+        self._mirror = mirror
 
     @overload
     async def list(self, *, filter: Literal["person"]) -> list[Person]: ...
@@ -40,7 +46,11 @@ class UsersNamespace:
             A list of :class:`~notionary.user.models.Person`,
             :class:`~notionary.user.models.Bot`, or both.
         """
-        users = await self._client.list()
+        users = (
+            await self._mirror.list_users()
+            if self._mirror is not None
+            else await self._client.list()
+        )
         match filter:
             case "person":
                 return [mapper.to_person(u) for u in users if u.type == UserType.PERSON]
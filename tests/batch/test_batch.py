@@ -0,0 +1,121 @@
+import asyncio
+import gc
+import warnings
+
+import pytest
+
+from notionary.batch import Batch
+
+
+async def _value(value: int, delay: float = 0) -> int:
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail(message: str) -> None:
+    raise RuntimeError(message)
+
+
+class TestBatch:
+    @pytest.mark.asyncio
+    async def test_returns_results_in_queue_order(self) -> None:
+        async with Batch(max_concurrency=3) as batch:
+            batch.add(_value(1, delay=0.02))
+            batch.add(_value(2))
+            batch.add(_value(3, delay=0.01))
+
+        assert [r.value for r in batch.results] == [1, 2, 3]
+        assert [r.index for r in batch.results] == [0, 1, 2]
+        assert all(r.ok for r in batch.results)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded_without_aborting_others(self) -> None:
+        async with Batch() as batch:
+            batch.add(_value(1))
+            batch.add(_fail("boom"))
+            batch.add(_value(3))
+
+        assert batch.results[0].value == 1
+        assert not batch.results[1].ok
+        assert isinstance(batch.results[1].error, RuntimeError)
+        assert batch.results[2].value == 3
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def _tracked() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        async with Batch(max_concurrency=2) as batch:
+            for _ in range(6):
+                batch.add(_tracked())
+
+        assert peak == 2
+        assert len(batch.results) == 6
+
+    @pytest.mark.asyncio
+    async def test_reports_progress(self) -> None:
+        progress: list[tuple[int, int]] = []
+
+        async with Batch(
+            on_progress=lambda done, total: progress.append((done, total))
+        ) as batch:
+            batch.add(_value(1))
+            batch.add(_value(2))
+
+        assert progress == [(1, 2), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_nothing_runs_when_body_raises(self) -> None:
+        started: list[int] = []
+
+        async def _record(value: int) -> None:
+            started.append(value)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with pytest.raises(KeyError):
+                async with Batch() as batch:
+                    batch.add(_record(1))
+                    await asyncio.sleep(0)
+                    raise KeyError("abort")
+            gc.collect()
+
+        assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+        assert started == []
+        assert batch.results == []
+
+    @pytest.mark.asyncio
+    async def test_cancelling_gather_cancels_running_and_queued_operations(
+        self,
+    ) -> None:
+        started: list[int] = []
+
+        async def _slow(value: int) -> None:
+            started.append(value)
+            await asyncio.sleep(10)
+
+        batch = Batch(max_concurrency=1)
+        batch.add(_slow(1))
+        batch.add(_slow(2))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            running = asyncio.create_task(batch.gather())
+            await asyncio.sleep(0.01)
+            running.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await running
+            gc.collect()
+
+        assert started == [1]
+        assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            Batch(max_concurrency=0)
@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from notionary.page.schemas import PageDto
+
+DS_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+USER_ID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+
+
+def _build_page_dto(
+    number: int,
+    properties: dict[str, Any] | None = None,
+    *,
+    created_time: str = "2025-01-01T00:00:00.000Z",
+    last_edited_time: str = "2025-06-01T00:00:00.000Z",
+    in_trash: bool = False,
+) -> PageDto:
+    page_id = UUID(int=number)
+    return PageDto.model_validate(
+        {
+            "object": "page",
+            "id": str(page_id),
+            "url": f"https://notion.so/{page_id}",
+            "created_time": created_time,
+            "created_by": {"id": str(USER_ID)},
+            "last_edited_time": last_edited_time,
+            "last_edited_by": {"id": str(USER_ID)},
+            "icon": None,
+            "cover": None,
+            "parent": {
+                "type": "data_source_id",
+                "data_source_id": str(DS_ID),
+                "database_id": str(DS_ID),
+            },
+            "in_trash": in_trash,
+            "properties": properties or {},
+        }
+    )
+
+
+@pytest.fixture
+def page_dto() -> Callable[..., PageDto]:
+    """Build the data source row ``UUID(int=number)`` from raw property dicts."""
+    return _build_page_dto
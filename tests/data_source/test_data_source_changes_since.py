@@ -0,0 +1,154 @@
+import base64
+from collections.abc import Callable
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from notionary.data_source.client import DataSourceClient
+from notionary.data_source.schemas import SyncCheckpoint
+from notionary.page.schemas import PageDto
+
+DS_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+
+
+def _done(checked: bool) -> dict:
+    return {"Done": {"id": "d", "type": "checkbox", "checkbox": checked}}
+
+
+def _make_client(*dtos: PageDto) -> tuple[DataSourceClient, AsyncMock]:
+    http = AsyncMock()
+    http.consumed = 0
+
+    async def fake_stream(*args, **kwargs):
+        for dto in dtos:
+            http.consumed += 1
+            yield dto
+
+    http.paginate_stream = MagicMock(side_effect=fake_stream)
+    return DataSourceClient(http=http, data_source_id=DS_ID), http
+
+
+class TestSyncCheckpoint:
+    def test_token_round_trip(self) -> None:
+        checkpoint = SyncCheckpoint(
+            last_edited_time=datetime(2025, 6, 1, 12, 30, tzinfo=UTC)
+        )
+
+        restored = SyncCheckpoint.from_token(checkpoint.to_token())
+
+        assert restored == checkpoint
+
+    def test_reads_tokens_that_carry_page_ids(self) -> None:
+        token = base64.urlsafe_b64encode(
+            b'{"last_edited_time": "2025-06-01T12:30:00Z", "page_ids": []}'
+        ).decode()
+
+        restored = SyncCheckpoint.from_token(token)
+
+        assert restored.last_edited_time == datetime(2025, 6, 1, 12, 30, tzinfo=UTC)
+
+
+class TestChangesSince:
+    @pytest.mark.asyncio
+    async def test_first_sync_returns_all_pages_and_starts_checkpoint(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        client, http = _make_client(
+            page_dto(2, last_edited_time="2025-06-01T12:00:00.000Z"),
+            page_dto(1, last_edited_time="2025-06-01T11:00:00.000Z"),
+        )
+
+        changes = await client.changes_since()
+
+        assert [p.id for p in changes.pages] == [UUID(int=2), UUID(int=1)]
+        assert changes.checkpoint == SyncCheckpoint(
+            last_edited_time=datetime(2025, 6, 1, 12, tzinfo=UTC)
+        )
+        kwargs = http.paginate_stream.call_args.kwargs
+        assert "filter" not in kwargs
+        assert kwargs["sorts"] == [
+            {"timestamp": "last_edited_time", "direction": "descending"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filters_on_watermark(self) -> None:
+        client, http = _make_client()
+        checkpoint = SyncCheckpoint(
+            last_edited_time=datetime(2025, 6, 1, 12, tzinfo=UTC)
+        )
+
+        await client.changes_since(checkpoint)
+
+        assert http.paginate_stream.call_args.kwargs["filter"] == {
+            "timestamp": "last_edited_time",
+            "last_edited_time": {"on_or_after": "2025-06-01T12:00:00+00:00"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_stops_paginating_past_the_watermark(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        client, http = _make_client(
+            page_dto(3, last_edited_time="2025-06-01T13:00:00.000Z"),
+            page_dto(2, last_edited_time="2025-06-01T11:00:00.000Z"),
+            page_dto(1, last_edited_time="2025-06-01T10:00:00.000Z"),
+        )
+        checkpoint = SyncCheckpoint(
+            last_edited_time=datetime(2025, 6, 1, 12, tzinfo=UTC)
+        )
+
+        changes = await client.changes_since(checkpoint)
+
+        assert [p.id for p in changes.pages] == [UUID(int=3)]
+        assert http.consumed == 2
+
+    @pytest.mark.asyncio
+    async def test_returns_rows_at_the_watermark_again(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        client, _ = _make_client(
+            page_dto(2, last_edited_time="2025-06-01T12:00:00.000Z"),
+            page_dto(1, last_edited_time="2025-06-01T12:00:00.000Z"),
+        )
+        checkpoint = SyncCheckpoint(
+            last_edited_time=datetime(2025, 6, 1, 12, tzinfo=UTC)
+        )
+
+        changes = await client.changes_since(checkpoint.to_token())
+
+        assert [p.id for p in changes.pages] == [UUID(int=2), UUID(int=1)]
+        assert changes.checkpoint == checkpoint
+
+    @pytest.mark.asyncio
+    async def test_second_edit_in_the_same_minute_is_not_lost(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        first_edit = page_dto(
+            1, _done(False), last_edited_time="2025-06-01T12:00:00.000Z"
+        )
+        client, _ = _make_client(first_edit)
+        changes = await client.changes_since()
+
+        second_edit = page_dto(
+            1, _done(True), last_edited_time="2025-06-01T12:00:00.000Z"
+        )
+        client, _ = _make_client(second_edit)
+        changes = await client.changes_since(changes.token)
+
+        assert [p.id for p in changes.pages] == [UUID(int=1)]
+        assert changes.pages[0].properties.properties["Done"].checkbox is True
+
+    @pytest.mark.asyncio
+    async def test_no_changes_keeps_checkpoint(self) -> None:
+        client, _ = _make_client()
+        checkpoint = SyncCheckpoint(
+            last_edited_time=datetime(2025, 6, 1, 12, tzinfo=UTC)
+        )
+
+        changes = await client.changes_since(checkpoint)
+
+        assert changes.pages == []
+        assert changes.checkpoint == checkpoint
+        assert changes.token == checkpoint.to_token()
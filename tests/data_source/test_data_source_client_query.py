@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, patch
 from uuid import UUID
 
 import pytest
@@ -12,35 +13,42 @@ from notionary.data_source.query.filters import (
 )
 from notionary.data_source.query.sorts import PropertySort, SortDirection
 from notionary.page.page import Page
+from notionary.page.schemas import PageDto
 
 DS_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
 PAGE_ID = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
 USER_ID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
 
 
-def _page_response(page_id: UUID = PAGE_ID, title: str = "Test Page") -> dict:
-    return {
-        "object": "page",
-        "id": str(page_id),
-        "url": f"https://notion.so/{page_id}",
-        "created_time": "2025-01-01T00:00:00.000Z",
-        "created_by": {"id": str(USER_ID)},
-        "last_edited_time": "2025-06-01T00:00:00.000Z",
-        "last_edited_by": {"id": str(USER_ID)},
-        "icon": None,
-        "cover": None,
-        "parent": {"type": "workspace", "workspace": True},
-        "in_trash": False,
-        "properties": {
-            "Name": {
-                "id": "title",
-                "type": "title",
-                "title": [
-                    {"type": "text", "text": {"content": title}, "plain_text": title}
-                ],
-            }
-        },
-    }
+def _page_response(page_id: UUID = PAGE_ID, title: str = "Test Page") -> PageDto:
+    return PageDto.model_validate(
+        {
+            "object": "page",
+            "id": str(page_id),
+            "url": f"https://notion.so/{page_id}",
+            "created_time": "2025-01-01T00:00:00.000Z",
+            "created_by": {"id": str(USER_ID)},
+            "last_edited_time": "2025-06-01T00:00:00.000Z",
+            "last_edited_by": {"id": str(USER_ID)},
+            "icon": None,
+            "cover": None,
+            "parent": {"type": "workspace", "workspace": True},
+            "in_trash": False,
+            "properties": {
+                "Name": {
+                    "id": "title",
+                    "type": "title",
+                    "title": [
+                        {
+                            "type": "text",
+                            "text": {"content": title},
+                            "plain_text": title,
+                        }
+                    ],
+                }
+            },
+        }
+    )
 
 
 def _make_client() -> tuple[DataSourceClient, AsyncMock]:
@@ -61,6 +69,15 @@ class TestDataSourceClientQuery:
         assert isinstance(pages[0], Page)
         assert pages[0].id == PAGE_ID
 
+    @pytest.mark.asyncio
+    async def test_query_requests_page_dtos(self) -> None:
+        client, http = _make_client()
+        http.paginate = AsyncMock(return_value=[])
+
+        await client.query()
+
+        assert http.paginate.call_args.kwargs["item_model"] is PageDto
+
     @pytest.mark.asyncio
     async def test_query_passes_filter_to_paginate(self) -> None:
         client, http = _make_client()
@@ -220,3 +237,209 @@ class TestDataSourceClientIterQuery:
         pages = [p async for p in client.iter_query()]
 
         assert pages == []
+
+    @pytest.mark.asyncio
+    async def test_iter_query_passes_prefetch(self) -> None:
+        client, http = _make_client()
+        captured_kwargs: dict = {}
+
+        async def fake_stream(*args, **kwargs):
+            captured_kwargs.update(kwargs)
+            return
+            yield
+
+        http.paginate_stream = fake_stream
+
+        _ = [p async for p in client.iter_query(prefetch=3)]
+
+        assert captured_kwargs["prefetch"] == 3
+
+
+def _created_page(page_id: UUID, created_time: str, number: int = 1) -> PageDto:
+    dto = _page_response(page_id)
+    payload = dto.model_dump(mode="json", by_alias=True)
+    payload["created_time"] = created_time
+    payload["properties"]["ID"] = {
+        "id": "uid",
+        "type": "unique_id",
+        "unique_id": {"number": number, "prefix": None},
+    }
+    return PageDto.model_validate(payload)
+
+
+def _streams_by_call(*batches: list[PageDto] | Exception):
+    calls = iter(batches)
+
+    async def fake_stream(*args, **kwargs):
+        batch = next(calls)
+        if isinstance(batch, Exception):
+            raise batch
+        for dto in batch:
+            yield dto
+
+    return fake_stream
+
+
+class TestDataSourceClientParallelScan:
+    @pytest.mark.asyncio
+    async def test_splits_created_time_range_into_windows(self) -> None:
+        client, http = _make_client()
+        first = _created_page(UUID(int=1), "2025-01-01T00:00:00.000Z")
+        last = _created_page(UUID(int=2), "2025-01-01T04:00:00.000Z")
+        http.paginate = AsyncMock(side_effect=[[first], [last]])
+        http.paginate_stream = _streams_by_call([first], [], [], [last])
+        filters: list[dict | None] = []
+        stream = http.paginate_stream
+
+        async def recording_stream(*args, **kwargs):
+            filters.append(kwargs.get("filter"))
+            async for dto in stream(*args, **kwargs):
+                yield dto
+
+        http.paginate_stream = recording_stream
+
+        pages = [page async for page in client.parallel_scan(partitions=4)]
+
+        assert {page.id for page in pages} == {first.id, last.id}
+        assert len(filters) == 4
+        assert filters[0] == {
+            "timestamp": "created_time",
+            "created_time": {"before": "2025-01-01T01:00:00+00:00"},
+        }
+        assert filters[3] == {
+            "timestamp": "created_time",
+            "created_time": {"on_or_after": "2025-01-01T03:00:00+00:00"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_probes_use_opposite_sorts(self) -> None:
+        client, http = _make_client()
+        http.paginate = AsyncMock(return_value=[])
+        http.paginate_stream = _streams_by_call([])
+
+        [page async for page in client.parallel_scan()]
+
+        directions = [
+            call.kwargs["sorts"][0]["direction"]
+            for call in http.paginate.call_args_list
+        ]
+        assert directions == ["ascending"]
+        assert http.paginate.call_args.kwargs["total_results_limit"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_source_falls_back_to_single_query(self) -> None:
+        client, http = _make_client()
+        http.paginate = AsyncMock(return_value=[])
+        http.paginate_stream = _streams_by_call([])
+
+        pages = [page async for page in client.parallel_scan(partitions=8)]
+
+        assert pages == []
+
+    @pytest.mark.asyncio
+    async def test_single_partition_skips_probes(self) -> None:
+        client, http = _make_client()
+        http.paginate = AsyncMock()
+        http.paginate_stream = _streams_by_call([_page_response()])
+
+        pages = [page async for page in client.parallel_scan(partitions=1)]
+
+        assert len(pages) == 1
+        http.paginate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ordered_scan_yields_partitions_in_order(self) -> None:
+        client, http = _make_client()
+        pages = [
+            _created_page(UUID(int=i), "2025-01-01T00:00:00.000Z", number=i)
+            for i in range(1, 5)
+        ]
+        http.paginate = AsyncMock(side_effect=[[pages[0]], [pages[3]]])
+        http.paginate_stream = _streams_by_call(pages[:2], pages[2:])
+
+        result = [
+            page
+            async for page in client.parallel_scan(
+                partitions=2, partition_by="ID", ordered=True
+            )
+        ]
+
+        assert [page.id for page in result] == [p.id for p in pages]
+
+    @pytest.mark.asyncio
+    async def test_later_partitions_buffer_at_most_one_window(self) -> None:
+        client, http = _make_client()
+        first = _created_page(UUID(int=1), "2025-01-01T00:00:00.000Z", number=1)
+        last = _created_page(UUID(int=99), "2025-01-01T00:00:00.000Z", number=99)
+        tail = [
+            _created_page(UUID(int=i), "2025-01-01T00:00:00.000Z", number=i)
+            for i in range(50, 60)
+        ]
+        http.paginate = AsyncMock(side_effect=[[first], [last]])
+        release = asyncio.Event()
+        calls = 0
+        pulled = 0
+
+        async def fake_stream(*args, **kwargs):
+            nonlocal calls, pulled
+            calls += 1
+            if calls == 1:
+                await release.wait()
+                yield first
+                return
+            for dto in tail:
+                pulled += 1
+                yield dto
+
+        http.paginate_stream = fake_stream
+
+        with patch("notionary.data_source.client._WINDOW_BUFFER", 2):
+            scan = client.parallel_scan(partitions=2, partition_by="ID", ordered=True)
+            head = asyncio.create_task(anext(scan))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            buffered = pulled
+            release.set()
+            result = [await head] + [page async for page in scan]
+
+        assert buffered <= 3
+        assert [page.id for page in result] == [first.id] + [p.id for p in tail]
+
+    @pytest.mark.asyncio
+    async def test_closing_scan_with_full_buffers_does_not_hang(self) -> None:
+        client, http = _make_client()
+        pages = [
+            _created_page(UUID(int=i), "2025-01-01T00:00:00.000Z", number=i)
+            for i in range(1, 21)
+        ]
+        http.paginate = AsyncMock(side_effect=[[pages[0]], [pages[-1]]])
+        http.paginate_stream = _streams_by_call(pages[:10], pages[10:])
+
+        with patch("notionary.data_source.client._WINDOW_BUFFER", 1):
+            scan = client.parallel_scan(partitions=2, partition_by="ID", ordered=True)
+            await anext(scan)
+            await asyncio.wait_for(scan.aclose(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_partition_by_non_unique_id_property_raises(self) -> None:
+        client, http = _make_client()
+        http.paginate = AsyncMock(return_value=[_page_response()])
+
+        with pytest.raises(ValueError, match="Cannot partition by 'Name'"):
+            [page async for page in client.parallel_scan(partition_by="Name")]
+
+    @pytest.mark.asyncio
+    async def test_stream_error_is_propagated(self) -> None:
+        client, http = _make_client()
+        http.paginate = AsyncMock()
+        http.paginate_stream = _streams_by_call(RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            [page async for page in client.parallel_scan(partitions=1)]
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_partitions(self) -> None:
+        client, _ = _make_client()
+
+        with pytest.raises(ValueError, match="partitions"):
+            [page async for page in client.parallel_scan(partitions=0)]
@@ -0,0 +1,230 @@
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from notionary.data_source.query import (
+    Filter,
+    PropertySort,
+    SortDirection,
+    TimestampSort,
+)
+from notionary.data_source.query.evaluator import matches, sort_pages
+from notionary.data_source.query.filters import (
+    FormulaCondition,
+    FormulaFilter,
+    NumberCondition,
+)
+from notionary.page.schemas import PageDto
+
+RELATED_ID = "dddddddd-dddd-dddd-dddd-dddddddddddd"
+
+
+def _properties(
+    *,
+    name: str = "Launch",
+    priority: float | None = 3,
+    status: str | None = "Done",
+    tags: tuple[str, ...] = ("a", "b"),
+    due: str | None = "2025-03-10",
+    related: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    return {
+        "Name": {
+            "id": "title",
+            "type": "title",
+            "title": [{"type": "text", "plain_text": name}],
+        },
+        "Priority": {"id": "p", "type": "number", "number": priority},
+        "Status": {
+            "id": "s",
+            "type": "status",
+            "status": {"name": status} if status else None,
+        },
+        "Tags": {
+            "id": "t",
+            "type": "multi_select",
+            "multi_select": [{"name": tag} for tag in tags],
+        },
+        "Due": {"id": "d", "type": "date", "date": {"start": due} if due else None},
+        "Blocks": {
+            "id": "r",
+            "type": "relation",
+            "relation": [{"id": item} for item in related],
+        },
+        "Score": {
+            "id": "f",
+            "type": "formula",
+            "formula": {"type": "number", "number": (priority or 0) * 2},
+        },
+    }
+
+
+class TestMatches:
+    def test_text_conditions_ignore_case(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        page = page_dto(1, _properties(name="Launch Plan"))
+
+        assert matches(Filter.text("Name").contains("plan"), page)
+        assert matches(Filter.text("Name").starts_with("launch"), page)
+        assert not matches(Filter.text("Name").equals("launch plan"), page)
+        assert not matches(Filter.text("Name").is_empty(), page)
+
+    def test_number_conditions(self, page_dto: Callable[..., PageDto]) -> None:
+        page = page_dto(1, _properties(priority=3))
+
+        assert matches(Filter.number("Priority").greater_than(2), page)
+        assert matches(Filter.number("Priority").between(3, 5), page)
+        assert not matches(Filter.number("Priority").less_than(3), page)
+
+    def test_empty_number_only_matches_emptiness_checks(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        page = page_dto(1, _properties(priority=None))
+
+        assert matches(Filter.number("Priority").is_empty(), page)
+        assert not matches(Filter.number("Priority").greater_than(0), page)
+
+    def test_status_and_select_options(self, page_dto: Callable[..., PageDto]) -> None:
+        assert matches(
+            Filter.status("Status").equals("Done"), page_dto(1, _properties())
+        )
+        assert matches(
+            Filter.status("Status").not_equals("Todo"), page_dto(1, _properties())
+        )
+        assert matches(
+            Filter.status("Status").is_empty(), page_dto(1, _properties(status=None))
+        )
+
+    def test_multi_select_contains(self, page_dto: Callable[..., PageDto]) -> None:
+        page = page_dto(1, _properties(tags=("python", "async")))
+
+        assert matches(
+            Filter.multi_select("Tags").contains_all("python", "async"), page
+        )
+        assert matches(Filter.multi_select("Tags").contains_any("rust", "async"), page)
+        assert not matches(Filter.multi_select("Tags").does_not_contain("python"), page)
+
+    def test_date_conditions_compare_by_day(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        page = page_dto(1, _properties(due="2025-03-10T15:00:00.000Z"))
+
+        assert matches(Filter.date("Due").equals("2025-03-10"), page)
+        assert matches(Filter.date("Due").after("2025-03-09"), page)
+        assert not matches(Filter.date("Due").before("2025-03-10"), page)
+        assert matches(
+            Filter.date("Due").is_empty(), page_dto(2, _properties(due=None))
+        )
+
+    def test_relative_date_range(self, page_dto: Callable[..., PageDto]) -> None:
+        yesterday = (datetime.now(UTC) - timedelta(days=1)).date().isoformat()
+        last_year = (datetime.now(UTC) - timedelta(days=400)).date().isoformat()
+
+        assert matches(
+            Filter.date("Due").past_week(), page_dto(1, _properties(due=yesterday))
+        )
+        assert not matches(
+            Filter.date("Due").past_week(), page_dto(1, _properties(due=last_year))
+        )
+
+    def test_relation_ignores_id_formatting(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        page = page_dto(1, _properties(related=(RELATED_ID,)))
+
+        assert matches(
+            Filter.relation("Blocks").contains(RELATED_ID.replace("-", "")), page
+        )
+        assert matches(Filter.relation("Blocks").is_empty(), page_dto(2, _properties()))
+
+    def test_formula_uses_typed_result(self, page_dto: Callable[..., PageDto]) -> None:
+        page = page_dto(1, _properties(priority=3))
+
+        assert matches(
+            FormulaFilter(
+                property="Score",
+                formula=FormulaCondition(number=NumberCondition(equals=6)),
+            ),
+            page,
+        )
+
+    def test_timestamp_filter(self, page_dto: Callable[..., PageDto]) -> None:
+        page = page_dto(1, _properties(), created_time="2025-02-01T10:00:00.000Z")
+
+        assert matches(Filter.created_after("2025-01-15"), page)
+        assert not matches(Filter.created_before("2025-01-15"), page)
+
+    def test_compound_filters(self, page_dto: Callable[..., PageDto]) -> None:
+        page = page_dto(1, _properties(priority=3, status="Done"))
+
+        assert matches(
+            Filter.all(
+                Filter.status("Status").equals("Done"),
+                Filter.any(
+                    Filter.number("Priority").greater_than(5),
+                    Filter.text("Name").contains("launch"),
+                ),
+            ),
+            page,
+        )
+        assert not matches(
+            Filter.all(
+                Filter.status("Status").equals("Done"),
+                Filter.number("Priority").greater_than(5),
+            ),
+            page,
+        )
+
+    def test_unknown_property_raises(self, page_dto: Callable[..., PageDto]) -> None:
+        with pytest.raises(ValueError, match="Unknown property"):
+            matches(Filter.text("Missing").contains("x"), page_dto(1, _properties()))
+
+
+class TestSortPages:
+    def test_sorts_by_multiple_keys(self, page_dto: Callable[..., PageDto]) -> None:
+        pages = [
+            page_dto(1, _properties(name="b", priority=1)),
+            page_dto(2, _properties(name="a", priority=2)),
+            page_dto(3, _properties(name="c", priority=2)),
+        ]
+
+        ordered = sort_pages(
+            pages,
+            [
+                PropertySort(property="Priority", direction=SortDirection.DESCENDING),
+                PropertySort(property="Name"),
+            ],
+        )
+
+        assert [page.id.int for page in ordered] == [2, 3, 1]
+
+    def test_empty_values_come_last_in_both_directions(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        pages = [
+            page_dto(1, _properties(priority=None)),
+            page_dto(2, _properties(priority=1)),
+            page_dto(3, _properties(priority=5)),
+        ]
+
+        ascending = sort_pages(pages, [PropertySort(property="Priority")])
+        descending = sort_pages(
+            pages,
+            [PropertySort(property="Priority", direction=SortDirection.DESCENDING)],
+        )
+
+        assert [page.id.int for page in ascending] == [2, 3, 1]
+        assert [page.id.int for page in descending] == [3, 2, 1]
+
+    def test_sorts_by_timestamp(self, page_dto: Callable[..., PageDto]) -> None:
+        pages = [
+            page_dto(1, _properties(), created_time="2025-03-01T00:00:00.000Z"),
+            page_dto(2, _properties(), created_time="2025-01-01T00:00:00.000Z"),
+        ]
+
+        ordered = sort_pages(pages, [TimestampSort(timestamp="created_time")])
+
+        assert [page.id.int for page in ordered] == [2, 1]
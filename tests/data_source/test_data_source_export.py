@@ -0,0 +1,255 @@
+import csv
+import json
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from notionary.data_source.data_source import DataSource
+from notionary.data_source.export import arrow_schema, to_columns
+from notionary.data_source.properties.schemas import (
+    DataSourceCheckboxProperty,
+    DataSourceDateProperty,
+    DataSourceMultiSelectProperty,
+    DataSourceNumberProperty,
+    DataSourceTitleProperty,
+)
+from notionary.page.schemas import PageDto
+from notionary.user.schemas import PartialUserDto
+
+pa = pytest.importorskip("pyarrow")
+
+DS_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+USER_ID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+
+
+def _properties(title: str, score: float | None, tags: list[str]) -> dict[str, Any]:
+    return {
+        "Name": {
+            "id": "title",
+            "type": "title",
+            "title": [{"type": "text", "plain_text": title}],
+        },
+        "Score": {"id": "s", "type": "number", "number": score},
+        "Done": {"id": "d", "type": "checkbox", "checkbox": score is not None},
+        "Due": {"id": "due", "type": "date", "date": {"start": "2025-03-01"}},
+        "Tags": {
+            "id": "t",
+            "type": "multi_select",
+            "multi_select": [{"name": tag} for tag in tags],
+        },
+    }
+
+
+@pytest.fixture
+def pages(page_dto: Callable[..., PageDto]) -> list[PageDto]:
+    return [
+        page_dto(1, _properties("First", 1.5, ["a", "b"])),
+        page_dto(2, _properties("Second", None, [])),
+    ]
+
+
+def _make_data_source(*dtos: PageDto) -> DataSource:
+    http = AsyncMock()
+
+    async def fake_stream(*args, **kwargs):
+        for dto in dtos:
+            yield dto
+
+    http.paginate_stream = MagicMock(side_effect=fake_stream)
+    return DataSource(
+        id=DS_ID,
+        url="https://notion.so/test-ds",
+        title="Tasks",
+        description=None,
+        icon=None,
+        cover=None,
+        in_trash=False,
+        properties={
+            "Name": DataSourceTitleProperty(id=UUID(int=10), name="Name"),
+            "Score": DataSourceNumberProperty.model_validate(
+                {
+                    "id": str(UUID(int=11)),
+                    "name": "Score",
+                    "number": {"format": "number"},
+                }
+            ),
+            "Done": DataSourceCheckboxProperty(id=UUID(int=12), name="Done"),
+            "Due": DataSourceDateProperty(id=UUID(int=13), name="Due"),
+            "Tags": DataSourceMultiSelectProperty(id=UUID(int=14), name="Tags"),
+        },
+        http=http,
+        created_time="2025-01-01T00:00:00.000Z",
+        created_by=PartialUserDto(id=USER_ID),
+        last_edited_time="2025-06-01T00:00:00.000Z",
+        last_edited_by=PartialUserDto(id=USER_ID),
+    )
+
+
+class TestToColumns:
+    def test_maps_properties_to_plain_values(self, pages: list[PageDto]) -> None:
+        columns = to_columns(pages, ["Name", "Score", "Done", "Due", "Tags"])
+
+        assert columns["id"] == [str(UUID(int=1)), str(UUID(int=2))]
+        assert columns["Name"] == ["First", "Second"]
+        assert columns["Score"] == [1.5, None]
+        assert columns["Done"] == [True, False]
+        assert columns["Due"] == [datetime(2025, 3, 1, tzinfo=UTC)] * 2
+        assert columns["Tags"] == [["a", "b"], []]
+
+    def test_missing_property_is_none(self, pages: list[PageDto]) -> None:
+        columns = to_columns(pages[:1], ["Missing"])
+
+        assert columns["Missing"] == [None]
+
+    def test_property_named_like_base_column_is_prefixed(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        dto = page_dto(
+            1,
+            {
+                "id": {"id": "x", "type": "rich_text", "rich_text": []},
+                "url": {"id": "u", "type": "url", "url": "https://example.com"},
+            },
+        )
+
+        columns = to_columns([dto], ["id", "url"])
+
+        assert columns["id"] == [str(UUID(int=1))]
+        assert columns["url"] == [f"https://notion.so/{UUID(int=1)}"]
+        assert columns["properties.id"] == [""]
+        assert columns["properties.url"] == ["https://example.com"]
+
+    def test_schema_keeps_base_columns_distinct(self) -> None:
+        schema = arrow_schema({"id": "rich_text", "properties.id": "number"})
+
+        assert schema.names[:2] == ["id", "url"]
+        assert schema.field("properties.properties.id").type == pa.string()
+        assert schema.field("properties.id").type == pa.float64()
+
+    def test_array_rollup_is_serialized_as_json(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        dto = page_dto(
+            1,
+            {
+                "Owners": {
+                    "id": "r",
+                    "type": "rollup",
+                    "rollup": {
+                        "type": "array",
+                        "function": "show_original",
+                        "array": [
+                            {
+                                "type": "title",
+                                "title": [{"type": "text", "plain_text": "A"}],
+                            },
+                            {"type": "date", "date": {"start": "2025-03-01"}},
+                            {"type": "multi_select", "multi_select": []},
+                        ],
+                    },
+                }
+            },
+        )
+
+        columns = to_columns([dto], ["Owners"])
+
+        assert json.loads(columns["Owners"][0]) == [
+            "A",
+            "2025-03-01T00:00:00+00:00",
+            [],
+        ]
+
+
+class TestDataSourceExport:
+    @pytest.mark.asyncio
+    async def test_arrow_export_returns_typed_table(self, pages: list[PageDto]) -> None:
+        ds = _make_data_source(*pages)
+
+        table = await ds.export(batch_size=1)
+
+        assert table.num_rows == 2
+        assert table.schema.field("Score").type == pa.float64()
+        assert table.schema.field("Done").type == pa.bool_()
+        assert table.schema.field("Tags").type == pa.list_(pa.string())
+        assert table.schema.field("Due").type == pa.timestamp("us", tz="UTC")
+        assert table.column("Name").to_pylist() == ["First", "Second"]
+
+    @pytest.mark.asyncio
+    async def test_empty_export_keeps_schema(self) -> None:
+        ds = _make_data_source()
+
+        table = await ds.export()
+
+        assert table.num_rows == 0
+        assert "Tags" in table.schema.names
+
+    @pytest.mark.asyncio
+    async def test_parquet_export_writes_file(
+        self, pages: list[PageDto], tmp_path: Path
+    ) -> None:
+        pq = pytest.importorskip("pyarrow.parquet")
+        ds = _make_data_source(*pages)
+
+        path = await ds.export(tmp_path / "tasks.parquet", format="parquet")
+
+        assert pq.read_table(path).column("Score").to_pylist() == [1.5, None]
+
+    @pytest.mark.asyncio
+    async def test_csv_export_writes_header_and_rows(
+        self, pages: list[PageDto], tmp_path: Path
+    ) -> None:
+        ds = _make_data_source(*pages)
+
+        path = await ds.export(tmp_path / "tasks.csv", format="csv")
+
+        with path.open(newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert [row["Name"] for row in rows] == ["First", "Second"]
+        assert rows[0]["Tags"] == "a, b"
+        assert rows[0]["Due"] == "2025-03-01T00:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_csv_rows_are_written_off_the_event_loop(
+        self, pages: list[PageDto], tmp_path: Path
+    ) -> None:
+        ds = _make_data_source(*pages)
+        threads: list[int] = []
+        make_writer = csv.writer
+
+        def recording_writer(file):
+            writer = make_writer(file)
+
+            def writerows(rows):
+                threads.append(threading.get_ident())
+                writer.writerows(rows)
+
+            return MagicMock(wraps=writer, writerows=writerows)
+
+        with patch("notionary.data_source.export.csv.writer", recording_writer):
+            await ds.export(tmp_path / "tasks.csv", format="csv")
+
+        assert threads
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_file_formats_require_path(self) -> None:
+        ds = _make_data_source()
+
+        with pytest.raises(ValueError, match="requires a path"):
+            await ds.export(format="parquet")
+
+    @pytest.mark.asyncio
+    async def test_streams_full_result_pages(self, pages: list[PageDto]) -> None:
+        ds = _make_data_source(*pages)
+
+        await ds.export()
+
+        kwargs = ds._http.paginate_stream.call_args.kwargs
+        assert kwargs["page_size"] == 100
+        assert kwargs["item_model"] is PageDto
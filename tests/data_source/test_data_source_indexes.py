@@ -0,0 +1,177 @@
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from notionary.data_source.query import Filter
+from notionary.data_source.query.evaluator import matches
+from notionary.data_source.query.indexes import (
+    HashIndex,
+    SortedIndex,
+    build_index,
+    candidates,
+)
+from notionary.page.schemas import PageDto
+from notionary.shared.properties.type import PropertyType
+
+RELATED_ID = "dddddddd-dddd-dddd-dddd-dddddddddddd"
+
+
+def _properties(
+    *,
+    status: str | None = "Done",
+    priority: float | None = 1,
+    due: str | None = None,
+    related: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    return {
+        "Name": {
+            "id": "title",
+            "type": "title",
+            "title": [{"type": "text", "plain_text": "Task"}],
+        },
+        "Status": {
+            "id": "s",
+            "type": "status",
+            "status": {"name": status} if status else None,
+        },
+        "Priority": {"id": "p", "type": "number", "number": priority},
+        "Due": {"id": "d", "type": "date", "date": {"start": due} if due else None},
+        "Blocks": {
+            "id": "r",
+            "type": "relation",
+            "relation": [{"id": item} for item in related],
+        },
+    }
+
+
+def _ids(*numbers: int) -> set[UUID]:
+    return {UUID(int=n) for n in numbers}
+
+
+class TestHashIndex:
+    def test_lookup_and_update(self, page_dto: Callable[..., PageDto]) -> None:
+        index = HashIndex("Status")
+        index.add(page_dto(1, _properties(status="Done")))
+        index.add(page_dto(2, _properties(status="Todo")))
+
+        index.add(page_dto(2, _properties(status="Done")))
+
+        assert index.lookup("Done") == _ids(1, 2)
+        assert index.lookup("Todo") == set()
+
+    def test_remove_and_empty(self, page_dto: Callable[..., PageDto]) -> None:
+        index = HashIndex("Status")
+        index.add(page_dto(1, _properties(status=None)))
+        index.add(page_dto(2, _properties()))
+
+        index.remove(UUID(int=2))
+
+        assert index.empty() == _ids(1)
+        assert index.lookup("Done") == set()
+
+
+class TestSortedIndex:
+    def test_between_is_inclusive(self, page_dto: Callable[..., PageDto]) -> None:
+        index = SortedIndex("Priority")
+        for number, priority in enumerate([1, 3, 3, 7], start=1):
+            index.add(page_dto(number, _properties(priority=priority)))
+
+        assert index.between(3, 7) == _ids(2, 3, 4)
+        assert index.between(high=2) == _ids(1)
+        assert index.between(low=8) == set()
+
+    def test_update_moves_entry(self, page_dto: Callable[..., PageDto]) -> None:
+        index = SortedIndex("Priority")
+        index.add(page_dto(1, _properties(priority=1)))
+
+        index.add(page_dto(1, _properties(priority=None)))
+
+        assert index.between() == set()
+        assert index.empty() == _ids(1)
+
+
+class TestCandidates:
+    @pytest.fixture
+    def pages(self, page_dto: Callable[..., PageDto]) -> list[PageDto]:
+        return [
+            page_dto(1, _properties(status="Done", priority=1, due="2025-03-01")),
+            page_dto(
+                2,
+                _properties(status="Todo", priority=5, due="2025-03-10T23:30:00+02:00"),
+            ),
+            page_dto(
+                3, _properties(status="Todo", priority=None, related=(RELATED_ID,))
+            ),
+        ]
+
+    @pytest.fixture
+    def indexes(self, pages: list[PageDto]) -> dict[str, HashIndex | SortedIndex]:
+        indexes = {
+            "Status": build_index("Status", PropertyType.STATUS),
+            "Priority": build_index("Priority", PropertyType.NUMBER),
+            "Due": build_index("Due", PropertyType.DATE),
+            "Blocks": build_index("Blocks", PropertyType.RELATION),
+        }
+        for index in indexes.values():
+            for page in pages:
+                index.add(page)
+        return indexes
+
+    @pytest.mark.parametrize(
+        "filter",
+        [
+            Filter.status("Status").equals("Todo"),
+            Filter.number("Priority").greater_than(1),
+            Filter.number("Priority").between(1, 5),
+            Filter.number("Priority").is_empty(),
+            Filter.date("Due").equals("2025-03-10"),
+            Filter.date("Due").before("2025-03-05"),
+            Filter.relation("Blocks").contains(RELATED_ID.replace("-", "")),
+            Filter.all(
+                Filter.status("Status").equals("Todo"),
+                Filter.number("Priority").greater_than(2),
+            ),
+            Filter.any(
+                Filter.status("Status").equals("Done"),
+                Filter.relation("Blocks").is_empty(),
+            ),
+        ],
+    )
+    def test_candidates_contain_every_match(
+        self,
+        filter: Any,
+        pages: list[PageDto],
+        indexes: dict[str, HashIndex | SortedIndex],
+    ) -> None:
+        expected = {page.id for page in pages if matches(filter, page)}
+
+        found = candidates(filter, indexes)
+
+        assert found is not None
+        assert expected <= found
+
+    def test_narrows_equality_lookups(
+        self, indexes: dict[str, HashIndex | SortedIndex]
+    ) -> None:
+        assert candidates(Filter.status("Status").equals("Todo"), indexes) == _ids(2, 3)
+
+    def test_falls_back_to_scan_without_index(
+        self, indexes: dict[str, HashIndex | SortedIndex]
+    ) -> None:
+        assert candidates(Filter.text("Name").contains("Task"), indexes) is None
+        assert (
+            candidates(
+                Filter.any(
+                    Filter.status("Status").equals("Done"),
+                    Filter.text("Name").contains("Task"),
+                ),
+                indexes,
+            )
+            is None
+        )
+
+    def test_rejects_unindexable_type(self) -> None:
+        with pytest.raises(ValueError, match="cannot be indexed"):
+            build_index("Name", PropertyType.TITLE)
@@ -137,12 +137,14 @@ class TestFromId:
     async def test_fetches_and_returns_data_source(self) -> None:
         dto = _dto(DS_ID_1, "Fetched DB")
         http = AsyncMock()
-        http.get = AsyncMock(return_value=dto.model_dump(mode="json"))
+        http.get = AsyncMock(return_value=dto)
         ns = DataSourceNamespace(http)
 
         result = await ns.from_id(DS_ID_1)
 
-        http.get.assert_called_once_with(f"databases/{DS_ID_1}")
+        http.get.assert_called_once_with(
+            f"databases/{DS_ID_1}", response_model=DataSourceDto
+        )
         assert result.id == DS_ID_1
         assert result.title == "Fetched DB"
 
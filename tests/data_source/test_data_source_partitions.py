@@ -0,0 +1,85 @@
+from datetime import UTC, datetime
+
+from notionary.data_source.query.filters import (
+    CompoundFilter,
+    TimestampFilter,
+    TimestampType,
+    UniqueIdFilter,
+)
+from notionary.data_source.query.partitions import (
+    timestamp_windows,
+    unique_id_windows,
+)
+
+
+def _dump(f: object) -> dict | None:
+    return f.model_dump(mode="json", by_alias=True) if f is not None else None
+
+
+class TestTimestampWindows:
+    def test_splits_range_into_disjoint_minute_windows(self) -> None:
+        windows = timestamp_windows(
+            TimestampType.CREATED_TIME,
+            datetime(2025, 1, 1, tzinfo=UTC),
+            datetime(2025, 1, 1, 4, tzinfo=UTC),
+            partitions=4,
+        )
+
+        assert len(windows) == 4
+        assert _dump(windows[0]) == {
+            "timestamp": "created_time",
+            "created_time": {"before": "2025-01-01T01:00:00+00:00"},
+        }
+        assert isinstance(windows[1], CompoundFilter)
+        assert _dump(windows[1]) == {
+            "and": [
+                {
+                    "timestamp": "created_time",
+                    "created_time": {"on_or_after": "2025-01-01T01:00:00+00:00"},
+                },
+                {
+                    "timestamp": "created_time",
+                    "created_time": {"before": "2025-01-01T02:00:00+00:00"},
+                },
+            ]
+        }
+        assert _dump(windows[3]) == {
+            "timestamp": "created_time",
+            "created_time": {"on_or_after": "2025-01-01T03:00:00+00:00"},
+        }
+
+    def test_boundaries_are_floored_to_minutes(self) -> None:
+        windows = timestamp_windows(
+            TimestampType.CREATED_TIME,
+            datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
+            datetime(2025, 1, 1, 0, 3, 30, tzinfo=UTC),
+            partitions=2,
+        )
+
+        assert isinstance(windows[0], TimestampFilter)
+        assert windows[0].condition.before == "2025-01-01T00:01:00+00:00"
+
+    def test_narrow_range_collapses_to_single_unbounded_window(self) -> None:
+        moment = datetime(2025, 1, 1, tzinfo=UTC)
+
+        windows = timestamp_windows(TimestampType.CREATED_TIME, moment, moment, 8)
+
+        assert windows == [None]
+
+
+class TestUniqueIdWindows:
+    def test_splits_id_range(self) -> None:
+        windows = unique_id_windows("ID", 1, 100, partitions=4)
+
+        assert len(windows) == 4
+        assert isinstance(windows[0], UniqueIdFilter)
+        assert windows[0].unique_id.less_than == 26
+        assert _dump(windows[3]) == {
+            "property": "ID",
+            "unique_id": {"greater_than_or_equal_to": 76},
+        }
+
+    def test_never_creates_more_windows_than_ids(self) -> None:
+        windows = unique_id_windows("ID", 1, 2, partitions=10)
+
+        assert len(windows) == 2
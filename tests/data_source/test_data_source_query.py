@@ -1,9 +1,16 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
+import httpx
 import pytest
 
 from notionary.data_source.data_source import DataSource
+from notionary.data_source.properties.schemas import (
+    DataSourceDateProperty,
+    DataSourceStatusProperty,
+    DataSourceTitleProperty,
+    DataSourceUniqueIdProperty,
+)
 from notionary.data_source.query.filters import (
     CheckboxCondition,
     CheckboxFilter,
@@ -14,6 +21,7 @@ from notionary.data_source.query.filters import (
     TextCondition,
 )
 from notionary.data_source.query.sorts import PropertySort, SortDirection
+from notionary.http import HttpClient, TransportConfig
 from notionary.page.page import Page
 from notionary.user.schemas import PartialUserDto
 
@@ -79,6 +87,7 @@ class TestDataSourceQuery:
             filter_properties=None,
             in_trash=None,
             limit=None,
+            as_rows=False,
         )
         assert result == expected
 
@@ -97,6 +106,7 @@ class TestDataSourceQuery:
             filter_properties=["Name"],
             in_trash=True,
             limit=10,
+            as_rows=True,
         )
 
         ds._client.query.assert_called_once_with(
@@ -106,6 +116,7 @@ class TestDataSourceQuery:
             filter_properties=["Name"],
             in_trash=True,
             limit=10,
+            as_rows=True,
         )
 
     @pytest.mark.asyncio
@@ -181,3 +192,123 @@ class TestDataSourceIterQuery:
         assert len(pages) == 2
         assert pages[0].title == "First"
         assert pages[1].title == "Second"
+
+
+class TestDataSourceSelect:
+    @staticmethod
+    def _data_source_with_schema() -> DataSource:
+        ds = _make_data_source()
+        ds.properties = {
+            "Name": DataSourceTitleProperty(id=UUID(int=1), name="Name"),
+            "Status": DataSourceStatusProperty(id=UUID(int=2), name="Status"),
+            "Due": DataSourceDateProperty(id=UUID(int=3), name="Due"),
+        }
+        return ds
+
+    @pytest.mark.asyncio
+    async def test_select_resolves_names_to_property_ids(self) -> None:
+        ds = self._data_source_with_schema()
+        ds._client.query = AsyncMock(return_value=[])
+
+        await ds.query(select=["Status"])
+
+        assert ds._client.query.call_args.kwargs["filter_properties"] == [
+            str(UUID(int=1)),
+            str(UUID(int=2)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_select_is_merged_with_filter_properties(self) -> None:
+        ds = self._data_source_with_schema()
+        ds._client.query = AsyncMock(return_value=[])
+
+        await ds.query(select=["Name", "Due"], filter_properties=["raw"])
+
+        assert ds._client.query.call_args.kwargs["filter_properties"] == [
+            "raw",
+            str(UUID(int=1)),
+            str(UUID(int=3)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_encoded_property_ids_are_sent_once_encoded(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(
+                200, json={"results": [], "has_more": False, "next_cursor": None}
+            )
+
+        ds = _make_data_source()
+        ds._http = ds._client._http = HttpClient(
+            token="test-token",
+            transport=TransportConfig(transport=httpx.MockTransport(handler)),
+        )
+        ds.properties = {
+            "Name": DataSourceTitleProperty(id="title", name="Name"),
+            "Status": DataSourceStatusProperty(id="%3AUPp", name="Status"),
+        }
+
+        await ds.query(select=["Status"])
+        await ds._http.close()
+
+        assert seen[0].url.query == b"filter_properties=title&filter_properties=%3AUPp"
+
+    @pytest.mark.asyncio
+    async def test_select_unknown_property_raises(self) -> None:
+        ds = self._data_source_with_schema()
+
+        with pytest.raises(ValueError, match="Unknown property: 'Missing'"):
+            await ds.query(select=["Missing"])
+
+    @pytest.mark.asyncio
+    async def test_iter_query_sends_projection(self) -> None:
+        ds = self._data_source_with_schema()
+
+        async def fake_stream(*args, **kwargs):
+            return
+            yield
+
+        ds._http.paginate_stream = MagicMock(side_effect=fake_stream)
+
+        [page async for page in ds.iter_query(select=["Status"])]
+
+        assert ds._http.paginate_stream.call_args.kwargs["query_params"] == {
+            "filter_properties": [str(UUID(int=1)), str(UUID(int=2))]
+        }
+
+
+class TestDataSourceParallelScan:
+    @staticmethod
+    def _data_source_with_schema() -> DataSource:
+        ds = _make_data_source()
+        ds.properties = {
+            "Name": DataSourceTitleProperty(id=UUID(int=1), name="Name"),
+            "ID": DataSourceUniqueIdProperty(id=UUID(int=2), name="ID"),
+        }
+        return ds
+
+    @pytest.mark.asyncio
+    async def test_unsupported_partition_key_raises_before_requests(self) -> None:
+        ds = self._data_source_with_schema()
+
+        with pytest.raises(ValueError, match=r"'created_time', 'ID'"):
+            [page async for page in ds.parallel_scan(partition_by="Name")]
+
+        ds._http.paginate.assert_not_called()
+        ds._http.paginate_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unique_id_property_is_accepted(self) -> None:
+        ds = self._data_source_with_schema()
+
+        async def fake_scan(**kwargs):
+            yield _fake_page()
+
+        ds._client.parallel_scan = MagicMock(side_effect=fake_scan)
+
+        pages = [page async for page in ds.parallel_scan(partition_by="ID")]
+
+        assert len(pages) == 1
+        assert ds._client.parallel_scan.call_args.kwargs["partition_by"] == "ID"
@@ -0,0 +1,127 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from notionary.data_source.client import DataSourceClient
+from notionary.data_source.row import Row
+from notionary.page.page import Page
+from notionary.page.schemas import PageDto
+
+DS_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+PAGE_ID = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
+USER_ID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+
+
+def _dto(title: str = "Launch") -> PageDto:
+    return PageDto.model_validate(
+        {
+            "object": "page",
+            "id": str(PAGE_ID),
+            "url": f"https://notion.so/{PAGE_ID}",
+            "created_time": "2025-01-01T00:00:00.000Z",
+            "created_by": {"id": str(USER_ID)},
+            "last_edited_time": "2025-06-01T00:00:00.000Z",
+            "last_edited_by": {"id": str(USER_ID)},
+            "icon": None,
+            "cover": None,
+            "parent": {
+                "type": "data_source_id",
+                "data_source_id": str(DS_ID),
+                "database_id": str(DS_ID),
+            },
+            "in_trash": False,
+            "properties": {
+                "Name": {
+                    "id": "title",
+                    "type": "title",
+                    "title": [{"type": "text", "plain_text": title}],
+                },
+                "Status": {
+                    "id": "s",
+                    "type": "status",
+                    "status": {"name": "Done"},
+                },
+                "Tags": {
+                    "id": "t",
+                    "type": "multi_select",
+                    "multi_select": [{"name": "a"}, {"name": "b"}],
+                },
+            },
+        }
+    )
+
+
+class TestRow:
+    def test_exposes_metadata(self) -> None:
+        row = Row(_dto(), AsyncMock())
+
+        assert row.id == PAGE_ID
+        assert row.title == "Launch"
+        assert row.last_edited_time == "2025-06-01T00:00:00.000Z"
+
+    def test_has_no_instance_dict(self) -> None:
+        row = Row(_dto(), AsyncMock())
+
+        assert not hasattr(row, "__dict__")
+
+    def test_decodes_property_values(self) -> None:
+        row = Row(_dto(), AsyncMock())
+
+        assert row["Status"] == "Done"
+        assert row["Tags"] == ["a", "b"]
+        assert row.properties == {
+            "Name": "Launch",
+            "Status": "Done",
+            "Tags": ["a", "b"],
+        }
+
+    def test_caches_decoded_values(self) -> None:
+        row = Row(_dto(), AsyncMock())
+
+        assert row["Tags"] is row["Tags"]
+
+    def test_get_returns_default_for_unknown_property(self) -> None:
+        row = Row(_dto(), AsyncMock())
+
+        assert row.get("Missing", "n/a") == "n/a"
+        with pytest.raises(KeyError):
+            row["Missing"]
+
+    def test_to_page_builds_full_page(self) -> None:
+        row = Row(_dto(), AsyncMock())
+
+        page = row.to_page()
+
+        assert isinstance(page, Page)
+        assert page.id == PAGE_ID
+        assert page.title == "Launch"
+
+
+class TestDataSourceClientRows:
+    @pytest.mark.asyncio
+    async def test_query_as_rows(self) -> None:
+        http = AsyncMock()
+        http.paginate = AsyncMock(return_value=[_dto()])
+        client = DataSourceClient(http=http, data_source_id=DS_ID)
+
+        rows = await client.query(as_rows=True)
+
+        assert len(rows) == 1
+        assert isinstance(rows[0], Row)
+
+    @pytest.mark.asyncio
+    async def test_iter_rows(self) -> None:
+        http = AsyncMock()
+
+        async def fake_stream(*args, **kwargs):
+            yield _dto("One")
+            yield _dto("Two")
+
+        http.paginate_stream = MagicMock(side_effect=fake_stream)
+        client = DataSourceClient(http=http, data_source_id=DS_ID)
+
+        titles = [row.title async for row in client.iter_rows(limit=2)]
+
+        assert titles == ["One", "Two"]
+        assert http.paginate_stream.call_args.kwargs["total_results_limit"] == 2
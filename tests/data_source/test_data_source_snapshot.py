@@ -0,0 +1,167 @@
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from notionary.data_source.client import DataSourceClient
+from notionary.data_source.query import Filter, PropertySort
+from notionary.data_source.snapshot import DataSourceSnapshot
+from notionary.page.schemas import PageDto
+from notionary.shared.properties.type import PropertyType
+
+FILTER = Filter.number("Priority").greater_than_or_equal_to(2)
+
+DS_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+
+
+def _properties(number: int, priority: float) -> dict[str, Any]:
+    return {
+        "Name": {
+            "id": "title",
+            "type": "title",
+            "title": [{"type": "text", "plain_text": f"Task {number}"}],
+        },
+        "Priority": {"id": "p", "type": "number", "number": priority},
+    }
+
+
+def _make_snapshot(*batches: list[PageDto]) -> tuple[DataSourceSnapshot, AsyncMock]:
+    http = AsyncMock()
+    remaining = list(batches)
+
+    async def fake_stream(*args, **kwargs):
+        for dto in remaining.pop(0):
+            yield dto
+
+    http.paginate_stream = MagicMock(side_effect=fake_stream)
+    client = DataSourceClient(http=http, data_source_id=DS_ID)
+    snapshot = DataSourceSnapshot(client, http, {"Priority": PropertyType.NUMBER})
+    return snapshot, http
+
+
+class _FakeQueryEndpoint:
+    """Answers data source queries like the API: newest first, and trashed
+    pages only when ``in_trash`` is requested."""
+
+    def __init__(self, *pages: PageDto) -> None:
+        self._pages = {page.id: page for page in pages}
+
+    def save(self, page: PageDto) -> None:
+        self._pages[page.id] = page
+
+    async def stream(self, *args, **kwargs):
+        in_trash = kwargs.get("in_trash", False)
+        since = (
+            kwargs["filter"]["last_edited_time"]["on_or_after"]
+            if "filter" in kwargs
+            else None
+        )
+        pages = sorted(
+            (p for p in self._pages.values() if p.in_trash == in_trash),
+            key=lambda p: p.last_edited_time,
+            reverse=True,
+        )
+        for page in pages:
+            edited = datetime.fromisoformat(page.last_edited_time)
+            if since is None or edited >= datetime.fromisoformat(since):
+                yield page
+
+
+class TestDataSourceSnapshot:
+    @pytest.mark.asyncio
+    async def test_query_runs_without_requests(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        snapshot, http = _make_snapshot(
+            [
+                page_dto(1, _properties(1, 5)),
+                page_dto(2, _properties(2, 1)),
+                page_dto(3, _properties(3, 3)),
+            ]
+        )
+        await snapshot.refresh()
+
+        rows = snapshot.query(
+            filter=Filter.number("Priority").greater_than(2),
+            sorts=[PropertySort(property="Priority")],
+        )
+
+        assert [row.title for row in rows] == ["Task 3", "Task 1"]
+        assert http.paginate_stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_query_respects_limit(self, page_dto: Callable[..., PageDto]) -> None:
+        snapshot, _ = _make_snapshot(
+            [page_dto(1, _properties(1, 5)), page_dto(2, _properties(2, 1))]
+        )
+        await snapshot.refresh()
+
+        assert len(snapshot.query(limit=1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_applies_edits_and_removes_trashed_rows(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        later = "2025-06-02T00:00:00.000Z"
+        earlier = "2025-05-01T00:00:00.000Z"
+        api = _FakeQueryEndpoint(
+            page_dto(1, _properties(1, 5)),
+            page_dto(2, _properties(2, 1)),
+            page_dto(3, _properties(3, 2), last_edited_time=earlier),
+        )
+        snapshot, http = _make_snapshot()
+        http.paginate_stream = MagicMock(side_effect=api.stream)
+        await snapshot.refresh()
+
+        api.save(page_dto(2, _properties(2, 9), last_edited_time=later))
+        api.save(page_dto(1, _properties(1, 5), last_edited_time=later, in_trash=True))
+        changed = await snapshot.refresh()
+
+        assert changed == 2
+        assert {row.title for row in snapshot.query()} == {"Task 2", "Task 3"}
+        assert snapshot.query(filter=Filter.number("Priority").equals(9))
+        assert snapshot.checkpoint is not None
+        assert snapshot.checkpoint.last_edited_time.day == 2
+        trash_query = http.paginate_stream.call_args_list[-1].kwargs
+        assert trash_query["in_trash"] is True
+        assert "filter" in trash_query
+
+    @pytest.mark.asyncio
+    async def test_indexed_query_matches_full_scan(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        snapshot, _ = _make_snapshot(
+            [page_dto(n, _properties(n, n % 4)) for n in range(1, 21)]
+        )
+        await snapshot.refresh()
+        scanned = {row.id for row in snapshot.query(filter=FILTER)}
+
+        snapshot.create_index("Priority")
+
+        assert {row.id for row in snapshot.query(filter=FILTER)} == scanned
+
+    @pytest.mark.asyncio
+    async def test_refresh_updates_indexes(
+        self, page_dto: Callable[..., PageDto]
+    ) -> None:
+        later = "2025-06-02T00:00:00.000Z"
+        snapshot, _ = _make_snapshot(
+            [page_dto(1, _properties(1, 1))],
+            [page_dto(1, _properties(1, 3), last_edited_time=later)],
+            [],
+        )
+        await snapshot.refresh()
+        snapshot.create_index("Priority")
+
+        await snapshot.refresh()
+
+        assert [row.title for row in snapshot.query(filter=FILTER)] == ["Task 1"]
+
+    def test_create_index_rejects_unknown_property(self) -> None:
+        snapshot, _ = _make_snapshot()
+
+        with pytest.raises(ValueError, match="Unknown property"):
+            snapshot.create_index("Missing")
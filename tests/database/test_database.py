@@ -52,7 +52,7 @@ def _make_database(
     http.patch = AsyncMock(
         return_value=_database_dto_response(
             title=title, is_locked=is_locked, is_inline=is_inline
-        ).model_dump(mode="json")
+        )
     )
     http.post = AsyncMock(return_value={})
     return Database(
@@ -116,7 +116,7 @@ class TestDatabaseSetTitle:
     async def test_set_title_updates_local_title(self) -> None:
         db = _make_database(title="Old Title")
         response_dto = _database_dto_response(title="New Title")
-        db._http.patch = AsyncMock(return_value=response_dto.model_dump(mode="json"))
+        db._http.patch = AsyncMock(return_value=response_dto)
 
         await db.set_title("New Title")
 
@@ -132,7 +132,9 @@ class TestDatabaseSetDescription:
         response_data["description"] = [
             RichText.from_plain_text("Updated desc").model_dump(mode="json")
         ]
-        db._http.patch = AsyncMock(return_value=response_data)
+        db._http.patch = AsyncMock(
+            return_value=DatabaseDto.model_validate(response_data)
+        )
 
         await db.set_description("Updated desc")
 
@@ -144,7 +146,7 @@ class TestDatabaseLocking:
     async def test_lock_sets_is_locked_from_response(self) -> None:
         db = _make_database(is_locked=False)
         response_dto = _database_dto_response(is_locked=True)
-        db._http.patch = AsyncMock(return_value=response_dto.model_dump(mode="json"))
+        db._http.patch = AsyncMock(return_value=response_dto)
 
         await db.lock()
 
@@ -154,7 +156,7 @@ class TestDatabaseLocking:
     async def test_unlock_sets_is_locked_from_response(self) -> None:
         db = _make_database(is_locked=True)
         response_dto = _database_dto_response(is_locked=False)
-        db._http.patch = AsyncMock(return_value=response_dto.model_dump(mode="json"))
+        db._http.patch = AsyncMock(return_value=response_dto)
 
         await db.unlock()
 
@@ -166,7 +168,7 @@ class TestDatabaseInline:
     async def test_set_inline_updates_from_response(self) -> None:
         db = _make_database(is_inline=False)
         response_dto = _database_dto_response(is_inline=True)
-        db._http.patch = AsyncMock(return_value=response_dto.model_dump(mode="json"))
+        db._http.patch = AsyncMock(return_value=response_dto)
 
         await db.set_inline(True)
 
@@ -178,7 +180,7 @@ class TestDatabaseUpdate:
     async def test_update_only_title(self) -> None:
         db = _make_database()
         response_dto = _database_dto_response(title="New")
-        db._http.patch = AsyncMock(return_value=response_dto.model_dump(mode="json"))
+        db._http.patch = AsyncMock(return_value=response_dto)
         db._object.update = AsyncMock()
 
         await db.update(title="New")
@@ -135,12 +135,14 @@ class TestDatabaseNamespaceFromId:
     async def test_fetches_and_returns_database(self) -> None:
         dto = _dto(DB_ID_1, "Fetched DB")
         http = AsyncMock()
-        http.get = AsyncMock(return_value=dto.model_dump(mode="json"))
+        http.get = AsyncMock(return_value=dto)
         ns = DatabaseNamespace(http)
 
         result = await ns.from_id(DB_ID_1)
 
-        http.get.assert_called_once_with(f"databases/{DB_ID_1}")
+        http.get.assert_called_once_with(
+            f"databases/{DB_ID_1}", response_model=DatabaseDto
+        )
         assert result.id == DB_ID_1
         assert result.title == "Fetched DB"
 
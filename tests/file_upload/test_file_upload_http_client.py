@@ -34,13 +34,27 @@ def _make_upload_response_dict(**overrides: Any) -> dict[str, Any]:
     }
 
 
+def _respond(payload: Any):
+    """Mimic HttpClient: validate into the requested model, else return the dict."""
+
+    def respond(*args: Any, **kwargs: Any) -> Any:
+        model = kwargs.get("response_model") or kwargs.get("item_model")
+        if model is None:
+            return payload
+        if isinstance(payload, list):
+            return [model.model_validate(item) for item in payload]
+        return model.model_validate(payload)
+
+    return respond
+
+
 @pytest.fixture
 def mock_http() -> MagicMock:
     http = MagicMock()
-    http.post = AsyncMock(return_value=_make_upload_response_dict())
+    http.post = AsyncMock(side_effect=_respond(_make_upload_response_dict()))
     http.post_multipart = AsyncMock(return_value=_make_upload_response_dict())
-    http.get = AsyncMock(return_value=_make_upload_response_dict())
-    http.paginate = AsyncMock(return_value=[_make_upload_response_dict()])
+    http.get = AsyncMock(side_effect=_respond(_make_upload_response_dict()))
+    http.paginate = AsyncMock(side_effect=_respond([_make_upload_response_dict()]))
     return http
 
 
@@ -166,6 +180,20 @@ class TestSendFileContent:
         data = mock_http.post_multipart.call_args.kwargs["data"]
         assert data == {"part_number": "2"}
 
+    @pytest.mark.asyncio
+    async def test_only_numbered_parts_are_retry_safe(
+        self, client: FileUploadHttpClient, mock_http: MagicMock
+    ) -> None:
+        await client.send_file_content(_UPLOAD_ID, b"content", "test.pdf")
+        await client.send_file_content(
+            _UPLOAD_ID, b"content", "test.pdf", part_number=2
+        )
+
+        flags = [
+            c.kwargs["idempotent"] for c in mock_http.post_multipart.call_args_list
+        ]
+        assert flags == [False, True]
+
     @pytest.mark.asyncio
     async def test_returns_file_upload_response(
         self, client: FileUploadHttpClient, mock_http: MagicMock
@@ -200,7 +228,9 @@ class TestGetFileUpload:
     ) -> None:
         await client.get_file_upload(_UPLOAD_ID)
 
-        mock_http.get.assert_called_once_with(f"file_uploads/{_UPLOAD_ID}")
+        mock_http.get.assert_called_once_with(
+            f"file_uploads/{_UPLOAD_ID}", response_model=FileUploadResponse
+        )
 
     @pytest.mark.asyncio
     async def test_returns_file_upload_response(
@@ -267,8 +297,9 @@ class TestListFilesStream:
         self, client: FileUploadHttpClient, mock_http: MagicMock
     ) -> None:
         async def _fake_stream(*args: Any, **kwargs: Any) -> AsyncGenerator[dict]:
-            yield _make_upload_response_dict()
-            yield _make_upload_response_dict(id=str(_UPLOAD_ID_2))
+            model = kwargs["item_model"]
+            yield model.model_validate(_make_upload_response_dict())
+            yield model.model_validate(_make_upload_response_dict(id=str(_UPLOAD_ID_2)))
 
         mock_http.paginate_stream = _fake_stream
 
@@ -285,7 +316,7 @@ class TestListFilesStream:
         self, client: FileUploadHttpClient, mock_http: MagicMock
     ) -> None:
         async def _fake_stream(*args: Any, **kwargs: Any) -> AsyncGenerator[dict]:
-            yield _make_upload_response_dict()
+            yield kwargs["item_model"].model_validate(_make_upload_response_dict())
 
         mock_http.paginate_stream = _fake_stream
 
@@ -13,8 +13,14 @@ from notionary.file_upload.exceptions import (
     UploadFailedError,
     UploadTimeoutError,
 )
+from notionary.file_upload.manifest import UploadManifest, file_checksum
 from notionary.file_upload.namespace import FileUploads
-from notionary.file_upload.schemas import FileUploadResponse, FileUploadStatus
+from notionary.file_upload.parts import UploadPart
+from notionary.file_upload.schemas import (
+    FileUploadConfig,
+    FileUploadResponse,
+    FileUploadStatus,
+)
 
 _UPLOAD_ID = UUID("00000000-0000-0000-0000-000000000001")
 _UPLOAD_ID_FAIL = UUID("00000000-0000-0000-0000-000000000999")
@@ -129,6 +135,137 @@ class TestUploadFile:
             await file_uploads.upload_file(Path("/nonexistent/path/test.pdf"))
 
 
+class TestUploadMany:
+    @pytest.mark.asyncio
+    async def test_uploads_visible_files_of_directory(
+        self, file_uploads: FileUploads, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        for name in ("a.pdf", "b.png", ".DS_Store"):
+            (tmp_path / name).write_bytes(b"content")
+
+        results = [r async for r in file_uploads.upload_many(tmp_path, wait=False)]
+
+        assert sorted(r.path.name for r in results) == ["a.pdf", "b.png"]
+        assert all(r.ok and r.response == _UPLOAD_PENDING for r in results)
+        assert mock_client.create_single_part_upload.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_validates_every_file_before_uploading(
+        self, file_uploads: FileUploads, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        good = tmp_path / "a.pdf"
+        bad = tmp_path / "b.exe"
+        good.write_bytes(b"content")
+        bad.write_bytes(b"content")
+
+        with pytest.raises(UnsupportedFileTypeException):
+            async for _ in file_uploads.upload_many([good, bad]):
+                pass
+
+        mock_client.create_single_part_upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_file_raises_before_uploading(
+        self, file_uploads: FileUploads, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        with pytest.raises(FileNotFoundError):
+            async for _ in file_uploads.upload_many([tmp_path / "missing.pdf"]):
+                pass
+
+        mock_client.create_single_part_upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_yields_results_in_completion_order(
+        self, file_uploads: FileUploads, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        delays = {"slow.pdf": 0.05, "fast.pdf": 0.0}
+        paths = []
+        for name in delays:
+            paths.append(tmp_path / name)
+            paths[-1].write_bytes(b"content")
+
+        async def create(filename, content_type):
+            await asyncio.sleep(delays[filename])
+            return _UPLOAD_PENDING
+
+        mock_client.create_single_part_upload = AsyncMock(side_effect=create)
+
+        results = [r async for r in file_uploads.upload_many(paths, wait=False)]
+
+        assert [r.path.name for r in results] == ["fast.pdf", "slow.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_does_not_stop_the_others(
+        self, file_uploads: FileUploads, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+        for path in paths:
+            path.write_bytes(b"content")
+
+        async def send(upload_id, content, filename, part_number=None):
+            if filename == "a.pdf":
+                raise ConnectionError("reset")
+            return _UPLOAD_PENDING
+
+        mock_client.send_file_content = AsyncMock(side_effect=send)
+
+        results = {
+            r.path.name: r async for r in file_uploads.upload_many(paths, wait=False)
+        }
+
+        assert isinstance(results["a.pdf"].error, ConnectionError)
+        assert results["b.pdf"].ok
+
+    @pytest.mark.asyncio
+    async def test_single_and_multi_part_share_one_budget(
+        self, file_uploads: FileUploads, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        file_uploads._config = FileUploadConfig.model_construct(
+            multi_part_chunk_size=4, max_parallel_parts=8
+        )
+        big = tmp_path / "big.mp4"
+        big.write_bytes(b"x" * 40)
+        small = [tmp_path / f"small-{i}.pdf" for i in range(4)]
+        for path in small:
+            path.write_bytes(b"content")
+
+        in_flight = 0
+        peak = 0
+
+        async def send(upload_id, content, filename, part_number=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _UPLOAD_PENDING
+
+        mock_client.send_file_content = AsyncMock(side_effect=send)
+
+        with patch.object(
+            file_uploads, "_is_single_part", side_effect=lambda size: size < 10
+        ):
+            results = [
+                r
+                async for r in file_uploads.upload_many(
+                    [big, *small], max_concurrency=3, wait=False
+                )
+            ]
+
+        assert all(r.ok for r in results)
+        assert peak == 3
+        assert mock_client.send_file_content.await_count == 10 + 4
+        mock_client.complete_upload.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_concurrency(
+        self, file_uploads: FileUploads, tmp_path: Path
+    ) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            async for _ in file_uploads.upload_many(tmp_path, max_concurrency=0):
+                pass
+
+
 class TestUploadFromBytes:
     @pytest.mark.asyncio
     async def test_small_content_uses_single_part(
@@ -337,16 +474,293 @@ class TestPollingAndCompletion:
     async def test_wait_for_completion_raises_upload_timeout_error(
         self, file_uploads: FileUploads
     ) -> None:
+        async def never_completes(file_upload_id):
+            await asyncio.Event().wait()
+
+        file_uploads._config = file_uploads._config.model_copy(
+            update={"max_upload_timeout": 0.01}
+        )
+
         with (
-            patch(
-                "notionary.file_upload.namespace.asyncio.wait_for",
-                side_effect=asyncio.TimeoutError,
+            patch.object(
+                file_uploads, "_poll_until_complete", side_effect=never_completes
             ),
             pytest.raises(UploadTimeoutError, match=str(_UPLOAD_ID_FAIL)),
         ):
             await file_uploads._wait_for_completion(_UPLOAD_ID_FAIL)
 
 
+class TestParallelParts:
+    @staticmethod
+    async def _chunks(count: int, produced: list[int]):
+        for i in range(count):
+            produced.append(i)
+            yield i + 1, UploadPart.from_bytes(f"part-{i + 1}".encode())
+
+    @pytest.mark.asyncio
+    async def test_sends_parts_concurrently_within_window(
+        self, file_uploads: FileUploads, mock_client: MagicMock
+    ) -> None:
+        in_flight = 0
+        peak = 0
+        sent: list[int] = []
+
+        async def send(upload_id, chunk, filename, part_number):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            sent.append(part_number)
+            in_flight -= 1
+            return _UPLOAD_PENDING
+
+        mock_client.send_file_content = AsyncMock(side_effect=send)
+        chunk_size = file_uploads._config.multi_part_chunk_size
+
+        await file_uploads._upload_multi_part(
+            "big.mp4",
+            "video/mp4",
+            chunk_size * 10,
+            self._chunks(10, []),
+            wait=False,
+            max_parallel_parts=3,
+        )
+
+        assert peak == 3
+        assert sorted(sent) == list(range(1, 11))
+        mock_client.complete_upload.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reads_no_more_chunks_than_the_window(
+        self, file_uploads: FileUploads, mock_client: MagicMock
+    ) -> None:
+        produced: list[int] = []
+        max_ahead = 0
+        finished = 0
+
+        async def send(upload_id, chunk, filename, part_number):
+            nonlocal max_ahead, finished
+            max_ahead = max(max_ahead, len(produced) - finished)
+            await asyncio.sleep(0.01)
+            finished += 1
+            return _UPLOAD_PENDING
+
+        mock_client.send_file_content = AsyncMock(side_effect=send)
+
+        await file_uploads._upload_multi_part(
+            "big.mp4",
+            "video/mp4",
+            file_uploads._config.multi_part_chunk_size * 8,
+            self._chunks(8, produced),
+            wait=False,
+            max_parallel_parts=2,
+        )
+
+        assert max_ahead <= 2
+
+    @pytest.mark.asyncio
+    async def test_failed_part_aborts_without_completing(
+        self, file_uploads: FileUploads, mock_client: MagicMock
+    ) -> None:
+        mock_client.send_file_content = AsyncMock(side_effect=ConnectionError("down"))
+
+        with pytest.raises(UploadFailedError, match=r"part 1/3") as error:
+            await file_uploads._upload_multi_part(
+                "big.mp4",
+                "video/mp4",
+                file_uploads._config.multi_part_chunk_size * 3,
+                self._chunks(3, []),
+                wait=False,
+                max_parallel_parts=1,
+            )
+
+        assert isinstance(error.value.__cause__, ConnectionError)
+        mock_client.complete_upload.assert_not_called()
+        assert mock_client.send_file_content.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_every_failed_part_is_chained(
+        self, file_uploads: FileUploads, mock_client: MagicMock
+    ) -> None:
+        async def send(upload_id, chunk, filename, part_number):
+            if part_number == 3:
+                await asyncio.Event().wait()
+            raise ConnectionError(f"part {part_number} down")
+
+        mock_client.send_file_content = AsyncMock(side_effect=send)
+
+        with pytest.raises(UploadFailedError, match="2 of 3 parts failed") as error:
+            await file_uploads._upload_multi_part(
+                "big.mp4",
+                "video/mp4",
+                file_uploads._config.multi_part_chunk_size * 3,
+                self._chunks(3, []),
+                wait=False,
+                max_parallel_parts=3,
+            )
+
+        group = error.value.__cause__
+        assert isinstance(group, ExceptionGroup)
+        reasons = sorted(str(e.__cause__) for e in group.exceptions)
+        assert reasons == ["part 1 down", "part 2 down"]
+
+
+class TestResumableUpload:
+    _PART = 4
+
+    @pytest.fixture
+    def resumable(self, file_uploads: FileUploads) -> FileUploads:
+        file_uploads._config = FileUploadConfig.model_construct(
+            multi_part_chunk_size=self._PART
+        )
+        return file_uploads
+
+    @pytest.fixture
+    def big_file(self, tmp_path: Path) -> Path:
+        file = tmp_path / "big.mp4"
+        file.write_bytes(b"aaaabbbbccccdd")
+        return file
+
+    def _manifest(self, file: Path, **overrides) -> UploadManifest:
+        fields = {
+            "upload_id": _UPLOAD_ID,
+            "filename": file.name,
+            "checksum": file_checksum(file),
+            "part_size": self._PART,
+            "part_count": 4,
+            "completed_parts": {1, 2},
+        }
+        return UploadManifest(**(fields | overrides))
+
+    @pytest.mark.asyncio
+    async def test_removes_manifest_after_completing(
+        self, resumable: FileUploads, mock_client: MagicMock, big_file: Path
+    ) -> None:
+        with patch.object(resumable, "_is_single_part", return_value=False):
+            await resumable.upload_file(big_file, wait=False, resume=True)
+
+        assert mock_client.send_file_content.await_count == 4
+        mock_client.complete_upload.assert_awaited_once_with(_UPLOAD_ID)
+        assert not big_file.with_name("big.mp4.upload.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_writes_manifest_only_once_a_part_is_sent(
+        self, resumable: FileUploads, mock_client: MagicMock, big_file: Path
+    ) -> None:
+        manifest_path = big_file.with_name("big.mp4.upload.json")
+        existed_before_first_part: list[bool] = []
+
+        async def send(upload_id, chunk, filename, part_number):
+            if part_number == 1:
+                existed_before_first_part.append(manifest_path.exists())
+            if part_number == 2:
+                raise ConnectionError("down")
+            return _UPLOAD_PENDING
+
+        mock_client.send_file_content = AsyncMock(side_effect=send)
+        resumable._config = FileUploadConfig.model_construct(
+            multi_part_chunk_size=self._PART, max_parallel_parts=1
+        )
+
+        with (
+            patch.object(resumable, "_is_single_part", return_value=False),
+            pytest.raises(UploadFailedError),
+        ):
+            await resumable.upload_file(big_file, wait=False, resume=True)
+
+        assert existed_before_first_part == [False]
+        manifest = UploadManifest.load(manifest_path)
+        assert manifest.checksum == file_checksum(big_file)
+        assert manifest.completed_parts == {1}
+
+    @pytest.mark.asyncio
+    async def test_keeps_sent_parts_in_manifest_on_failure(
+        self, resumable: FileUploads, mock_client: MagicMock, big_file: Path
+    ) -> None:
+        async def send(upload_id, chunk, filename, part_number):
+            if part_number == 3:
+                raise ConnectionError("down")
+            return _UPLOAD_PENDING
+
+        mock_client.send_file_content = AsyncMock(side_effect=send)
+        resumable._config = FileUploadConfig.model_construct(
+            multi_part_chunk_size=self._PART, max_parallel_parts=1
+        )
+
+        with (
+            patch.object(resumable, "_is_single_part", return_value=False),
+            pytest.raises(UploadFailedError),
+        ):
+            await resumable.upload_file(big_file, wait=False, resume=True)
+
+        manifest = UploadManifest.load(big_file.with_name("big.mp4.upload.json"))
+        assert manifest is not None
+        assert manifest.upload_id == _UPLOAD_ID
+        assert manifest.completed_parts == {1, 2}
+        mock_client.complete_upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resumes_with_missing_parts_only(
+        self, resumable: FileUploads, mock_client: MagicMock, big_file: Path
+    ) -> None:
+        self._manifest(big_file).save(big_file.with_name("big.mp4.upload.json"))
+        mock_client.get_file_upload = AsyncMock(return_value=_UPLOAD_PENDING)
+        sent: dict[int, bytes] = {}
+
+        async def send(upload_id, chunk, filename, part_number):
+            sent[part_number] = chunk.read()
+            return _UPLOAD_PENDING
+
+        mock_client.send_file_content = AsyncMock(side_effect=send)
+
+        with patch.object(resumable, "_is_single_part", return_value=False):
+            await resumable.upload_file(big_file, wait=False, resume=True)
+
+        mock_client.create_multi_part_upload.assert_not_called()
+        assert sent == {3: b"cccc", 4: b"dd"}
+        mock_client.complete_upload.assert_awaited_once_with(_UPLOAD_ID)
+
+    @pytest.mark.asyncio
+    async def test_changed_file_starts_over(
+        self, resumable: FileUploads, mock_client: MagicMock, big_file: Path
+    ) -> None:
+        manifest = self._manifest(big_file, checksum="stale")
+        manifest.save(big_file.with_name("big.mp4.upload.json"))
+
+        with patch.object(resumable, "_is_single_part", return_value=False):
+            await resumable.upload_file(big_file, wait=False, resume=True)
+
+        mock_client.get_file_upload.assert_not_called()
+        mock_client.create_multi_part_upload.assert_awaited_once()
+        assert mock_client.send_file_content.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_manifest_starts_over(
+        self, resumable: FileUploads, mock_client: MagicMock, big_file: Path
+    ) -> None:
+        manifest = self._manifest(big_file, expiry_time="2024-01-01T00:00:00+00:00")
+        manifest.save(big_file.with_name("big.mp4.upload.json"))
+
+        with patch.object(resumable, "_is_single_part", return_value=False):
+            await resumable.upload_file(big_file, wait=False, resume=True)
+
+        mock_client.create_multi_part_upload.assert_awaited_once()
+        assert mock_client.send_file_content.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_upload_no_longer_pending_starts_over(
+        self, resumable: FileUploads, mock_client: MagicMock, big_file: Path
+    ) -> None:
+        self._manifest(big_file).save(big_file.with_name("big.mp4.upload.json"))
+        mock_client.get_file_upload = AsyncMock(return_value=_UPLOAD_FAILED)
+
+        with patch.object(resumable, "_is_single_part", return_value=False):
+            await resumable.upload_file(big_file, wait=False, resume=True)
+
+        mock_client.create_multi_part_upload.assert_awaited_once()
+        assert mock_client.send_file_content.await_count == 4
+
+
 class TestIsSinglePart:
     def test_small_file_is_single_part(self, file_uploads: FileUploads) -> None:
         assert file_uploads._is_single_part(1024) is True
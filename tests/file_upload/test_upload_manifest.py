@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from notionary.file_upload.manifest import (
+    ManifestWriter,
+    UploadManifest,
+    file_checksum,
+)
+
+_UPLOAD_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def _manifest(**overrides) -> UploadManifest:
+    fields = {
+        "upload_id": _UPLOAD_ID,
+        "filename": "big.mp4",
+        "checksum": "abc",
+        "part_size": 10,
+        "part_count": 3,
+    }
+    return UploadManifest(**(fields | overrides))
+
+
+class TestUploadManifest:
+    def test_round_trips_through_disk(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.mp4.upload.json"
+        _manifest(completed_parts={1, 3}).save(path)
+
+        loaded = UploadManifest.load(path)
+
+        assert loaded == _manifest(completed_parts={1, 3})
+        assert not (tmp_path / "big.mp4.upload.json.tmp").exists()
+
+    def test_missing_file_loads_as_none(self, tmp_path: Path) -> None:
+        assert UploadManifest.load(tmp_path / "missing.json") is None
+
+    def test_corrupt_file_loads_as_none(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.mp4.upload.json"
+        path.write_text("{not json")
+
+        assert UploadManifest.load(path) is None
+
+    def test_matches_requires_same_file_and_part_size(self) -> None:
+        manifest = _manifest()
+
+        assert manifest.matches("big.mp4", "abc", 10)
+        assert not manifest.matches("big.mp4", "abd", 10)
+        assert not manifest.matches("big.mp4", "abc", 20)
+
+    def test_is_expired_compares_with_expiry_time(self) -> None:
+        manifest = _manifest(expiry_time="2024-01-01T12:00:00.000Z")
+
+        assert not manifest.is_expired(datetime(2024, 1, 1, 11, tzinfo=UTC))
+        assert manifest.is_expired(datetime(2024, 1, 1, 13, tzinfo=UTC))
+        assert not _manifest().is_expired()
+
+
+class TestManifestWriter:
+    @pytest.mark.asyncio
+    async def test_parts_sent_during_a_save_share_the_next_one(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "big.mp4.upload.json"
+        writer = ManifestWriter(_manifest(), path)
+        save = UploadManifest.save
+
+        with patch.object(UploadManifest, "save", autospec=True) as saves:
+            saves.side_effect = save
+            writer.record(1)
+            # Let the first save start, then send two more parts during it.
+            await asyncio.sleep(0)
+            writer.record(2)
+            writer.record(3)
+            await writer.close()
+
+        assert saves.call_count == 2
+        assert UploadManifest.load(path).completed_parts == {1, 2, 3}
+
+    @pytest.mark.asyncio
+    async def test_checksum_is_awaited_before_the_first_save(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "big.mp4.upload.json"
+        checksum = asyncio.get_running_loop().create_future()
+        writer = ManifestWriter(_manifest(checksum=""), path, checksum)
+
+        writer.record(1)
+        await asyncio.sleep(0)
+        assert not path.exists()
+        checksum.set_result("abc")
+        await writer.close()
+
+        assert UploadManifest.load(path) == _manifest(completed_parts={1})
+
+    @pytest.mark.asyncio
+    async def test_unused_checksum_is_cancelled(self, tmp_path: Path) -> None:
+        checksum = asyncio.get_running_loop().create_future()
+        writer = ManifestWriter(_manifest(), tmp_path / "m.json", checksum)
+
+        await writer.close()
+
+        assert checksum.cancelled()
+
+
+def test_file_checksum_is_sha256_of_contents(tmp_path: Path) -> None:
+    file = tmp_path / "data.bin"
+    file.write_bytes(b"x" * 3_000_000)
+
+    assert file_checksum(file) == hashlib.sha256(b"x" * 3_000_000).hexdigest()
@@ -0,0 +1,66 @@
+import mmap
+from pathlib import Path
+
+import httpx
+import pytest
+
+from notionary.file_upload.parts import UploadPart
+
+
+class TestUploadPart:
+    def test_reads_only_its_slice_of_bytes(self) -> None:
+        part = UploadPart.from_bytes(b"aaaabbbbcc", 4, 8)
+
+        assert len(part) == 4
+        assert part.read(3) == b"bbb"
+        assert part.read() == b"b"
+        assert part.read() == b""
+
+    def test_stop_is_clamped_to_content(self) -> None:
+        part = UploadPart.from_bytes(b"aaaabb", 4, 8)
+
+        assert part.read() == b"bb"
+
+    def test_seek_is_relative_to_the_part(self) -> None:
+        part = UploadPart.from_bytes(b"aaaabbbbcc", 4, 8)
+
+        assert part.seek(0, 2) == 4
+        assert part.tell() == 4
+        part.seek(1)
+        assert part.read() == b"bbb"
+
+    def test_maps_unaligned_range_of_file(self, tmp_path: Path) -> None:
+        file = tmp_path / "big.bin"
+        offset = mmap.ALLOCATIONGRANULARITY + 3
+        file.write_bytes(b"x" * offset + b"payload" + b"y" * 10)
+
+        with UploadPart.map_file(file, offset, 7) as part:
+            assert part.read() == b"payload"
+
+    def test_empty_range_needs_no_mapping(self, tmp_path: Path) -> None:
+        file = tmp_path / "empty.txt"
+        file.write_bytes(b"")
+
+        with UploadPart.map_file(file, 0, 0) as part:
+            assert part.read() == b""
+
+    def test_closed_part_cannot_be_read(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.bin"
+        file.write_bytes(b"content")
+        part = UploadPart.map_file(file, 0, 7)
+
+        part.close()
+
+        with pytest.raises(ValueError):
+            part.read()
+
+    def test_httpx_streams_part_with_known_length(self) -> None:
+        part = UploadPart.from_bytes(b"aaaabbbbcc", 4, 8)
+
+        request = httpx.Request(
+            "POST", "https://example.com", files={"file": ("a.pdf", part)}
+        )
+        body = b"".join(request.stream)
+
+        assert int(request.headers["Content-Length"]) == len(body)
+        assert b"\r\n\r\nbbbb\r\n" in body
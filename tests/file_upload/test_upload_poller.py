@@ -0,0 +1,218 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from notionary.file_upload.exceptions import UploadFailedError
+from notionary.file_upload.poller import UploadPoller
+from notionary.file_upload.schemas import (
+    FileUploadConfig,
+    FileUploadResponse,
+    FileUploadStatus,
+)
+
+_IDS = [UUID(int=i) for i in range(1, UploadPoller._SWEEP_PAGES + 3)]
+
+
+def _upload(upload_id: UUID, status: FileUploadStatus) -> FileUploadResponse:
+    return FileUploadResponse(
+        id=upload_id,
+        created_time="2024-01-01T00:00:00.000Z",
+        last_edited_time="2024-01-01T00:00:00.000Z",
+        in_trash=False,
+        status=status,
+        filename="test.pdf",
+    )
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    client = MagicMock()
+    client.get_file_upload = AsyncMock(
+        side_effect=lambda upload_id: _upload(upload_id, FileUploadStatus.UPLOADED)
+    )
+    return client
+
+
+@pytest.fixture
+def poller(mock_client: MagicMock) -> UploadPoller:
+    return UploadPoller(mock_client, FileUploadConfig())
+
+
+class TestWait:
+    @pytest.mark.asyncio
+    async def test_first_check_is_immediate(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        upload = await poller.wait(_IDS[0])
+
+        assert upload.status == FileUploadStatus.UPLOADED
+        mock_client.get_file_upload.assert_awaited_once_with(_IDS[0])
+
+    @pytest.mark.asyncio
+    async def test_backs_off_up_to_poll_interval(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        pending = _upload(_IDS[0], FileUploadStatus.PENDING)
+        mock_client.get_file_upload = AsyncMock(
+            side_effect=[pending] * 6 + [_upload(_IDS[0], FileUploadStatus.UPLOADED)]
+        )
+
+        with patch(
+            "notionary.file_upload.poller.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            await poller.wait(_IDS[0])
+
+        waits = [
+            c.args[0]
+            for c in sleep.await_args_list
+            if c.args[0] != poller._COALESCE_WINDOW
+        ]
+        limits = [0.25, 0.5, 1, 2, 2, 2]
+        assert len(waits) == len(limits)
+        assert all(0 < wait <= limit for wait, limit in zip(waits, limits, strict=True))
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_raises(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        mock_client.get_file_upload = AsyncMock(
+            return_value=_upload(_IDS[0], FileUploadStatus.FAILED)
+        )
+
+        with pytest.raises(UploadFailedError, match=str(_IDS[0])):
+            await poller.wait(_IDS[0])
+
+
+class TestSweep:
+    @pytest.mark.asyncio
+    async def test_few_checks_are_fetched_without_a_listing(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        mock_client.list_file_uploads_stream = MagicMock()
+        few = _IDS[: UploadPoller._SWEEP_PAGES]
+
+        await asyncio.gather(*(poller.check(i) for i in few))
+
+        mock_client.list_file_uploads_stream.assert_not_called()
+        assert mock_client.get_file_upload.await_count == len(few)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_listing(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        async def pending_uploads(query):
+            assert query.status == FileUploadStatus.PENDING
+            for upload_id in _IDS[:-1]:
+                yield _upload(upload_id, FileUploadStatus.PENDING)
+
+        mock_client.list_file_uploads_stream = MagicMock(side_effect=pending_uploads)
+
+        results = await asyncio.gather(*(poller.check(i) for i in _IDS))
+
+        assert [r.status for r in results] == [FileUploadStatus.PENDING] * (
+            len(_IDS) - 1
+        ) + [FileUploadStatus.UPLOADED]
+        mock_client.list_file_uploads_stream.assert_called_once()
+        mock_client.get_file_upload.assert_awaited_once_with(_IDS[-1])
+
+    @pytest.mark.asyncio
+    async def test_stops_listing_once_every_upload_is_found(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        listed: list[UUID] = []
+
+        async def pending_uploads(query):
+            for upload_id in [*_IDS, UUID(int=99)]:
+                listed.append(upload_id)
+                yield _upload(upload_id, FileUploadStatus.PENDING)
+
+        mock_client.list_file_uploads_stream = MagicMock(side_effect=pending_uploads)
+
+        await asyncio.gather(*(poller.check(i) for i in _IDS))
+
+        assert listed == _IDS
+        mock_client.get_file_upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_listing_falls_back_to_fetching(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        mock_client.list_file_uploads_stream = MagicMock(
+            side_effect=ConnectionError("down")
+        )
+
+        results = await asyncio.gather(*(poller.check(i) for i in _IDS))
+
+        assert all(r.status == FileUploadStatus.UPLOADED for r in results)
+        assert mock_client.get_file_upload.await_count == len(_IDS)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_only_reaches_its_own_check(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        async def get_file_upload(upload_id: UUID) -> FileUploadResponse:
+            if upload_id == _IDS[0]:
+                raise ConnectionError("down")
+            return _upload(upload_id, FileUploadStatus.UPLOADED)
+
+        mock_client.get_file_upload = AsyncMock(side_effect=get_file_upload)
+
+        results = await asyncio.gather(
+            *(poller.check(i) for i in _IDS[:2]), return_exceptions=True
+        )
+
+        assert isinstance(results[0], ConnectionError)
+        assert results[1].status == FileUploadStatus.UPLOADED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_sweep_cancels_its_checks(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        fetching = asyncio.Event()
+
+        async def get_file_upload(upload_id: UUID) -> FileUploadResponse:
+            fetching.set()
+            await asyncio.Event().wait()
+
+        mock_client.get_file_upload = AsyncMock(side_effect=get_file_upload)
+        checks = [asyncio.create_task(poller.check(i)) for i in _IDS[:2]]
+        await asyncio.sleep(0)
+        sweep = poller._sweep_task
+        await fetching.wait()
+        sweep.cancel()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*checks, return_exceptions=True), timeout=1
+        )
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_sweep_cancelled_while_coalescing_cancels_its_checks(
+        self, poller: UploadPoller
+    ) -> None:
+        check = asyncio.create_task(poller.check(_IDS[0]))
+        # Let the check start the sweep, and the sweep start coalescing.
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        poller._sweep_task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(check, timeout=1)
+
+        upload = await poller.check(_IDS[0])
+        assert upload.status == FileUploadStatus.UPLOADED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_check_does_not_break_the_sweep(
+        self, poller: UploadPoller, mock_client: MagicMock
+    ) -> None:
+        cancelled = asyncio.create_task(poller.check(_IDS[0]))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        upload = await poller.check(_IDS[0])
+
+        assert upload.status == FileUploadStatus.UPLOADED
@@ -0,0 +1,188 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from notionary import Notionary
+from notionary.http.cache import CachePolicy, MemoryCache, ResponseCache, SQLiteCache
+
+
+class TestMemoryCache:
+    def test_returns_stored_value(self) -> None:
+        cache = MemoryCache()
+        cache.set("k", b"v", ttl=60)
+        assert cache.get("k") == b"v"
+
+    def test_missing_key_returns_none(self) -> None:
+        assert MemoryCache().get("k") is None
+
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = MemoryCache()
+        with patch("notionary.http.cache.time.monotonic", return_value=100.0):
+            cache.set("k", b"v", ttl=10)
+        with patch("notionary.http.cache.time.monotonic", return_value=110.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", b"1", ttl=60)
+        cache.set("b", b"2", ttl=60)
+        cache.get("a")
+        cache.set("c", b"3", ttl=60)
+
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"3"
+
+    def test_delete_prefix(self) -> None:
+        cache = MemoryCache()
+        cache.set("users/1?", b"1", ttl=60)
+        cache.set("users/1?x=1", b"2", ttl=60)
+        cache.set("users/12?", b"3", ttl=60)
+
+        cache.delete_prefix("users/1?")
+
+        assert cache.get("users/1?") is None
+        assert cache.get("users/1?x=1") is None
+        assert cache.get("users/12?") == b"3"
+
+    def test_rejects_non_positive_size(self) -> None:
+        with pytest.raises(ValueError):
+            MemoryCache(max_entries=0)
+
+
+class TestSQLiteCache:
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.db"
+        first = SQLiteCache(path)
+        first.set("k", b"v", ttl=60)
+        first.close()
+
+        second = SQLiteCache(path)
+        assert second.get("k") == b"v"
+        second.close()
+
+    def test_entry_expires_after_ttl(self, tmp_path: Path) -> None:
+        cache = SQLiteCache(tmp_path / "cache.db")
+        with patch("notionary.http.cache.time.time", return_value=100.0):
+            cache.set("k", b"v", ttl=10)
+        with patch("notionary.http.cache.time.time", return_value=110.0):
+            assert cache.get("k") is None
+
+    def test_purges_expired_rows_at_most_once_per_interval(
+        self, tmp_path: Path
+    ) -> None:
+        with patch("notionary.http.cache.time.time", return_value=100.0):
+            cache = SQLiteCache(tmp_path / "cache.db", purge_interval=60)
+            cache.set("old", b"v", ttl=10)
+        with patch("notionary.http.cache.time.time", return_value=120.0):
+            cache.set("a", b"v", ttl=60)
+        assert _row_count(cache) == 2
+
+        with patch("notionary.http.cache.time.time", return_value=160.0):
+            cache.set("b", b"v", ttl=60)
+        assert _row_count(cache) == 2
+
+    def test_indexes_expiry(self, tmp_path: Path) -> None:
+        cache = SQLiteCache(tmp_path / "cache.db")
+
+        plan = cache._conn.execute(
+            "EXPLAIN QUERY PLAN DELETE FROM responses WHERE expires_at <= 0"
+        ).fetchall()
+
+        assert "responses_expires_at" in str(plan)
+
+    def test_delete_prefix(self, tmp_path: Path) -> None:
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.set("users/1?", b"1", ttl=60)
+        cache.set("users/12?", b"2", ttl=60)
+
+        cache.delete_prefix("users/1?")
+
+        assert cache.get("users/1?") is None
+        assert cache.get("users/12?") == b"2"
+
+
+def _row_count(cache: SQLiteCache) -> int:
+    return cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class TestCachePolicy:
+    @pytest.mark.parametrize(
+        "path",
+        ["data_sources/abc", "/databases/abc", "users", "users/abc"],
+    )
+    def test_caches_schema_reads_by_default(self, path: str) -> None:
+        assert CachePolicy().ttl_for(path) is not None
+
+    @pytest.mark.parametrize(
+        "path", ["pages/abc", "data_sources/abc/templates", "blocks/abc/children"]
+    )
+    def test_leaves_other_endpoints_uncached_by_default(self, path: str) -> None:
+        assert CachePolicy().ttl_for(path) is None
+
+    def test_custom_ttls_and_default(self) -> None:
+        policy = CachePolicy(ttls={"pages/{id}/markdown": 30}, default_ttl=5)
+
+        assert policy.ttl_for("pages/abc/markdown") == 30
+        assert policy.ttl_for("users/abc") == 5
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_every_query_of_a_resource(self) -> None:
+        cache = ResponseCache()
+        await cache.set("s:https://x/users/1?", b"1", ttl=60)
+        await cache.set("s:https://x/users/1?a=1", b"2", ttl=60)
+
+        await cache.invalidate("s:https://x/users/1")
+
+        assert await cache.get("s:https://x/users/1?") is None
+        assert await cache.get("s:https://x/users/1?a=1") is None
+
+    @pytest.mark.asyncio
+    async def test_skips_write_invalidated_after_generation(self) -> None:
+        cache = ResponseCache()
+        generation = cache.generation()
+
+        await cache.invalidate("s:https://x/users/1")
+        await cache.set("s:https://x/users/1?", b"stale", ttl=60, generation=generation)
+        await cache.set("s:https://x/users/2?", b"fresh", ttl=60, generation=generation)
+
+        assert await cache.get("s:https://x/users/1?") is None
+        assert await cache.get("s:https://x/users/2?") == b"fresh"
+
+    @pytest.mark.asyncio
+    async def test_untracked_resources_are_treated_as_invalidated(self) -> None:
+        cache = ResponseCache()
+        cache._MAX_TRACKED_INVALIDATIONS = 1
+        generation = cache.generation()
+
+        await cache.invalidate("s:https://x/users/1")
+        await cache.invalidate("s:https://x/users/2")
+        await cache.set("s:https://x/users/1?", b"stale", ttl=60, generation=generation)
+
+        assert await cache.get("s:https://x/users/1?") is None
+
+    @pytest.mark.asyncio
+    async def test_runs_blocking_backends_in_a_thread(self, tmp_path: Path) -> None:
+        cache = ResponseCache(backend=SQLiteCache(tmp_path / "cache.db"))
+        with patch(
+            "notionary.http.cache.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            await cache.set("k", b"v", ttl=60)
+            assert await cache.get("k") == b"v"
+            await cache.close()
+
+        assert to_thread.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_notionary_close_closes_cache(self) -> None:
+        backend = MagicMock()
+        notion = Notionary(api_key="test-token", cache=ResponseCache(backend=backend))
+
+        await notion.close()
+
+        backend.close.assert_called_once_with()
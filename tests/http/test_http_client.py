@@ -1,3 +1,5 @@
+import asyncio
+import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
@@ -6,11 +8,20 @@ import httpx
 import pytest
 from pydantic import BaseModel
 
+from notionary.http.cache import ResponseCache
 from notionary.http.client import HttpClient
+from notionary.http.rate_limiter import RateLimiter
+from notionary.http.schemas import (
+    PaginatedResponse,
+    RateLimitConfig,
+    TransportConfig,
+)
 
 
 def _make_client() -> HttpClient:
-    return HttpClient(token="test-token")
+    client = HttpClient(token="test-token")
+    client._rate_limiter = RateLimiter(RateLimitConfig())
+    return client
 
 
 def _mock_response(
@@ -19,6 +30,7 @@ def _mock_response(
     response = MagicMock(spec=httpx.Response)
     response.status_code = status_code
     response.json.return_value = json_data or {}
+    response.content = json.dumps(json_data or {}).encode()
     if status_code >= 400:
         response.raise_for_status.side_effect = httpx.HTTPStatusError(
             message="error", request=MagicMock(), response=response
@@ -31,8 +43,10 @@ def _mock_response(
 
 def _paginated(
     results: list[Any], has_more: bool = False, next_cursor: str | None = None
-) -> dict[str, Any]:
-    return {"results": results, "has_more": has_more, "next_cursor": next_cursor}
+) -> PaginatedResponse:
+    return PaginatedResponse(
+        results=results, has_more=has_more, next_cursor=next_cursor
+    )
 
 
 @pytest.fixture
@@ -59,7 +73,7 @@ class TestHttpMethods:
             result = await client.post("/pages", data={"title": "hello"})
         assert result == {"created": True}
         _, call_kwargs = mock_request.call_args
-        assert call_kwargs["json"] == {"title": "hello"}
+        assert json.loads(call_kwargs["content"]) == {"title": "hello"}
 
     @pytest.mark.asyncio
     async def test_post_serializes_base_model(self, client: HttpClient) -> None:
@@ -77,7 +91,7 @@ class TestHttpMethods:
             mock_request.return_value = _mock_response(200, {"ok": True})
             await client.post("/items", data=model)
         _, call_kwargs = mock_request.call_args
-        sent = call_kwargs["json"]
+        sent = json.loads(call_kwargs["content"])
         assert sent == {"name": "test", "id": "12345678-1234-1234-1234-123456789abc"}
         assert "tag" not in sent
 
@@ -96,7 +110,7 @@ class TestHttpMethods:
             mock_request.return_value = _mock_response(200, {"ok": True})
             await client.patch("/items/1", data=model, exclude_unset=True)
         _, call_kwargs = mock_request.call_args
-        sent = call_kwargs["json"]
+        sent = json.loads(call_kwargs["content"])
         assert sent == {"name": "updated"}
         assert "count" not in sent
 
@@ -142,6 +156,41 @@ class TestHttpMethods:
         _, call_kwargs = mock_request.call_args
         assert call_kwargs["params"] == {"filter": "active"}
 
+    @pytest.mark.asyncio
+    async def test_get_validates_response_model_from_raw_bytes(
+        self, client: HttpClient
+    ) -> None:
+        class _Page(BaseModel):
+            id: str
+            archived: bool
+
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(
+                200, {"id": "abc", "archived": False}
+            )
+            result = await client.get("/pages/abc", response_model=_Page)
+
+        assert result == _Page(id="abc", archived=False)
+
+    @pytest.mark.asyncio
+    async def test_uses_custom_codec(self) -> None:
+        codec = MagicMock()
+        codec.encode.return_value = b"encoded"
+        codec.decode.return_value = {"decoded": True}
+        client = HttpClient(token="test-token", codec=codec)
+
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {})
+            result = await client.post("/pages", data={"title": "hello"})
+
+        codec.encode.assert_called_once_with({"title": "hello"})
+        assert mock_request.call_args.kwargs["content"] == b"encoded"
+        assert result == {"decoded": True}
+
 
 class TestPaginate:
     @pytest.mark.asyncio
@@ -189,6 +238,41 @@ class TestPaginate:
         assert results == ["a", "b", "c"]
         assert mock_post.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_page_size_follows_remaining_limit(self, client: HttpClient) -> None:
+        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [
+                _paginated(list(range(100)), has_more=True, next_cursor="cur1"),
+                _paginated(list(range(30)), has_more=True, next_cursor="cur2"),
+            ]
+            results = await client.paginate(
+                "/databases/x/query", total_results_limit=130
+            )
+
+        assert len(results) == 130
+        page_sizes = [call.kwargs["data"]["page_size"] for call in mock_post.mock_calls]
+        assert page_sizes == [100, 30]
+
+    @pytest.mark.asyncio
+    async def test_small_limit_requests_small_page(self, client: HttpClient) -> None:
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _paginated(["a"], has_more=False)
+            await client.paginate(
+                "users", method="GET", total_results_limit=10, page_size=100
+            )
+
+        assert mock_get.call_args.kwargs["params"]["page_size"] == 10
+
+    @pytest.mark.asyncio
+    async def test_keeps_smaller_explicit_page_size(self, client: HttpClient) -> None:
+        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _paginated(["a"], has_more=False)
+            await client.paginate(
+                "/databases/x/query", total_results_limit=50, page_size=20
+            )
+
+        assert mock_post.call_args.kwargs["data"]["page_size"] == 20
+
     @pytest.mark.asyncio
     async def test_returns_empty_list_when_no_results(self, client: HttpClient) -> None:
         with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
@@ -196,6 +280,51 @@ class TestPaginate:
             results = await client.paginate("/databases/x/query")
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_validates_results_into_item_model(self, client: HttpClient) -> None:
+        class _Item(BaseModel):
+            id: str
+
+        body = {"results": [{"id": "a"}, {"id": "b"}], "has_more": False}
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(
+                200, {**body, "next_cursor": None}
+            )
+            results = await client.paginate("/databases/x/query", item_model=_Item)
+
+        assert results == [_Item(id="a"), _Item(id="b")]
+
+    @pytest.mark.asyncio
+    async def test_requests_typed_page_envelope(self, client: HttpClient) -> None:
+        class _Item(BaseModel):
+            id: str
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _paginated([_Item(id="a")])
+            await client.paginate("users", method="GET", item_model=_Item)
+
+        assert mock_get.call_args.kwargs["response_model"] is PaginatedResponse[_Item]
+
+    @pytest.mark.asyncio
+    async def test_sends_query_params_in_url(self, client: HttpClient) -> None:
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(
+                200, {"results": [], "has_more": False, "next_cursor": None}
+            )
+            await client.paginate(
+                "data_sources/x/query",
+                query_params={"filter_properties": ["title", "abc"]},
+                page_size=10,
+            )
+
+        kwargs = mock_request.call_args.kwargs
+        assert kwargs["params"] == {"filter_properties": ["title", "abc"]}
+        assert json.loads(kwargs["content"]) == {"page_size": 10}
+
 
 class TestPaginateStream:
     @pytest.mark.asyncio
@@ -222,3 +351,661 @@ class TestPaginateStream:
             ):
                 items.append(item)
         assert items == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_yields_same_items_in_order(
+        self, client: HttpClient
+    ) -> None:
+        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [
+                _paginated([1, 2], has_more=True, next_cursor="cur1"),
+                _paginated([3, 4], has_more=True, next_cursor="cur2"),
+                _paginated([5], has_more=False),
+            ]
+            items = [
+                item
+                async for item in client.paginate_stream(
+                    "/databases/x/query", prefetch=2, page_size=2
+                )
+            ]
+        assert items == [1, 2, 3, 4, 5]
+        assert mock_post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_fetches_next_page_while_consumer_is_busy(
+        self, client: HttpClient
+    ) -> None:
+        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [
+                _paginated([1, 2], has_more=True, next_cursor="cur1"),
+                _paginated([3, 4], has_more=False),
+            ]
+            stream = client.paginate_stream(
+                "/databases/x/query", prefetch=1, page_size=2
+            )
+            first = await anext(stream)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            calls_while_processing_first_item = mock_post.call_count
+            rest = [item async for item in stream]
+
+        assert first == 1
+        assert calls_while_processing_first_item == 2
+        assert rest == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_propagates_fetch_errors(self, client: HttpClient) -> None:
+        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [
+                _paginated([1, 2], has_more=True, next_cursor="cur1"),
+                RuntimeError("boom"),
+            ]
+            items = []
+            with pytest.raises(RuntimeError, match="boom"):
+                async for item in client.paginate_stream(
+                    "/databases/x/query", prefetch=2, page_size=2
+                ):
+                    items.append(item)
+        assert items == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_stops_fetching_when_consumer_closes_stream(
+        self, client: HttpClient
+    ) -> None:
+        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [
+                _paginated([i, i], has_more=True, next_cursor=f"cur{i}")
+                for i in range(100)
+            ]
+            stream = client.paginate_stream(
+                "/databases/x/query", prefetch=1, page_size=2
+            )
+            await anext(stream)
+            await stream.aclose()
+            calls_after_close = mock_post.call_count
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+        assert calls_after_close <= 3
+        assert mock_post.call_count == calls_after_close
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_prefetch_task(
+        self, client: HttpClient
+    ) -> None:
+        started = asyncio.Event()
+
+        async def slow_post(*args, **kwargs):
+            if mock_post.call_count > 1:
+                started.set()
+                await asyncio.Event().wait()
+            return _paginated([1], has_more=True, next_cursor="cur")
+
+        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = slow_post
+            stream = client.paginate_stream("/databases/x/query", prefetch=1)
+            await anext(stream)
+            await started.wait()
+            tasks_before = asyncio.all_tasks()
+
+            await stream.aclose()
+
+        producers = tasks_before - {asyncio.current_task()}
+        assert all(task.done() for task in producers)
+
+
+def _throttled_response(retry_after: str | None = None) -> MagicMock:
+    response = _mock_response(429)
+    response.headers = {"Retry-After": retry_after} if retry_after else {}
+    return response
+
+
+class TestRetry:
+    @pytest.mark.asyncio
+    async def test_retries_after_429_and_counts_throttled(
+        self, client: HttpClient
+    ) -> None:
+        with (
+            patch.object(
+                client._client, "request", new_callable=AsyncMock
+            ) as mock_request,
+            patch(
+                "notionary.http.client.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            mock_request.side_effect = [
+                _throttled_response("2"),
+                _mock_response(200, {"id": "abc"}),
+            ]
+            result = await client.get("/pages/abc")
+
+        assert result == {"id": "abc"}
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.await_args.args[0] == pytest.approx(2.0, abs=0.1)
+        assert client.stats.throttled == 1
+        assert client.stats.retried == 1
+        assert client.stats.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors_with_backoff(self, client: HttpClient) -> None:
+        with (
+            patch.object(
+                client._client, "request", new_callable=AsyncMock
+            ) as mock_request,
+            patch("notionary.http.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_request.side_effect = [
+                _mock_response(502),
+                _mock_response(503),
+                _mock_response(200, {"ok": True}),
+            ]
+            result = await client.get("/pages/abc")
+
+        assert result == {"ok": True}
+        assert client.stats.retried == 2
+        assert client.stats.throttled == 0
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried_after_server_error(
+        self, client: HttpClient
+    ) -> None:
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(502)
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.post("/pages", data={})
+
+        assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried_after_read_timeout(
+        self, client: HttpClient
+    ) -> None:
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.side_effect = httpx.ReadTimeout("slow")
+            with pytest.raises(httpx.ReadTimeout):
+                await client.post("/comments", data={})
+
+        assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_post_is_retried_when_it_was_never_sent(
+        self, client: HttpClient
+    ) -> None:
+        with (
+            patch.object(
+                client._client, "request", new_callable=AsyncMock
+            ) as mock_request,
+            patch("notionary.http.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_request.side_effect = [
+                httpx.ConnectError("refused"),
+                _throttled_response("0"),
+                _mock_response(200, {"ok": True}),
+            ]
+            result = await client.post("/pages", data={})
+
+        assert result == {"ok": True}
+        assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_idempotent_post_is_retried_after_server_error(
+        self, client: HttpClient
+    ) -> None:
+        with (
+            patch.object(
+                client._client, "request", new_callable=AsyncMock
+            ) as mock_request,
+            patch("notionary.http.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_request.side_effect = [
+                httpx.ReadTimeout("slow"),
+                _mock_response(503),
+                _mock_response(200, {"ok": True}),
+            ]
+            result = await client.post(
+                "/data_sources/abc/query", data={}, idempotent=True
+            )
+
+        assert result == {"ok": True}
+        assert client.stats.retried == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_connection_errors(self, client: HttpClient) -> None:
+        with (
+            patch.object(
+                client._client, "request", new_callable=AsyncMock
+            ) as mock_request,
+            patch("notionary.http.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_request.side_effect = [
+                httpx.ConnectError("boom"),
+                _mock_response(200, {"ok": True}),
+            ]
+            result = await client.get("/pages/abc")
+
+        assert result == {"ok": True}
+        assert client.stats.retried == 1
+
+    @pytest.mark.asyncio
+    async def test_raises_after_max_retries(self) -> None:
+        client = HttpClient(
+            token="test-token", rate_limit=RateLimitConfig(max_retries=1)
+        )
+        client._rate_limiter = RateLimiter(RateLimitConfig(max_retries=1))
+        with (
+            patch.object(
+                client._client, "request", new_callable=AsyncMock
+            ) as mock_request,
+            patch("notionary.http.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_request.return_value = _mock_response(500)
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("/pages/abc")
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self, client: HttpClient) -> None:
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(404)
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("/pages/missing")
+
+        assert mock_request.call_count == 1
+        assert client.stats.retried == 0
+
+    def test_clients_with_same_token_share_rate_limiter(self) -> None:
+        first = HttpClient(token="shared-token")
+        second = HttpClient(token="shared-token")
+        other = HttpClient(token="other-token")
+
+        assert first._rate_limiter is second._rate_limiter
+        assert first._rate_limiter is not other._rate_limiter
+
+
+class TestSingleFlight:
+    @staticmethod
+    def _slow_request(payload: dict[str, Any]) -> AsyncMock:
+        release = asyncio.Event()
+
+        async def request(*args: Any, **kwargs: Any) -> MagicMock:
+            await release.wait()
+            return _mock_response(200, payload)
+
+        mock = AsyncMock(side_effect=request)
+        mock.release = release
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(
+        self, client: HttpClient
+    ) -> None:
+        mock_request = self._slow_request({"id": "user-1"})
+        with patch.object(client._client, "request", mock_request):
+            calls = [asyncio.create_task(client.get("users/1")) for _ in range(5)]
+            await asyncio.sleep(0)
+            mock_request.release.set()
+            results = await asyncio.gather(*calls)
+
+        assert mock_request.call_count == 1
+        assert results == [{"id": "user-1"}] * 5
+        assert client.stats.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_callers_receive_independent_payloads(
+        self, client: HttpClient
+    ) -> None:
+        mock_request = self._slow_request({"id": "user-1"})
+        with patch.object(client._client, "request", mock_request):
+            calls = [asyncio.create_task(client.get("users/1")) for _ in range(2)]
+            await asyncio.sleep(0)
+            mock_request.release.set()
+            first, second = await asyncio.gather(*calls)
+
+        first["id"] = "mutated"
+        assert second == {"id": "user-1"}
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_merged(self, client: HttpClient) -> None:
+        mock_request = self._slow_request({})
+        with patch.object(client._client, "request", mock_request):
+            calls = [
+                asyncio.create_task(client.get("users", params={"page_size": n}))
+                for n in (10, 20)
+            ]
+            await asyncio.sleep(0)
+            mock_request.release.set()
+            await asyncio.gather(*calls)
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_posts_are_never_merged(self, client: HttpClient) -> None:
+        mock_request = self._slow_request({})
+        with patch.object(client._client, "request", mock_request):
+            calls = [
+                asyncio.create_task(client.post("pages", data={})) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            mock_request.release.set()
+            await asyncio.gather(*calls)
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_gets_are_sent_again(self, client: HttpClient) -> None:
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {})
+            await client.get("users/1")
+            await client.get("users/1")
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_with_every_waiter(self, client: HttpClient) -> None:
+        release = asyncio.Event()
+
+        async def request(*args: Any, **kwargs: Any) -> MagicMock:
+            await release.wait()
+            return _mock_response(404)
+
+        with patch.object(
+            client._client, "request", AsyncMock(side_effect=request)
+        ) as mock_request:
+            calls = [asyncio.create_task(client.get("users/x")) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert mock_request.call_count == 1
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(
+        self, client: HttpClient
+    ) -> None:
+        mock_request = self._slow_request({"ok": True})
+        with patch.object(client._client, "request", mock_request):
+            first = asyncio.create_task(client.get("users/1"))
+            second = asyncio.create_task(client.get("users/1"))
+            await asyncio.sleep(0)
+            first.cancel()
+            mock_request.release.set()
+            result = await second
+
+        assert result == {"ok": True}
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_error_after_every_waiter_cancelled_is_retrieved(
+        self, client: HttpClient
+    ) -> None:
+        release = asyncio.Event()
+
+        async def request(*args: Any, **kwargs: Any) -> MagicMock:
+            await release.wait()
+            return _mock_response(404)
+
+        with patch.object(client._client, "request", AsyncMock(side_effect=request)):
+            caller = asyncio.create_task(client.get("users/1"))
+            await asyncio.sleep(0)
+            shared = next(iter(client._inflight_gets.values()))
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            release.set()
+            while client._inflight_gets:
+                await asyncio.sleep(0)
+
+        # asyncio logs "Task exception was never retrieved" for tasks that
+        # still carry this flag when they are garbage collected.
+        assert not shared._log_traceback
+
+    @pytest.mark.asyncio
+    async def test_can_be_disabled(self) -> None:
+        client = HttpClient(token="test-token", coalesce_gets=False)
+        client._rate_limiter = RateLimiter(RateLimitConfig())
+        mock_request = self._slow_request({})
+        with patch.object(client._client, "request", mock_request):
+            calls = [asyncio.create_task(client.get("users/1")) for _ in range(3)]
+            await asyncio.sleep(0)
+            mock_request.release.set()
+            await asyncio.gather(*calls)
+
+        assert mock_request.call_count == 3
+
+
+class TestResponseCaching:
+    @staticmethod
+    def _cached_client() -> HttpClient:
+        client = HttpClient(token="test-token", cache=ResponseCache())
+        client._rate_limiter = RateLimiter(RateLimitConfig())
+        return client
+
+    @pytest.mark.asyncio
+    async def test_repeated_schema_read_is_served_from_cache(self) -> None:
+        client = self._cached_client()
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {"id": "ds"})
+            first = await client.get("data_sources/ds")
+            second = await client.get("data_sources/ds")
+
+        assert first == second == {"id": "ds"}
+        assert mock_request.call_count == 1
+        assert client.stats.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_endpoints_outside_policy_are_not_cached(self) -> None:
+        client = self._cached_client()
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {})
+            await client.get("pages/abc")
+            await client.get("pages/abc")
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_query_params_are_part_of_the_key(self) -> None:
+        client = self._cached_client()
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {})
+            await client.get("users", params={"page_size": 10})
+            await client.get("users", params={"page_size": 20})
+            await client.get("users", params={"page_size": 10})
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_patch_invalidates_cached_resource(self) -> None:
+        client = self._cached_client()
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {})
+            await client.get("data_sources/ds")
+            await client.patch("data_sources/ds", data={"title": []})
+            await client.get("data_sources/ds")
+
+        assert [c.args[0] for c in mock_request.call_args_list] == [
+            "GET",
+            "PATCH",
+            "GET",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_patch_leaves_other_resources_cached(self) -> None:
+        client = self._cached_client()
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {})
+            await client.get("data_sources/other")
+            await client.patch("data_sources/ds", data={})
+            await client.get("data_sources/other")
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_are_not_cached(self) -> None:
+        client = self._cached_client()
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.side_effect = [
+                _mock_response(404),
+                _mock_response(200, {"id": "ds"}),
+            ]
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("data_sources/ds")
+            result = await client.get("data_sources/ds")
+
+        assert result == {"id": "ds"}
+
+    @pytest.mark.asyncio
+    async def test_versioned_get_is_refetched_only_when_version_changes(
+        self,
+    ) -> None:
+        client = self._cached_client()
+        endpoint = "pages/abc/markdown"
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.side_effect = [
+                _mock_response(200, {"markdown": "v1"}),
+                _mock_response(200, {"markdown": "v2"}),
+            ]
+            first = await client.get(endpoint, version="2025-01-01T00:00:00.000Z")
+            again = await client.get(endpoint, version="2025-01-01T00:00:00.000Z")
+            changed = await client.get(endpoint, version="2025-02-01T00:00:00.000Z")
+
+        assert first == again == {"markdown": "v1"}
+        assert changed == {"markdown": "v2"}
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_patch_invalidates_versioned_entries(self) -> None:
+        client = self._cached_client()
+        endpoint = "pages/abc/markdown"
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {})
+            await client.get(endpoint, version="v1")
+            await client.patch(endpoint, data={})
+            await client.get(endpoint, version="v1")
+
+        assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_in_flight_during_patch_is_not_cached(self) -> None:
+        client = self._cached_client()
+        release = asyncio.Event()
+        gets = 0
+
+        async def request(method: str, *args: Any, **kwargs: Any) -> MagicMock:
+            nonlocal gets
+            if method == "GET":
+                gets += 1
+                if gets == 1:
+                    await release.wait()
+                    return _mock_response(200, {"title": "before"})
+            return _mock_response(200, {"title": "after"})
+
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.side_effect = request
+            stale = asyncio.create_task(client.get("data_sources/ds"))
+            await asyncio.sleep(0)
+            await client.patch("data_sources/ds", data={})
+            fresh = asyncio.create_task(client.get("data_sources/ds"))
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await stale == {"title": "before"}
+            assert await fresh == {"title": "after"}
+            assert await client.get("data_sources/ds") == {"title": "after"}
+
+        assert client.stats.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_version_is_ignored_without_cache(self, client: HttpClient) -> None:
+        with patch.object(
+            client._client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = _mock_response(200, {})
+            await client.get("pages/abc/markdown", version="v1")
+            await client.get("pages/abc/markdown", version="v1")
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_are_scoped_to_the_token(self) -> None:
+        cache = ResponseCache()
+        first = HttpClient(token="token-a", cache=cache)
+        second = HttpClient(token="token-b", cache=cache)
+        for c in (first, second):
+            c._rate_limiter = RateLimiter(RateLimitConfig())
+
+        with (
+            patch.object(first._client, "request", new_callable=AsyncMock) as a,
+            patch.object(second._client, "request", new_callable=AsyncMock) as b,
+        ):
+            a.return_value = b.return_value = _mock_response(200, {})
+            await first.get("users/me")
+            await second.get("users/me")
+
+        assert a.call_count == b.call_count == 1
+
+
+class TestTransportConfig:
+    @pytest.mark.asyncio
+    async def test_custom_transport_receives_requests(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"id": "abc"})
+
+        client = HttpClient(
+            token="test-token",
+            transport=TransportConfig(transport=httpx.MockTransport(handler)),
+        )
+        result = await client.get("pages/abc")
+        await client.close()
+
+        assert result == {"id": "abc"}
+        assert seen[0].url == "https://api.notion.com/v1/pages/abc"
+        assert seen[0].headers["Authorization"] == "Bearer test-token"
+
+    def test_timeouts_fall_back_to_default(self) -> None:
+        timeout = TransportConfig(read_timeout=60).build_timeout(30)
+
+        assert timeout.read == 60
+        assert timeout.connect == 30
+        assert timeout.write == 30
+        assert timeout.pool == 30
+
+    def test_builds_pooled_transport_from_limits(self) -> None:
+        config = TransportConfig(max_connections=5, max_keepalive_connections=2)
+
+        transport = config.build_transport()
+
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+        pool = transport._pool
+        assert pool._max_connections == 5
+        assert pool._max_keepalive_connections == 2
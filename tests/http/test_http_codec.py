@@ -0,0 +1,58 @@
+import builtins
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from notionary.http.codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_codec,
+)
+
+_PAYLOAD = {"title": "Grüße", "count": 3, "tags": ["a", "b"], "done": None}
+
+
+def _block_imports(*names: str):
+    real_import = builtins.__import__
+
+    def fake_import(name: str, *args: Any, **kwargs: Any) -> Any:
+        if name in names:
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    return patch("builtins.__import__", side_effect=fake_import)
+
+
+class TestCodecs:
+    def test_stdlib_round_trip(self) -> None:
+        codec = StdlibJsonCodec()
+        assert codec.decode(codec.encode(_PAYLOAD)) == _PAYLOAD
+
+    def test_orjson_round_trip(self) -> None:
+        pytest.importorskip("orjson")
+        codec = OrjsonCodec()
+        assert codec.decode(codec.encode(_PAYLOAD)) == _PAYLOAD
+
+    def test_msgspec_round_trip(self) -> None:
+        pytest.importorskip("msgspec")
+        codec = MsgspecCodec()
+        assert codec.decode(codec.encode(_PAYLOAD)) == _PAYLOAD
+
+
+class TestDefaultCodec:
+    def test_falls_back_to_stdlib_without_optional_packages(self) -> None:
+        with _block_imports("orjson", "msgspec"):
+            codec = default_codec()
+        assert isinstance(codec, StdlibJsonCodec)
+
+    def test_prefers_orjson_when_installed(self) -> None:
+        pytest.importorskip("orjson")
+        assert isinstance(default_codec(), OrjsonCodec)
+
+    def test_uses_msgspec_when_orjson_is_missing(self) -> None:
+        pytest.importorskip("msgspec")
+        with _block_imports("orjson"):
+            codec = default_codec()
+        assert isinstance(codec, MsgspecCodec)
@@ -0,0 +1,202 @@
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from notionary.http.client import HttpClient
+from notionary.http.hooks import HttpHook, StatsCollector, endpoint_template
+from notionary.http.rate_limiter import RateLimiter
+from notionary.http.schemas import (
+    RateLimitConfig,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+)
+
+PAGE_ID = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
+
+
+def _response(status_code: int, payload: dict[str, Any] | None = None) -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = status_code
+    response.headers = {}
+    response.content = json.dumps(payload or {}).encode()
+    if status_code >= 400:
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            message="error", request=MagicMock(), response=response
+        )
+    return response
+
+
+def _client(*hooks: HttpHook) -> HttpClient:
+    client = HttpClient(
+        token="test-token",
+        rate_limit=RateLimitConfig(backoff_base=0.001),
+        hooks=hooks,
+    )
+    client._rate_limiter = RateLimiter(RateLimitConfig())
+    return client
+
+
+class _Recorder(HttpHook):
+    def __init__(self) -> None:
+        self.events: list[RequestEvent] = []
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.events.append(event)
+
+    def on_response(self, event: ResponseEvent) -> None:
+        self.events.append(event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self.events.append(event)
+
+
+class TestEndpointTemplate:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            (f"/pages/{PAGE_ID}/markdown", "pages/{id}/markdown"),
+            (f"blocks/{PAGE_ID.replace('-', '')}/children", "blocks/{id}/children"),
+            ("users/me", "users/me"),
+            ("search", "search"),
+        ],
+    )
+    def test_replaces_ids(self, path: str, expected: str) -> None:
+        assert endpoint_template(path) == expected
+
+
+class TestHooks:
+    @pytest.mark.asyncio
+    async def test_emits_request_and_response(self) -> None:
+        recorder = _Recorder()
+        client = _client(recorder)
+        with patch.object(client._client, "request", new_callable=AsyncMock) as req:
+            req.return_value = _response(200, {"ok": True})
+            await client.patch(f"pages/{PAGE_ID}", data={"a": 1})
+
+        request, response = recorder.events
+        assert isinstance(request, RequestEvent)
+        assert request.method == "PATCH"
+        assert request.endpoint == "pages/{id}"
+        assert request.request_bytes == len(b'{"a":1}')
+        assert isinstance(response, ResponseEvent)
+        assert response.status_code == 200
+        assert response.response_bytes == len(b'{"ok": true}')
+        assert response.duration >= 0
+
+    @pytest.mark.asyncio
+    async def test_emits_retry_with_reason_and_attempt(self) -> None:
+        recorder = _Recorder()
+        client = _client(recorder)
+        with patch.object(client._client, "request", new_callable=AsyncMock) as req:
+            req.side_effect = [_response(503), _response(200)]
+            await client.get("users")
+
+        kinds = [type(e).__name__ for e in recorder.events]
+        assert kinds == [
+            "RequestEvent",
+            "ResponseEvent",
+            "RetryEvent",
+            "RequestEvent",
+            "ResponseEvent",
+        ]
+        retry = recorder.events[2]
+        assert isinstance(retry, RetryEvent)
+        assert retry.reason == "503"
+        assert recorder.events[3].attempt == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_error_is_reported(self) -> None:
+        recorder = _Recorder()
+        client = _client(recorder)
+        with patch.object(client._client, "request", new_callable=AsyncMock) as req:
+            req.side_effect = [httpx.ConnectError("down"), _response(200)]
+            await client.get("users")
+
+        failed = recorder.events[1]
+        assert isinstance(failed, ResponseEvent)
+        assert failed.status_code is None
+        assert failed.error == "ConnectError"
+
+    @pytest.mark.asyncio
+    async def test_failing_hook_does_not_break_requests(self) -> None:
+        class _Broken(HttpHook):
+            def on_response(self, event: ResponseEvent) -> None:
+                raise RuntimeError("boom")
+
+        client = _client(_Broken())
+        with patch.object(client._client, "request", new_callable=AsyncMock) as req:
+            req.return_value = _response(200, {"ok": True})
+            assert await client.get("users") == {"ok": True}
+
+
+class TestStatsCollector:
+    @staticmethod
+    def _event(duration: float, status_code: int = 200) -> ResponseEvent:
+        return ResponseEvent(
+            method="GET",
+            url="https://api.notion.com/v1/users",
+            endpoint="users",
+            attempt=0,
+            status_code=status_code,
+            started_at=0.0,
+            duration=duration,
+            response_bytes=10,
+        )
+
+    def test_reports_percentiles_per_endpoint(self) -> None:
+        collector = StatsCollector()
+        for ms in range(1, 101):
+            collector.on_response(self._event(ms / 1000))
+
+        stats = collector.summary()["GET users"]
+
+        assert stats.count == 100
+        assert stats.response_bytes == 1000
+        assert stats.p50 == pytest.approx(0.050)
+        assert stats.p95 == pytest.approx(0.095)
+        assert stats.p99 == pytest.approx(0.099)
+
+    def test_counts_errors(self) -> None:
+        collector = StatsCollector()
+        collector.on_response(self._event(0.1, status_code=404))
+
+        assert collector.summary()["GET users"].errors == 1
+
+    def test_keeps_only_recent_samples(self) -> None:
+        collector = StatsCollector(max_samples=2)
+        for duration in (10.0, 0.1, 0.2):
+            collector.on_response(self._event(duration))
+
+        stats = collector.summary()["GET users"]
+        assert stats.count == 3
+        assert stats.p99 == pytest.approx(0.2)
+
+    @pytest.mark.asyncio
+    async def test_collects_from_client_by_endpoint_template(self) -> None:
+        collector = StatsCollector()
+        client = _client(collector)
+        other = "bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb"
+        with patch.object(client._client, "request", new_callable=AsyncMock) as req:
+            req.return_value = _response(200)
+            await client.get(f"pages/{PAGE_ID}/markdown")
+            await client.get(f"pages/{other}/markdown")
+
+        assert collector.summary()["GET pages/{id}/markdown"].count == 2
+
+    @pytest.mark.asyncio
+    async def test_scope_counts_requests_of_a_high_level_call(self) -> None:
+        collector = StatsCollector()
+        client = _client(collector)
+        with patch.object(client._client, "request", new_callable=AsyncMock) as req:
+            req.return_value = _response(200)
+            await client.get("users/me")
+            with collector.scope() as scope:
+                await asyncio.gather(client.get("users/a"), client.get("users/b"))
+
+        assert scope.requests == 2
+        assert collector.summary()["GET users/a"].count == 1
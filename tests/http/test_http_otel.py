@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode
+
+from notionary.http.otel import OpenTelemetryHook
+from notionary.http.schemas import ResponseEvent
+
+
+def _event(status_code: int = 200) -> ResponseEvent:
+    return ResponseEvent(
+        method="GET",
+        url="https://api.notion.com/v1/pages/abc",
+        endpoint="pages/{id}",
+        attempt=0,
+        status_code=status_code,
+        started_at=1_700_000_000.0,
+        duration=0.25,
+    )
+
+
+@pytest.fixture
+def spans() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def reader() -> InMemoryMetricReader:
+    return InMemoryMetricReader()
+
+
+@pytest.fixture
+def hook(
+    spans: InMemorySpanExporter, reader: InMemoryMetricReader
+) -> OpenTelemetryHook:
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+    return OpenTelemetryHook(
+        tracer_provider=tracer_provider,
+        meter_provider=MeterProvider(metric_readers=[reader]),
+    )
+
+
+class TestOpenTelemetryHook:
+    def test_records_client_span(
+        self, hook: OpenTelemetryHook, spans: InMemorySpanExporter
+    ) -> None:
+        hook.on_response(_event())
+
+        (span,) = spans.get_finished_spans()
+        assert span.name == "GET pages/{id}"
+        assert span.kind == SpanKind.CLIENT
+        assert span.attributes["url.template"] == "pages/{id}"
+        assert span.attributes["http.response.status_code"] == 200
+        assert (span.end_time - span.start_time) / 1e9 == pytest.approx(0.25)
+
+    def test_marks_error_responses(
+        self, hook: OpenTelemetryHook, spans: InMemorySpanExporter
+    ) -> None:
+        hook.on_response(_event(status_code=500))
+
+        (span,) = spans.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+
+    def test_records_duration_histogram(
+        self, hook: OpenTelemetryHook, reader: InMemoryMetricReader
+    ) -> None:
+        hook.on_response(_event())
+
+        metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0]
+        names = [m.name for m in metrics.metrics]
+        assert "http.client.request.duration" in names
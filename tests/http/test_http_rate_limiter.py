@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+import pytest
+
+from notionary.http.rate_limiter import RateLimiter
+from notionary.http.schemas import RateLimitConfig
+
+
+def _limiter_at(now: float, **config: float) -> RateLimiter:
+    with patch("notionary.http.rate_limiter.time.monotonic", return_value=now):
+        return RateLimiter(RateLimitConfig(**config))
+
+
+def _reserve_at(limiter: RateLimiter, now: float) -> float:
+    with patch("notionary.http.rate_limiter.time.monotonic", return_value=now):
+        return limiter._reserve()
+
+
+class TestRateLimiter:
+    def test_burst_is_served_without_waiting(self) -> None:
+        limiter = _limiter_at(0.0, requests_per_second=2, burst=3)
+
+        delays = [_reserve_at(limiter, 0.0) for _ in range(3)]
+
+        assert delays == [0.0, 0.0, 0.0]
+
+    def test_requests_beyond_burst_are_spaced_by_rate(self) -> None:
+        limiter = _limiter_at(0.0, requests_per_second=2, burst=1)
+
+        delays = [_reserve_at(limiter, 0.0) for _ in range(3)]
+
+        assert delays == pytest.approx([0.0, 0.5, 1.0])
+
+    def test_tokens_refill_over_time(self) -> None:
+        limiter = _limiter_at(0.0, requests_per_second=2, burst=1)
+        _reserve_at(limiter, 0.0)
+
+        assert _reserve_at(limiter, 0.5) == pytest.approx(0.0)
+
+    def test_pause_delays_every_caller(self) -> None:
+        limiter = _limiter_at(0.0, requests_per_second=10, burst=10)
+
+        with patch("notionary.http.rate_limiter.time.monotonic", return_value=0.0):
+            limiter.pause(3.0)
+
+        assert _reserve_at(limiter, 1.0) == pytest.approx(2.0)
+        assert _reserve_at(limiter, 4.0) == pytest.approx(0.0)
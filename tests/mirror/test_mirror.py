@@ -0,0 +1,256 @@
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from notionary import Notionary
+from notionary.data_source.namespace import DataSourceNamespace
+from notionary.mirror import Mirror
+from notionary.mirror.store import MirrorStore
+from notionary.page.namespace import PageNamespace
+from notionary.page.schemas import PageDto
+from notionary.user.models import Person
+from notionary.user.namespace import UsersNamespace
+
+PAGE_ID = UUID("11111111-1111-1111-1111-111111111111")
+OTHER_PAGE_ID = UUID("22222222-2222-2222-2222-222222222222")
+DS_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+USER_ID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+
+
+def _page(
+    page_id: UUID,
+    title: str,
+    last_edited_time: str = "2025-06-01T00:00:00.000Z",
+    in_trash: bool = False,
+) -> dict[str, Any]:
+    return {
+        "object": "page",
+        "id": str(page_id),
+        "url": f"https://notion.so/{page_id}",
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "created_by": {"id": str(USER_ID)},
+        "last_edited_time": last_edited_time,
+        "last_edited_by": {"id": str(USER_ID)},
+        "icon": None,
+        "cover": None,
+        "parent": {
+            "type": "data_source_id",
+            "data_source_id": str(DS_ID),
+            "database_id": str(DS_ID),
+        },
+        "in_trash": in_trash,
+        "properties": {
+            "Name": {
+                "id": "title",
+                "type": "title",
+                "title": [{"type": "text", "plain_text": title}],
+            }
+        },
+    }
+
+
+def _data_source(title: str) -> dict[str, Any]:
+    workspace = {"type": "workspace", "workspace": True}
+    return {
+        "object": "data_source",
+        "id": str(DS_ID),
+        "url": f"https://notion.so/{DS_ID}",
+        "title": [{"type": "text", "plain_text": title}],
+        "description": [],
+        "properties": {},
+        "database_parent": workspace,
+        "parent": workspace,
+        "icon": None,
+        "cover": None,
+        "in_trash": False,
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "created_by": {"id": str(USER_ID)},
+        "last_edited_time": "2025-06-01T00:00:00.000Z",
+        "last_edited_by": {"id": str(USER_ID)},
+    }
+
+
+def _make_http(
+    pages: list[dict[str, Any]], data_sources: list[dict[str, Any]] | None = None
+) -> AsyncMock:
+    http = AsyncMock()
+    http.results = {"page": pages, "data_source": data_sources or []}
+    http.consumed = 0
+
+    async def fake_stream(*args: Any, **kwargs: Any):
+        model = kwargs["item_model"]
+        for item in http.results[kwargs["filter"]["value"]]:
+            http.consumed += 1
+            yield model.model_validate(item)
+
+    http.paginate_stream = MagicMock(side_effect=fake_stream)
+    http.paginate = AsyncMock(
+        return_value=[
+            {
+                "object": "user",
+                "id": str(USER_ID),
+                "type": "person",
+                "name": "Alice",
+                "person": {"email": "alice@example.com"},
+            }
+        ]
+    )
+    http.get = AsyncMock(
+        side_effect=lambda path, response_model, **kwargs: (
+            response_model.model_validate(
+                {
+                    "object": "page_markdown",
+                    "id": path.split("/")[1],
+                    "markdown": f"# {path.split('/')[1]}",
+                    "truncated": False,
+                    "unknown_block_ids": [],
+                }
+            )
+        )
+    )
+    return http
+
+
+@pytest.fixture
+def mirror(tmp_path: Path) -> Mirror:
+    return Mirror(tmp_path / "mirror.db")
+
+
+class TestMirrorSync:
+    @pytest.mark.asyncio
+    async def test_stores_workspace_objects(self, mirror: Mirror) -> None:
+        http = _make_http([_page(PAGE_ID, "Roadmap")], [_data_source("Tasks")])
+
+        result = await mirror.sync(http)
+
+        assert (result.pages, result.data_sources, result.users) == (1, 1, 1)
+        assert result.markdown == 1
+        assert (await mirror.get_page(PAGE_ID)).id == PAGE_ID
+        assert (await mirror.get_data_source(DS_ID)).id == DS_ID
+        assert (await mirror.list_users())[0].id == USER_ID
+        assert await mirror.get_markdown(PAGE_ID) == f"# {PAGE_ID}"
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, tmp_path: Path) -> None:
+        await Mirror(tmp_path / "mirror.db").sync(
+            _make_http([_page(PAGE_ID, "Roadmap")])
+        )
+
+        reopened = Mirror(tmp_path / "mirror.db")
+
+        assert [dto.id for dto in await reopened.list_pages()] == [PAGE_ID]
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_stops_at_watermark(self, mirror: Mirror) -> None:
+        http = _make_http([_page(PAGE_ID, "Roadmap")])
+        await mirror.sync(http)
+        http.results["page"] = [
+            _page(OTHER_PAGE_ID, "New", "2025-06-02T00:00:00.000Z"),
+            _page(PAGE_ID, "Roadmap"),
+            _page(UUID(int=3), "Older", "2025-05-01T00:00:00.000Z"),
+        ]
+        http.consumed = 0
+        http.get.reset_mock()
+
+        result = await mirror.sync(http)
+
+        assert result.pages == 2
+        assert http.consumed == 3
+        assert await mirror.get_page(UUID(int=3)) is None
+        assert http.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_removes_trashed_pages(self, mirror: Mirror) -> None:
+        http = _make_http([_page(PAGE_ID, "Roadmap")])
+        await mirror.sync(http)
+        http.results["page"] = [
+            _page(PAGE_ID, "Roadmap", "2025-06-02T00:00:00.000Z", in_trash=True)
+        ]
+
+        await mirror.sync(http, markdown=False)
+
+        assert await mirror.get_page(PAGE_ID) is None
+        assert await mirror.get_markdown(PAGE_ID) is None
+
+    @pytest.mark.asyncio
+    async def test_list_pages_filters_by_title(self, mirror: Mirror) -> None:
+        await mirror.sync(
+            _make_http(
+                [
+                    _page(OTHER_PAGE_ID, "Team Roadmap", "2025-06-02T00:00:00.000Z"),
+                    _page(PAGE_ID, "Notes"),
+                ]
+            ),
+            markdown=False,
+        )
+
+        assert [dto.id for dto in await mirror.list_pages("roadmap")] == [OTHER_PAGE_ID]
+        assert len(await mirror.list_pages(limit=1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_stores_pages_spanning_several_write_batches(
+        self, mirror: Mirror
+    ) -> None:
+        pages = [_page(UUID(int=i), f"Page {i}") for i in range(1, 251)]
+
+        result = await mirror.sync(_make_http(pages), markdown=False)
+
+        assert result.pages == 250
+        assert len(await mirror.list_pages()) == 250
+
+    @pytest.mark.asyncio
+    async def test_store_is_queried_off_the_event_loop(self, mirror: Mirror) -> None:
+        threads: list[int] = []
+        search = MirrorStore.search
+
+        def recording_search(store: MirrorStore, *args: Any) -> list[bytes]:
+            threads.append(threading.get_ident())
+            return search(store, *args)
+
+        with patch.object(MirrorStore, "search", recording_search):
+            await mirror.list_pages()
+
+        assert threads
+        assert threading.get_ident() not in threads
+
+
+class TestReadFromMirror:
+    @pytest.mark.asyncio
+    async def test_namespaces_read_without_requests(self, mirror: Mirror) -> None:
+        await mirror.sync(
+            _make_http([_page(PAGE_ID, "Roadmap")], [_data_source("Tasks")])
+        )
+        http = AsyncMock()
+
+        pages = PageNamespace(http, mirror)
+        data_sources = DataSourceNamespace(http, mirror)
+        users = UsersNamespace(http, mirror)
+
+        assert (await pages.find("roadmap")).id == PAGE_ID
+        assert (await pages.from_id(PAGE_ID)).title == "Roadmap"
+        assert (await data_sources.find("Tasks")).id == DS_ID
+        assert isinstance((await users.list())[0], Person)
+        http.get.assert_not_called()
+        http.paginate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_from_id_falls_back_to_api(self, mirror: Mirror) -> None:
+        http = AsyncMock()
+        http.get = AsyncMock(
+            return_value=PageDto.model_validate(_page(OTHER_PAGE_ID, "Remote"))
+        )
+
+        page = await PageNamespace(http, mirror).from_id(OTHER_PAGE_ID)
+
+        assert page.title == "Remote"
+        http.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sync_mirror_requires_a_mirror(self) -> None:
+        async with Notionary(api_key="secret") as notion:
+            with pytest.raises(ValueError, match="No mirror configured"):
+                await notion.sync_mirror()
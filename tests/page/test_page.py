@@ -4,6 +4,7 @@ from uuid import UUID
 import pytest
 
 from notionary.page.page import Page
+from notionary.page.schemas import PageDto
 
 PAGE_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
 PARENT_PAGE_ID = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
@@ -162,6 +163,48 @@ class TestPageContent:
 
         page._content.clear.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_markdown_uses_known_last_edited_time(self) -> None:
+        page = _make_page()
+        page._content.get_markdown = AsyncMock(return_value="# Hi")
+
+        result = await page.get_markdown()
+
+        assert result == "# Hi"
+        page._content.get_markdown.assert_called_once_with("2025-06-01T00:00:00.000Z")
+        page._http.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_markdown_revalidate_refreshes_last_edited_time(self) -> None:
+        page = _make_page()
+        page._http.get = AsyncMock(
+            return_value=PageDto.model_validate(
+                {
+                    "object": "page",
+                    "id": str(PAGE_ID),
+                    "url": "https://notion.so/test",
+                    "created_time": "2025-01-01T00:00:00.000Z",
+                    "created_by": {"id": str(USER_ID)},
+                    "last_edited_time": "2025-07-01T00:00:00.000Z",
+                    "last_edited_by": {"id": str(USER_ID)},
+                    "icon": None,
+                    "cover": None,
+                    "parent": {"type": "workspace", "workspace": True},
+                    "in_trash": False,
+                    "properties": {},
+                }
+            )
+        )
+        page._content.get_markdown = AsyncMock(return_value="# Hi")
+
+        await page.get_markdown(revalidate=True)
+
+        page._http.get.assert_called_once_with(
+            f"pages/{PAGE_ID}", response_model=PageDto
+        )
+        assert page.last_edited_time == "2025-07-01T00:00:00.000Z"
+        page._content.get_markdown.assert_called_once_with("2025-07-01T00:00:00.000Z")
+
 
 class TestPageComments:
     @pytest.mark.asyncio
@@ -1,13 +1,27 @@
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 from uuid import UUID
 
 import pytest
 
+from notionary.page.content.schemas import PageMarkdownResponse
 from notionary.page.content.service import PageContent
 
 PAGE_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
 
 
+def _markdown_response() -> PageMarkdownResponse:
+    return PageMarkdownResponse.model_validate(
+        {
+            "object": "page",
+            "id": str(PAGE_ID),
+            "markdown": "# Hello",
+            "truncated": False,
+            "unknown_block_ids": [],
+        }
+    )
+
+
 def _make_service() -> tuple[PageContent, AsyncMock]:
     http = AsyncMock()
     service = PageContent(page_id=PAGE_ID, http=http)
@@ -18,33 +32,60 @@ class TestPageContentGetMarkdown:
     @pytest.mark.asyncio
     async def test_get_calls_correct_endpoint(self) -> None:
         service, http = _make_service()
-        http.get.return_value = {
-            "object": "page",
-            "id": str(PAGE_ID),
-            "markdown": "# Hello",
-            "truncated": False,
-            "unknown_block_ids": [],
-        }
+        http.get.return_value = PageMarkdownResponse.model_validate(
+            {
+                "object": "page",
+                "id": str(PAGE_ID),
+                "markdown": "# Hello",
+                "truncated": False,
+                "unknown_block_ids": [],
+            }
+        )
 
         await service.get_markdown()
 
-        http.get.assert_called_once_with(f"pages/{PAGE_ID}/markdown")
+        http.get.assert_called_once_with(
+            f"pages/{PAGE_ID}/markdown",
+            version=None,
+            response_model=PageMarkdownResponse,
+        )
 
     @pytest.mark.asyncio
     async def test_get_returns_markdown_string(self) -> None:
         service, http = _make_service()
-        http.get.return_value = {
-            "object": "page",
-            "id": str(PAGE_ID),
-            "markdown": "# Hello World",
-            "truncated": False,
-            "unknown_block_ids": [],
-        }
+        http.get.return_value = PageMarkdownResponse.model_validate(
+            {
+                "object": "page",
+                "id": str(PAGE_ID),
+                "markdown": "# Hello World",
+                "truncated": False,
+                "unknown_block_ids": [],
+            }
+        )
 
         result = await service.get_markdown()
 
         assert result == "# Hello World"
 
+    @pytest.mark.asyncio
+    async def test_settled_last_edited_time_is_used_as_cache_version(self) -> None:
+        service, http = _make_service()
+        http.get.return_value = _markdown_response()
+
+        await service.get_markdown(last_edited_time="2025-06-01T00:00:00.000Z")
+
+        assert http.get.call_args.kwargs["version"] == "2025-06-01T00:00:00.000Z"
+
+    @pytest.mark.asyncio
+    async def test_recent_last_edited_time_is_not_trusted(self) -> None:
+        service, http = _make_service()
+        http.get.return_value = _markdown_response()
+        just_now = datetime.now(UTC).isoformat()
+
+        await service.get_markdown(last_edited_time=just_now)
+
+        assert http.get.call_args.kwargs["version"] is None
+
 
 class TestPageContentAppend:
     @pytest.mark.asyncio
@@ -122,12 +122,12 @@ class TestPageNamespaceFromId:
     async def test_fetches_and_returns_page(self) -> None:
         dto = _page_dto(PAGE_ID_1, "Fetched Page")
         http = AsyncMock()
-        http.get = AsyncMock(return_value=dto.model_dump(mode="json"))
+        http.get = AsyncMock(return_value=dto)
         ns = PageNamespace(http)
 
         result = await ns.from_id(PAGE_ID_1)
 
-        http.get.assert_called_once_with(f"pages/{PAGE_ID_1}")
+        http.get.assert_called_once_with(f"pages/{PAGE_ID_1}", response_model=PageDto)
         assert result.id == PAGE_ID_1
         assert result.title == "Fetched Page"
 
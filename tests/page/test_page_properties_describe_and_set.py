@@ -22,6 +22,7 @@ from notionary.page.properties.schemas import (
     SelectOption,
     StatusOption,
 )
+from notionary.page.schemas import PageDto
 from notionary.rich_text.schemas import RichText
 
 PAGE_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
@@ -62,37 +63,39 @@ def _stub_set_property(service: PageProperties) -> AsyncMock:
     return mock
 
 
-def _page_dto_payload(page_id: str, title: str) -> dict:
-    return {
-        "object": "page",
-        "id": page_id,
-        "created_time": "2025-01-01T00:00:00.000Z",
-        "created_by": {"object": "user", "id": str(USER_ID)},
-        "last_edited_time": "2025-01-01T00:00:00.000Z",
-        "last_edited_by": {"object": "user", "id": str(USER_ID)},
-        "cover": None,
-        "icon": None,
-        "parent": {
-            "type": "data_source_id",
-            "data_source_id": "22222222-2222-2222-2222-222222222222",
-            "database_id": "33333333-3333-3333-3333-333333333333",
-        },
-        "in_trash": False,
-        "url": f"https://notion.so/{page_id}",
-        "properties": {
-            "Name": {
-                "id": "title",
-                "type": "title",
-                "title": [
-                    {
-                        "type": "text",
-                        "plain_text": title,
-                        "text": {"content": title},
-                    }
-                ],
-            }
-        },
-    }
+def _page_dto(page_id: str, title: str) -> PageDto:
+    return PageDto.model_validate(
+        {
+            "object": "page",
+            "id": page_id,
+            "created_time": "2025-01-01T00:00:00.000Z",
+            "created_by": {"object": "user", "id": str(USER_ID)},
+            "last_edited_time": "2025-01-01T00:00:00.000Z",
+            "last_edited_by": {"object": "user", "id": str(USER_ID)},
+            "cover": None,
+            "icon": None,
+            "parent": {
+                "type": "data_source_id",
+                "data_source_id": "22222222-2222-2222-2222-222222222222",
+                "database_id": "33333333-3333-3333-3333-333333333333",
+            },
+            "in_trash": False,
+            "url": f"https://notion.so/{page_id}",
+            "properties": {
+                "Name": {
+                    "id": "title",
+                    "type": "title",
+                    "title": [
+                        {
+                            "type": "text",
+                            "plain_text": title,
+                            "text": {"content": title},
+                        }
+                    ],
+                }
+            },
+        }
+    )
 
 
 # ============================================================================
@@ -272,11 +275,11 @@ class TestDescribe:
         )
         service._http.paginate = AsyncMock(
             return_value=[
-                _page_dto_payload(
+                _page_dto(
                     page_id="11111111-1111-1111-1111-111111111111",
                     title="Task 1",
                 ),
-                _page_dto_payload(
+                _page_dto(
                     page_id="33333333-3333-3333-3333-333333333333",
                     title="Task 2",
                 ),
@@ -639,11 +642,11 @@ class TestSetValidationErrors:
         )
         service._http.paginate = AsyncMock(
             return_value=[
-                _page_dto_payload(
+                _page_dto(
                     page_id="11111111-1111-1111-1111-111111111111",
                     title="Task 1",
                 ),
-                _page_dto_payload(
+                _page_dto(
                     page_id="33333333-3333-3333-3333-333333333333",
                     title="Task 2",
                 ),
@@ -660,7 +663,7 @@ class TestSetValidationErrors:
         ]
 
     @pytest.mark.asyncio
-    async def test_relation_title_resolves_from_page_dto_payload(self) -> None:
+    async def test_relation_title_resolves_from_page_dto(self) -> None:
         props = {"Aufgaben": PageRelationProperty(id="rel", relation=[])}
         service = _make_service(props, data_source_id=DATA_SOURCE_ID)
         mock = _stub_set_property(service)
@@ -679,7 +682,7 @@ class TestSetValidationErrors:
         )
         service._http.paginate = AsyncMock(
             return_value=[
-                _page_dto_payload(
+                _page_dto(
                     page_id="11111111-1111-1111-1111-111111111111",
                     title="Task 1",
                 )
@@ -713,11 +716,11 @@ class TestSetValidationErrors:
         )
         service._http.paginate = AsyncMock(
             return_value=[
-                _page_dto_payload(
+                _page_dto(
                     page_id="11111111-1111-1111-1111-111111111111",
                     title="Task 1",
                 ),
-                _page_dto_payload(
+                _page_dto(
                     page_id="33333333-3333-3333-3333-333333333333",
                     title="Task 2",
                 ),
@@ -729,3 +732,49 @@ class TestSetValidationErrors:
             match=r"Valid options: \['Task 1', 'Task 2'\]",
         ):
             await service.set("Aufgaben", ["Task 1", "Task X"])
+
+    @pytest.mark.asyncio
+    async def test_relation_title_is_case_insensitive_and_detects_duplicates(
+        self,
+    ) -> None:
+        props = {"Aufgaben": PageRelationProperty(id="rel", relation=[])}
+        service = _make_service(props, data_source_id=DATA_SOURCE_ID)
+        mock = _stub_set_property(service)
+
+        service._http.get = AsyncMock(
+            return_value={
+                "properties": {
+                    "Aufgaben": {
+                        "type": "relation",
+                        "relation": {
+                            "data_source_id": "22222222-2222-2222-2222-222222222222"
+                        },
+                    }
+                }
+            }
+        )
+        service._http.paginate = AsyncMock(
+            return_value=[
+                _page_dto(
+                    page_id="11111111-1111-1111-1111-111111111111",
+                    title="Task 1",
+                ),
+                _page_dto(
+                    page_id="33333333-3333-3333-3333-333333333333",
+                    title="Duplicate",
+                ),
+                _page_dto(
+                    page_id="44444444-4444-4444-4444-444444444444",
+                    title="duplicate",
+                ),
+            ]
+        )
+
+        await service.set("Aufgaben", "TASK 1")
+
+        sent = mock.call_args.args[1]
+        assert [item.id for item in sent.relation] == [
+            "11111111-1111-1111-1111-111111111111"
+        ]
+        with pytest.raises(ValueError, match="is ambiguous"):
+            await service.set("Aufgaben", "Duplicate")
@@ -0,0 +1,138 @@
+from pydantic import TypeAdapter
+
+from notionary.page.properties.schemas import (
+    AnyPageProperty,
+    LazyPageProperties,
+    PageCheckboxProperty,
+    PageRollupProperty,
+    PageTitleProperty,
+    PageUnknownProperty,
+)
+from notionary.page.schemas import PageDto
+from notionary.rich_text.schemas import RichText
+
+_adapter: TypeAdapter[AnyPageProperty] = TypeAdapter(AnyPageProperty)
+
+
+class TestAnyPageProperty:
+    def test_dispatches_on_type(self) -> None:
+        prop = _adapter.validate_python(
+            {"id": "done", "type": "checkbox", "checkbox": True}
+        )
+
+        assert isinstance(prop, PageCheckboxProperty)
+        assert prop.checkbox is True
+
+    def test_unknown_type_falls_back_to_unknown_property(self) -> None:
+        prop = _adapter.validate_json(
+            b'{"id": "x", "type": "ai_summary", "ai_summary": {"text": "hi"}}'
+        )
+
+        assert isinstance(prop, PageUnknownProperty)
+        assert prop.type == "ai_summary"
+        assert prop.model_extra == {"ai_summary": {"text": "hi"}}
+
+    def test_malformed_known_type_falls_back_to_unknown_property(self) -> None:
+        prop = _adapter.validate_python(
+            {
+                "id": "v",
+                "type": "verification",
+                "verification": {"state": "pending_review", "verified_by": None},
+            }
+        )
+
+        assert isinstance(prop, PageUnknownProperty)
+        assert prop.type == "verification"
+
+    def test_rollup_without_function_falls_back_to_unknown_property(self) -> None:
+        prop = _adapter.validate_python(
+            {"id": "r", "type": "rollup", "rollup": {"type": "number", "number": 3}}
+        )
+
+        assert not isinstance(prop, PageRollupProperty)
+        assert isinstance(prop, PageUnknownProperty)
+        assert prop.model_extra == {"rollup": {"type": "number", "number": 3}}
+
+    def test_accepts_model_instances(self) -> None:
+        title = PageTitleProperty(title=[RichText.from_plain_text("Hello")])
+
+        assert _adapter.validate_python(title) == title
+
+
+_RAW_PROPERTIES = {
+    "Name": {
+        "id": "title",
+        "type": "title",
+        "title": [{"type": "text", "plain_text": "Hello"}],
+    },
+    "Done": {"id": "done", "type": "checkbox", "checkbox": True},
+    "Broken": {"id": "n", "type": "number", "number": "not a number"},
+}
+
+
+def _page_json(properties: dict) -> bytes:
+    return PageDto.model_validate(
+        {
+            "object": "page",
+            "id": "cccccccc-cccc-cccc-cccc-cccccccccccc",
+            "url": "https://notion.so/page",
+            "created_time": "2025-01-01T00:00:00.000Z",
+            "created_by": {"id": "bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb"},
+            "last_edited_time": "2025-06-01T00:00:00.000Z",
+            "last_edited_by": {"id": "bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb"},
+            "icon": None,
+            "cover": None,
+            "parent": {"type": "workspace", "workspace": True},
+            "in_trash": False,
+            "properties": properties,
+        }
+    ).model_dump_json(by_alias=True)
+
+
+class TestLazyPageProperties:
+    def test_validates_properties_only_on_access(self) -> None:
+        properties = LazyPageProperties(_RAW_PROPERTIES)
+
+        assert isinstance(properties["Done"], PageCheckboxProperty)
+        assert "Broken" not in properties._decoded
+
+    def test_malformed_property_does_not_break_items(self) -> None:
+        properties = LazyPageProperties(_RAW_PROPERTIES)
+
+        decoded = dict(properties.items())
+
+        assert isinstance(decoded["Name"], PageTitleProperty)
+        assert isinstance(decoded["Broken"], PageUnknownProperty)
+        assert decoded["Broken"].type == "number"
+
+    def test_memoizes_decoded_properties(self) -> None:
+        properties = LazyPageProperties(_RAW_PROPERTIES)
+
+        assert properties["Name"] is properties["Name"]
+
+    def test_type_of_does_not_validate(self) -> None:
+        properties = LazyPageProperties(_RAW_PROPERTIES)
+
+        assert properties.type_of("Broken") == "number"
+
+    def test_items_keep_api_order(self) -> None:
+        properties = LazyPageProperties(
+            {name: _RAW_PROPERTIES[name] for name in ("Name", "Done")}
+        )
+        properties["Done"]
+
+        assert [name for name, _ in properties.items()] == ["Name", "Done"]
+        assert isinstance(next(iter(properties.values())), PageTitleProperty)
+
+    def test_compares_equal_to_decoded_dict(self) -> None:
+        title = PageTitleProperty(title=[RichText.from_plain_text("Hello")])
+
+        assert LazyPageProperties({"Name": title}) == {"Name": title}
+
+    def test_page_dto_round_trips_through_json(self) -> None:
+        raw = {name: _RAW_PROPERTIES[name] for name in ("Name", "Done")}
+
+        dto = PageDto.model_validate_json(_page_json(raw))
+
+        assert isinstance(dto.properties, LazyPageProperties)
+        assert PageDto.model_validate_json(dto.model_dump_json()) == dto
@@ -3,6 +3,7 @@ from uuid import UUID
 
 import pytest
 
+from notionary.shared.object.dtos import NotionObjectResponseDto
 from notionary.shared.object.object import NotionObject
 
 PAGE_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
@@ -16,20 +17,22 @@ def _patch_response(
     icon: dict | None = None,
     cover: dict | None = None,
     in_trash: bool = False,
-) -> dict:
-    return {
-        "object": "page",
-        "id": str(PAGE_ID),
-        "created_time": "2025-01-01T00:00:00.000Z",
-        "created_by": _PARTIAL_USER,
-        "last_edited_time": "2025-06-01T00:00:00.000Z",
-        "last_edited_by": _PARTIAL_USER,
-        "cover": cover,
-        "icon": icon,
-        "parent": _WORKSPACE_PARENT,
-        "in_trash": in_trash,
-        "url": "https://notion.so/test-page",
-    }
+) -> NotionObjectResponseDto:
+    return NotionObjectResponseDto.model_validate(
+        {
+            "object": "page",
+            "id": str(PAGE_ID),
+            "created_time": "2025-01-01T00:00:00.000Z",
+            "created_by": _PARTIAL_USER,
+            "last_edited_time": "2025-06-01T00:00:00.000Z",
+            "last_edited_by": _PARTIAL_USER,
+            "cover": cover,
+            "icon": icon,
+            "parent": _WORKSPACE_PARENT,
+            "in_trash": in_trash,
+            "url": "https://notion.so/test-page",
+        }
+    )
 
 
 def _make_object(in_trash: bool = False) -> tuple[NotionObject, AsyncMock]:
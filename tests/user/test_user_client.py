@@ -4,7 +4,7 @@ from uuid import UUID
 import pytest
 
 from notionary.user.client import UserClient
-from notionary.user.schemas import BotDto, UserType
+from notionary.user.schemas import BotDto, BotResponseDto, UserType
 
 PERSON_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
 BOT_ID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
@@ -106,17 +106,17 @@ class TestUserClientMe:
     @pytest.mark.asyncio
     async def test_me_calls_correct_endpoint(self) -> None:
         http = AsyncMock()
-        http.get.return_value = _bot_payload()
+        http.get.return_value = BotResponseDto.model_validate(_bot_payload())
         client = UserClient(http)
 
         await client.me()
 
-        http.get.assert_called_once_with("users/me")
+        http.get.assert_called_once_with("users/me", response_model=BotResponseDto)
 
     @pytest.mark.asyncio
     async def test_me_returns_bot_dto(self) -> None:
         http = AsyncMock()
-        http.get.return_value = _bot_payload()
+        http.get.return_value = BotResponseDto.model_validate(_bot_payload())
         client = UserClient(http)
 
         result = await client.me()